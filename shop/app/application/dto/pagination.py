@@ -0,0 +1,40 @@
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class PageCursor:
+    """Keyset position: sort-key values of a boundary row and the paging direction.
+
+    ``backward=False`` requests rows that follow the boundary row in listing order
+    (next page), ``backward=True`` requests rows that precede it (previous page).
+    """
+
+    values: tuple[Any, ...]
+    backward: bool = False
+
+
+def next_page_cursor[T](
+    items: Sequence[T], sort_key: Callable[[T], tuple[Any, ...]]
+) -> PageCursor | None:
+    """Cursor pointing after the last item of a page, or None for an empty page."""
+    if not items:
+        return None
+    return PageCursor(values=sort_key(items[-1]))
+
+
+def prev_page_cursor[T](
+    items: Sequence[T], sort_key: Callable[[T], tuple[Any, ...]]
+) -> PageCursor | None:
+    """Cursor pointing before the first item of a page, or None for an empty page."""
+    if not items:
+        return None
+    return PageCursor(values=sort_key(items[0]), backward=True)
+
+
+__all__ = [
+    "PageCursor",
+    "next_page_cursor",
+    "prev_page_cursor",
+]
@@ -1,4 +1,14 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class FailedAttemptResult:
+    """Outcome of a failed login: attempts in the window and whether the user is now blocked."""
+
+    attempts: int
+    blocked: bool
+    retry_after_seconds: int = 0
 
 
 class AuthAttemptStorage(ABC):
@@ -8,6 +18,21 @@ class AuthAttemptStorage(ABC):
     @abstractmethod
     async def increment_failed_attempts(self, username: str, window_seconds: int) -> int: ...
 
+    @abstractmethod
+    async def register_failed_attempt(
+        self,
+        username: str,
+        *,
+        max_attempts: int,
+        window_seconds: int,
+        block_seconds: int,
+    ) -> FailedAttemptResult:
+        """Atomically check the blocklist, count the attempt, block at ``max_attempts``."""
+
+    @abstractmethod
+    async def get_attempt_state(self, username: str) -> FailedAttemptResult:
+        """Block status and failed attempts so far, read in one round-trip."""
+
     @abstractmethod
     async def reset_failed_attempts(self, username: str) -> None: ...
 
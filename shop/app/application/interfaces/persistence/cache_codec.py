@@ -0,0 +1,17 @@
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class CacheCodec(ABC):
+    """
+    Serializes cache payloads to bytes.
+
+    Payloads are built from dict/list/str/int/float/bool/None plus Decimal,
+    UUID, datetime and date; codecs must round-trip these types exactly.
+    """
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any: ...
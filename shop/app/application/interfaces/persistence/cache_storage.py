@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 
 
 class CacheStorage(ABC):
@@ -8,7 +9,12 @@ class CacheStorage(ABC):
     ) -> None: ...
 
     @abstractmethod
-    async def get_value(self, key: str) -> str | bytes | None: ...
+    async def get_value(self, key: str) -> str | bytes | None:
+        """Get-or-miss in one round trip: the value, or None if the key is absent."""
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[str | bytes | None]:
+        """Values for ``keys`` in the same order, None for misses, in one round trip."""
 
     @abstractmethod
     async def delete_value(self, key: str) -> None: ...
@@ -18,3 +24,16 @@ class CacheStorage(ABC):
 
     @abstractmethod
     async def exists_value(self, key: str) -> bool: ...
+
+    @abstractmethod
+    async def get_generation(self, namespace: str) -> int:
+        """Current generation of ``namespace``; 0 if it was never bumped."""
+
+    @abstractmethod
+    async def bump_generation(self, namespace: str) -> int:
+        """
+        Atomically advance the generation of ``namespace``.
+
+        Keys built with the previous generation become unreachable and expire
+        by TTL, so invalidating a whole namespace is O(1).
+        """
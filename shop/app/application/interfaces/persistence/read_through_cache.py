@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ReadThroughCache(ABC):
+    @abstractmethod
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        *,
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        """
+        Return the cached value for ``key`` or load, cache and return it.
+
+        ``encode`` turns the value into plain data the cache codec can
+        serialize (see ``CacheCodec``); ``decode`` rebuilds it.
+
+        Implementations may return a stale value while a refresh runs and must
+        fall back to ``loader`` when the cache itself is unavailable. A
+        background refresh calls ``loader`` after this call has returned, so it
+        must open its own resources (e.g. a unit of work from a factory).
+        """
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 
 class SessionStorage(ABC):
@@ -10,3 +11,9 @@ class SessionStorage(ABC):
 
     @abstractmethod
     async def delete(self, user_id: int) -> None: ...
+
+
+class SessionActivityStore(ABC):
+    @abstractmethod
+    async def touch_many(self, last_seen: Mapping[str, float]) -> None:
+        """Persist last-seen unix timestamps for a batch of session ids."""
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+
+from shop.app.application.interfaces.repositories.brand_repository import BrandRepository
+from shop.app.application.interfaces.repositories.category_repository import CategoryRepository
+from shop.app.application.interfaces.repositories.product_repository import ProductRepository
+from shop.app.application.interfaces.repositories.product_variant_repository import (
+    ProductVariantRepository,
+)
+from shop.app.application.interfaces.repositories.review_repository import ReviewRepository
+
+
+class QuerySession(ABC):
+    """
+    Read scope without an explicit transaction.
+
+    Each repository call runs as its own autocommit statement, so there is no
+    BEGIN/ROLLBACK round trip. Use it for single-statement reads only: several
+    reads in one session do not share a snapshot.
+    """
+
+    categories: CategoryRepository
+    brands: BrandRepository
+    products: ProductRepository
+    product_variants: ProductVariantRepository
+    reviews: ReviewRepository
+
+    @abstractmethod
+    async def __aenter__(self) -> "QuerySession":
+        """Acquire a connection and wire repositories."""
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the connection."""
@@ -23,6 +23,7 @@ from shop.app.application.interfaces.repositories.role_repository import RoleRep
 from shop.app.application.interfaces.repositories.stock_movement_repository import (
     StockMovementRepository,
 )
+from shop.app.application.interfaces.query_session import QuerySession
 from shop.app.application.interfaces.unit_of_work import UnitOfWork
 from shop.app.application.interfaces.repositories.user_repository import UserRepository
 from shop.app.application.interfaces.repositories.warehouse_repository import (
@@ -40,6 +41,7 @@ __all__ = [
     "ProductRepository",
     "ProductVariantDetailsRepository",
     "ProductVariantRepository",
+    "QuerySession",
     "ReviewRepository",
     "RoleRepository",
     "StockMovementRepository",
@@ -19,6 +19,14 @@ class CategoryRepository(ABC):
     async def list_all(self) -> list[Category]:
         """Return all categories."""
 
+    @abstractmethod
+    async def list_paginated(self, limit: int, offset: int) -> list[Category]:
+        """Return one page of categories ordered by id."""
+
+    @abstractmethod
+    async def count(self) -> int:
+        """Return the number of categories."""
+
     @abstractmethod
     async def add(self, category: Category) -> None:
         """Insert a new category."""
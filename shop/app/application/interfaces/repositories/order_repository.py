@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from uuid import UUID
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.domain.entities.order import Order
 
 
@@ -16,12 +18,20 @@ class OrderRepository(ABC):
         """Resolve an order by business order number."""
 
     @abstractmethod
-    async def list_for_user(self, user_id: UUID, limit: int, offset: int) -> list[Order]:
-        """Page orders placed by a user."""
+    async def get_many(self, order_ids: Sequence[UUID]) -> list[Order]:
+        """Load several order aggregates in one batch (newest first; unknown ids skipped)."""
 
     @abstractmethod
-    async def list_paginated(self, limit: int, offset: int) -> list[Order]:
-        """Page all orders (e.g. admin)."""
+    async def list_for_user(
+        self, user_id: UUID, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Order]:
+        """Page orders placed by a user (keyset on ``created_at, id`` when ``cursor`` is set)."""
+
+    @abstractmethod
+    async def list_paginated(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Order]:
+        """Page all orders, e.g. admin (keyset on ``created_at, id`` when ``cursor`` is set)."""
 
     @abstractmethod
     async def add(self, order: Order) -> None:
@@ -2,6 +2,7 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from shop.app.domain.entities.product_image import ProductImage
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
 
 
 class ProductImageRepository(ABC):
@@ -23,6 +24,12 @@ class ProductImageRepository(ABC):
     async def update(self, image: ProductImage) -> None:
         """Persist changes to an image row."""
 
+    @abstractmethod
+    async def set_derivatives(
+        self, storage_key: str, derivatives: tuple[ImageDerivative, ...]
+    ) -> int:
+        """Record resized copies for every image stored under ``storage_key``; return row count."""
+
     @abstractmethod
     async def delete(self, image_id: UUID) -> None:
         """Remove one image by id."""
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.domain.entities.product import Product
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
 
 
 class ProductRepository(ABC):
@@ -16,8 +18,18 @@ class ProductRepository(ABC):
         """List products in a category."""
 
     @abstractmethod
-    async def list_published(self, limit: int, offset: int) -> list[Product]:
-        """Page through published products for storefront listings."""
+    async def list_published(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]:
+        """Page through published products for storefront listings.
+
+        When ``cursor`` is given the page is resolved by keyset on ``id`` and
+        ``offset`` is ignored.
+        """
+
+    @abstractmethod
+    async def count_published(self) -> int:
+        """Number of published products (the ``total`` of storefront listings)."""
 
     @abstractmethod
     async def add(self, product: Product) -> None:
@@ -27,6 +39,12 @@ class ProductRepository(ABC):
     async def update(self, product: Product) -> None:
         """Persist changes to an existing product."""
 
+    @abstractmethod
+    async def set_thumbnail_derivatives(
+        self, thumbnail_key: str, derivatives: tuple[ImageDerivative, ...]
+    ) -> int:
+        """Record resized copies on products with thumbnail ``thumbnail_key``; return row count."""
+
     @abstractmethod
     async def delete(self, product_id: UUID) -> None:
         """Remove a product by id."""
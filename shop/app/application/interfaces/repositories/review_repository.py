@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.domain.entities.review import Review
 
 
@@ -16,12 +17,16 @@ class ReviewRepository(ABC):
         """Return a user's review for a product, if it exists."""
 
     @abstractmethod
-    async def list_by_product(self, product_id: UUID, limit: int, offset: int) -> list[Review]:
-        """Page reviews for one product."""
+    async def list_by_product(
+        self, product_id: UUID, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Review]:
+        """Page reviews for one product (keyset on ``id`` when ``cursor`` is set)."""
 
     @abstractmethod
-    async def list_paginated(self, limit: int, offset: int) -> list[Review]:
-        """Page all reviews (moderation / admin)."""
+    async def list_paginated(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Review]:
+        """Page all reviews, moderation / admin (keyset on ``id`` when ``cursor`` is set)."""
 
     @abstractmethod
     async def add(self, review: Review) -> None:
@@ -19,6 +19,10 @@ class RoleRepository(ABC):
     async def list_all(self) -> list[Role]:
         """Return all roles."""
 
+    @abstractmethod
+    async def get_policy_version(self) -> int:
+        """Version of role/permission data, bumped on every change to it."""
+
     @abstractmethod
     async def add(self, role: Role) -> None:
         """Insert a role and its permission links."""
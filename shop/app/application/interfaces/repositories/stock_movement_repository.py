@@ -2,11 +2,16 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 from uuid import UUID
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.domain import StockMovement
 
 
 class StockMovementRepository(ABC):
-    """Append-only persistence port for inventory movements."""
+    """Append-only persistence port for inventory movements.
+
+    Listings are ordered by ``created_at DESC, id DESC``; passing ``cursor``
+    switches them from OFFSET to keyset paging on that pair.
+    """
 
     @abstractmethod
     async def add(self, movement: StockMovement) -> None:
@@ -14,19 +19,31 @@ class StockMovementRepository(ABC):
 
     @abstractmethod
     async def list_by_warehouse(
-        self, warehouse_id: UUID, limit: int, offset: int
+        self,
+        warehouse_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
         """Page movements for one warehouse."""
 
     @abstractmethod
     async def list_by_product(
-        self, product_id: UUID, limit: int, offset: int
+        self,
+        product_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
         """Page movements affecting a product."""
 
     @abstractmethod
     async def list_by_variant(
-        self, variant_id: UUID, limit: int, offset: int
+        self,
+        variant_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
         """Page movements tied to a variant."""
 
@@ -38,5 +55,6 @@ class StockMovementRepository(ABC):
         *,
         limit: int,
         offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
         """Page movements within a time window."""
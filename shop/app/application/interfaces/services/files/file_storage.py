@@ -11,6 +11,16 @@ class FileStorage(ABC):
         """Upload file and return storage key"""
         ...
 
+    @abstractmethod
+    async def upload_bytes(self, storage_key: str, data: bytes, content_type: str) -> str:
+        """Upload in-memory content and return storage key"""
+        ...
+
+    @abstractmethod
+    async def download(self, key: str) -> bytes:
+        """Read whole file by storage key"""
+        ...
+
     @abstractmethod
     async def delete(self, key: str) -> None:
         """Delete file by storage key"""
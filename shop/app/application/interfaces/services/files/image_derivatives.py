@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+
+
+class ImageDerivativeScheduler(ABC):
+    """Abstraction for background generation of resized image copies"""
+
+    @abstractmethod
+    def schedule(self, storage_key: str) -> bool:
+        """Queue derivative generation for an uploaded image; False if it was dropped"""
+        ...
+
+    @abstractmethod
+    def discard(self, storage_key: str) -> bool:
+        """Queue removal of derivatives of a deleted image; False if it was dropped"""
+        ...
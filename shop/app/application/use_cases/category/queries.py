@@ -1,15 +1,33 @@
-
 from shop.app.application.dto.commands import GetCategoryByIdCommand, ListCategoriesCommand
 from shop.app.application.dto.responses import CategoryResponse, ListCategoriesResponse
+from shop.app.application.interfaces.repositories import QuerySession
 from shop.app.application.use_cases.base import UseCase
+from shop.app.domain import Category
 
 class GetCategoryByIdUseCase(UseCase):
+    def __init__(self, session: QuerySession) -> None:
+        self._session = session
+
     async def __call__(self, command: GetCategoryByIdCommand) -> CategoryResponse | None:
-        raise NotImplementedError("Use case is not implemented yet")
+        async with self._session as session:
+            category = await session.categories.get_by_id(command.id)
+        return _to_response(category) if category is not None else None
 
 class ListCategoriesUseCase(UseCase):
+    def __init__(self, session: QuerySession) -> None:
+        self._session = session
+
     async def __call__(self, command: ListCategoriesCommand) -> ListCategoriesResponse:
-        raise NotImplementedError("Use case is not implemented yet")
+        async with self._session as session:
+            categories = await session.categories.list_paginated(command.limit, command.offset)
+            total = await session.categories.count()
+        return ListCategoriesResponse(
+            items=[_to_response(c) for c in categories],
+            total=total,
+        )
+
+def _to_response(category: Category) -> CategoryResponse:
+    return CategoryResponse(id=category.id, data={"name": category.name})
 
 __all__ = [
     "GetCategoryByIdUseCase",
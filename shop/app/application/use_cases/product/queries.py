@@ -1,15 +1,42 @@
-
 from shop.app.application.dto.commands import GetProductByIdCommand, ListProductsCommand
 from shop.app.application.dto.responses import ProductResponse, ListProductsResponse
+from shop.app.application.interfaces.repositories import QuerySession
 from shop.app.application.use_cases.base import UseCase
+from shop.app.domain.entities.product import Product
 
 class GetProductByIdUseCase(UseCase):
+    def __init__(self, session: QuerySession) -> None:
+        self._session = session
+
     async def __call__(self, command: GetProductByIdCommand) -> ProductResponse | None:
-        raise NotImplementedError("Use case is not implemented yet")
+        async with self._session as session:
+            product = await session.products.get_by_id(command.id)
+        return _to_response(product) if product is not None else None
 
 class ListProductsUseCase(UseCase):
+    def __init__(self, session: QuerySession) -> None:
+        self._session = session
+
     async def __call__(self, command: ListProductsCommand) -> ListProductsResponse:
-        raise NotImplementedError("Use case is not implemented yet")
+        async with self._session as session:
+            products = await session.products.list_published(command.limit, command.offset)
+            total = await session.products.count_published()
+        return ListProductsResponse(items=[_to_response(p) for p in products], total=total)
+
+def _to_response(product: Product) -> ProductResponse:
+    return ProductResponse(
+        id=product.id,
+        data={
+            "title": product.title,
+            "description": product.description,
+            "price": product.price,
+            "stock": product.stock,
+            "brand": product.brand,
+            "is_published": product.is_published,
+            "category_id": product.category_id,
+            "thumbnail_key": product.thumbnail_key,
+        },
+    )
 
 __all__ = [
     "GetProductByIdUseCase",
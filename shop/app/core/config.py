@@ -22,6 +22,15 @@ class Settings(BaseSettings):
     POSTGRES_MIN_POOL_SIZE: int = 1
     POSTGRES_MAX_POOL_SIZE: int = 10
 
+    # Read replica (read-only units of work); disabled when host is not set
+    POSTGRES_REPLICA_HOST: str | None = None
+    POSTGRES_REPLICA_PORT: int = 5432
+    POSTGRES_REPLICA_MIN_POOL_SIZE: int = 1
+    POSTGRES_REPLICA_MAX_POOL_SIZE: int = 10
+    POSTGRES_REPLICA_MAX_LAG_SECONDS: float = 5.0
+    POSTGRES_REPLICA_LAG_CHECK_INTERVAL_SECONDS: float = 2.0
+    POSTGRES_REPLICA_LAG_PROBE_TIMEOUT_SECONDS: float = 0.5
+
     # FastAPI settings
     APP_HOST: str = "0.0.0.0"
     APP_PORT: int = 8000
@@ -39,11 +48,22 @@ class Settings(BaseSettings):
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    # Verified access tokens are cached in-process until their exp
+    ACCESS_TOKEN_CACHE_MAX_ENTRIES: int = 10000
+
+    # bcrypt runs on a dedicated thread pool (bcrypt releases the GIL); when
+    # workers + pending are all taken new hash/verify calls fail with 503
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64
 
     # Role ID for new registrations (e.g. 2 = "user"). Must exist in roles table.
     DEFAULT_ADMIN_ROLE_ID: int = 1
     DEFAULT_USER_ROLE_ID: int = 2
 
+    # Role -> permission snapshot is kept in memory; instances poll the policy
+    # version and reload on change. The admin role is granted every permission
+    ACCESS_POLICY_REFRESH_SECONDS: float = 5.0
+
     # Redis Settings
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -52,11 +72,14 @@ class Settings(BaseSettings):
 
     @property
     def REDIS_URL(self) -> str:
-        return f"redis://{self.REDIS_PASSWORD}:{self.REDIS_HOST}@{self.REDIS_PORT}:{self.REDIS_DB}"
+        auth = f":{self.REDIS_PASSWORD}@" if self.REDIS_PASSWORD else ""
+        return f"redis://{auth}{self.REDIS_HOST}:{self.REDIS_PORT}/{self.REDIS_DB_NUMBER}"
 
     # Failed login attempts
     MAX_FAILED_ATTEMPTS: int = 3
     BLOCK_TIME_MINUTES: int = 2
+    # Attempts are counted over a sliding window, not a counter with fixed expiry
+    FAILED_ATTEMPTS_WINDOW_SECONDS: int = 300
 
     # Cache TTL
     ROLES_CACHE_TTL_SECONDS: int = 300
@@ -64,8 +87,32 @@ class Settings(BaseSettings):
     CATEGORIES_CACHE_TTL_SECONDS: int = 300
     PRODUCTS_CACHE_TTL_SECONDS: int = 120
     ANALYTICS_CACHE_TTL_SECONDS: int = 60
+    # Closed analytics buckets no longer change and are kept much longer
+    ANALYTICS_CLOSED_BUCKET_CACHE_TTL_SECONDS: int = 86400
     USER_SESSION_CACHE_TTL_SECONDS: int = 1800
 
+    # Session last-seen is reported at most once per granularity per process
+    # and flushed in batches through SessionService.update_activity; session ->
+    # user is cached in-process briefly, so a revoked session may work for up
+    # to that TTL elsewhere
+    SESSION_ACTIVITY_GRANULARITY_SECONDS: float = 60.0
+    SESSION_ACTIVITY_FLUSH_INTERVAL_SECONDS: float = 5.0
+    SESSION_ACTIVITY_FLUSH_CONCURRENCY: int = 16
+    SESSION_USER_CACHE_TTL_SECONDS: float = 1.0
+    SESSION_USER_CACHE_MAX_ENTRIES: int = 10000
+
+    # In-process cache tier in front of Redis; kept coherent via pub/sub
+    LOCAL_CACHE_MAX_ENTRIES: int = 1024
+    LOCAL_CACHE_TTL_SECONDS: float = 5.0
+    CACHE_INVALIDATION_CHANNEL: str = "cache_invalidation"
+
+    # Stampede protection: stale entries are served while one worker refreshes
+    CACHE_STALE_SECONDS: int = 30
+    CACHE_LOCK_TIMEOUT_SECONDS: float = 5.0
+
+    # Cache payload codec: "msgpack" (compact, default) or "json" (readable)
+    CACHE_CODEC: str = "msgpack"
+
     # Minio settings
     MINIO_HOST: str = "localhost"
     MINIO_PORT: int = 9000
@@ -78,10 +125,38 @@ class Settings(BaseSettings):
     MEDIA_URL_PREFIX: str = "/media"
     IMAGE_MAX_SIZE_BYTES: int = 5 * 1024 * 1024
     IMAGE_ALLOWED_EXTENSIONS: str = "jpeg,png,webp,gif"
+    # Uploads larger than one part go to S3 as multipart; memory per upload
+    # is bounded by part size * (concurrency + 1). S3 requires parts >= 5 MiB
+    S3_MULTIPART_PART_SIZE_BYTES: int = 8 * 1024 * 1024
+    S3_MULTIPART_CONCURRENCY: int = 4
+
+    # Responsive copies of uploaded images are rendered in a process pool
+    # after upload: every width as WebP plus JPEG/PNG, never upscaled
+    IMAGE_DERIVATIVE_WIDTHS: str = "320,640,1280"
+    IMAGE_DERIVATIVE_QUALITY: int = 80
+    IMAGE_DERIVATIVE_PROCESSES: int = 2
+    IMAGE_DERIVATIVE_QUEUE_MAX_SIZE: int = 1000
+    IMAGE_DERIVATIVE_DRAIN_TIMEOUT_SECONDS: float = 30.0
 
     # Event log retention (MongoDB TTL)
     EVENT_LOG_TTL_DAYS: int = 30
 
+    # Request events are queued in-process and written to Mongo in batches;
+    # when the queue is full new events are dropped
+    EVENT_LOG_QUEUE_MAX_SIZE: int = 10000
+    EVENT_LOG_BATCH_SIZE: int = 500
+    EVENT_LOG_FLUSH_INTERVAL_SECONDS: float = 1.0
+
+    # Filtered event log totals are approximate: cached per filter set
+    EVENT_LOG_COUNT_CACHE_TTL_SECONDS: float = 30.0
+    EVENT_LOG_COUNT_CACHE_MAX_ENTRIES: int = 256
+
+    # Analytics rollups: closed minutes older than the delay are folded into
+    # minute/hour/day buckets; the delay must exceed the batch flush interval
+    EVENT_LOG_ROLLUP_INTERVAL_SECONDS: float = 60.0
+    EVENT_LOG_ROLLUP_DELAY_SECONDS: float = 120.0
+    EVENT_LOG_ROLLUP_MAX_WINDOW_HOURS: int = 24
+
     # IANA-имя пояса для меток времени в логах (например Europe/Moscow, UTC)
     EVENT_LOG_TIMEZONE: str = "UTC"
 
@@ -102,6 +177,12 @@ class Settings(BaseSettings):
     def DATABASE_URL(self) -> str:
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def DATABASE_REPLICA_URL(self) -> str | None:
+        if not self.POSTGRES_REPLICA_HOST:
+            return None
+        return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_REPLICA_HOST}:{self.POSTGRES_REPLICA_PORT}/{self.POSTGRES_DB}"
+
     @property
     def MONGO_URL(self) -> str:
         return f"mongodb://{self.MONGODB_USER}:{self.MONGODB_PASSWORD}@{self.MONGODB_HOST}:{self.MONGODB_PORT}/{self.MONGODB_DB}?authSource=admin"
@@ -115,6 +196,12 @@ class Settings(BaseSettings):
     def image_allowed_extensions(self) -> set[str]:
         return {item.strip() for item in self.IMAGE_ALLOWED_EXTENSIONS.split(",") if item.strip()}
 
+    @property
+    def image_derivative_widths(self) -> tuple[int, ...]:
+        return tuple(
+            sorted({int(item) for item in self.IMAGE_DERIVATIVE_WIDTHS.split(",") if item.strip()})
+        )
+
     model_config = ConfigDict(
         env_file=".env",
         case_sensitive=True,
@@ -29,6 +29,10 @@ class ApplicationUnavailableError(AppError):
     status_code = 503
 
 
+class ApplicationOverloadedError(ApplicationUnavailableError):
+    code = "application_overloaded"
+
+
 # Storage
 class StorageError(AppError):
     code = "storage_error"
@@ -1,16 +1,43 @@
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
+from datetime import timedelta
 
 from fastapi import FastAPI
+from redis.asyncio import Redis
 
-from shop.app.infrastructure.services.storage.s3_storage import S3Storage
+from shop.app.infrastructure.services.images.pipeline import ImageDerivativePipeline
+from shop.app.infrastructure.services.security.access_policy import AccessPolicySnapshotProvider
+from shop.app.infrastructure.services.security.password_hasher import BcryptPasswordHasher
+from shop.app.infrastructure.services.security.token_verifier import AccessTokenVerifier
+from shop.app.infrastructure.services.storage.s3_storage import S3FieStorage
 
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
 from shop.app.core.config import settings
+from shop.app.core.mongo_indexes import ensure_event_log_indexes
+from shop.app.core.state import AppState
 
 
 from shop.app.infrastructure.services.storage.connection import MinioInfrastructure
+from shop.app.infrastructure.persistence.mongo.connection import MongoInfrastructure
+from shop.app.infrastructure.persistence.mongo.count_cache import CountCache
+from shop.app.infrastructure.persistence.mongo.event_log_batcher import EventLogBatcher
+from shop.app.infrastructure.persistence.mongo.event_log_rollup import EventLogRollupJob
+from shop.app.infrastructure.persistence.mongo.repositories.event_log_mongo_repository import (
+    EventLogRepositoryMongo,
+)
 from shop.app.infrastructure.persistence.postgres.connection import (
     PostgresInfrastructure,
 )
+from shop.app.infrastructure.persistence.postgres.replica import ReplicaRouter
+from shop.app.infrastructure.persistence.postgres.repositories.unit_of_work import SqlUnitOfWork
+from shop.app.infrastructure.persistence.redis.auth_attempts import RedisAuthAttemptsStorage
+from shop.app.infrastructure.persistence.redis.cache import RedisCacheStorage
+from shop.app.infrastructure.persistence.redis.codecs import create_cache_codec
+from shop.app.infrastructure.persistence.redis.connection import RedisInfrastructure
+from shop.app.infrastructure.persistence.redis.invalidation import CacheInvalidationListener
+from shop.app.infrastructure.persistence.redis.local_cache import LocalCache, TieredCacheStorage
+from shop.app.infrastructure.persistence.redis.read_through import RedisReadThroughCache
+from shop.app.services.login_attempt_service import LoginAttemptService
 
 
 def create_postgres_infrastructure() -> PostgresInfrastructure:
@@ -21,6 +48,105 @@ def create_postgres_infrastructure() -> PostgresInfrastructure:
     )
 
 
+def create_postgres_replica_infrastructure() -> PostgresInfrastructure | None:
+    replica_url = settings.DATABASE_REPLICA_URL
+    if replica_url is None:
+        return None
+    return PostgresInfrastructure(
+        url=replica_url,
+        min_size=settings.POSTGRES_REPLICA_MIN_POOL_SIZE,
+        max_size=settings.POSTGRES_REPLICA_MAX_POOL_SIZE,
+    )
+
+
+def create_replica_router(
+    postgres: PostgresInfrastructure,
+    replica: PostgresInfrastructure | None,
+) -> ReplicaRouter:
+    return ReplicaRouter(
+        primary=postgres.get_pool(),
+        replica=replica.get_pool() if replica is not None else None,
+        max_lag_seconds=settings.POSTGRES_REPLICA_MAX_LAG_SECONDS,
+        check_interval_seconds=settings.POSTGRES_REPLICA_LAG_CHECK_INTERVAL_SECONDS,
+        probe_timeout_seconds=settings.POSTGRES_REPLICA_LAG_PROBE_TIMEOUT_SECONDS,
+    )
+
+
+def create_redis_infrastructure() -> RedisInfrastructure:
+    return RedisInfrastructure(url=settings.REDIS_URL)
+
+
+def create_cache_storage(client: Redis) -> TieredCacheStorage:
+    return TieredCacheStorage(
+        remote=RedisCacheStorage(client=client),
+        local=LocalCache(
+            max_entries=settings.LOCAL_CACHE_MAX_ENTRIES,
+            ttl_seconds=settings.LOCAL_CACHE_TTL_SECONDS,
+        ),
+    )
+
+
+def create_read_through_cache(
+    storage: TieredCacheStorage, client: Redis, codec: CacheCodec
+) -> RedisReadThroughCache:
+    return RedisReadThroughCache(
+        storage=storage,
+        client=client,
+        codec=codec,
+        stale_seconds=settings.CACHE_STALE_SECONDS,
+        lock_timeout_seconds=settings.CACHE_LOCK_TIMEOUT_SECONDS,
+    )
+
+
+def create_password_hasher() -> BcryptPasswordHasher:
+    return BcryptPasswordHasher(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=settings.PASSWORD_HASH_MAX_PENDING,
+    )
+
+
+def create_token_verifier() -> AccessTokenVerifier:
+    return AccessTokenVerifier(max_entries=settings.ACCESS_TOKEN_CACHE_MAX_ENTRIES)
+
+
+def create_login_attempt_service(client: Redis) -> LoginAttemptService:
+    return LoginAttemptService(
+        RedisAuthAttemptsStorage(client),
+        max_attempts=settings.MAX_FAILED_ATTEMPTS,
+        window_seconds=settings.FAILED_ATTEMPTS_WINDOW_SECONDS,
+        block_seconds=settings.BLOCK_TIME_MINUTES * 60,
+    )
+
+
+def create_mongo_infrastructure() -> MongoInfrastructure:
+    return MongoInfrastructure(url=settings.MONGO_URL)
+
+
+def create_event_log_count_cache() -> CountCache:
+    return CountCache(
+        max_entries=settings.EVENT_LOG_COUNT_CACHE_MAX_ENTRIES,
+        ttl_seconds=settings.EVENT_LOG_COUNT_CACHE_TTL_SECONDS,
+    )
+
+
+def create_event_log_batcher(mongo_db) -> EventLogBatcher:
+    return EventLogBatcher(
+        repo=EventLogRepositoryMongo(db=mongo_db),
+        max_queue_size=settings.EVENT_LOG_QUEUE_MAX_SIZE,
+        batch_size=settings.EVENT_LOG_BATCH_SIZE,
+        flush_interval_seconds=settings.EVENT_LOG_FLUSH_INTERVAL_SECONDS,
+    )
+
+
+def create_event_log_rollup_job(mongo_db) -> EventLogRollupJob:
+    return EventLogRollupJob(
+        db=mongo_db,
+        interval_seconds=settings.EVENT_LOG_ROLLUP_INTERVAL_SECONDS,
+        delay_seconds=settings.EVENT_LOG_ROLLUP_DELAY_SECONDS,
+        max_window=timedelta(hours=settings.EVENT_LOG_ROLLUP_MAX_WINDOW_HOURS),
+    )
+
+
 def create_minio_infrastructure() -> MinioInfrastructure:
     return MinioInfrastructure(
         endpoint_url=settings.MINIO_URL,
@@ -29,16 +155,95 @@ def create_minio_infrastructure() -> MinioInfrastructure:
     )
 
 
-def create_storage(minio: MinioInfrastructure) -> S3Storage:
-    return S3Storage(client=minio.get_client(), bucket_name=settings.MINIO_BUCKET)
+def create_storage(minio: MinioInfrastructure) -> S3FieStorage:
+    return S3FieStorage(
+        client=minio.get_client(),
+        bucket_name=settings.MINIO_BUCKET,
+        part_size=settings.S3_MULTIPART_PART_SIZE_BYTES,
+        max_concurrency=settings.S3_MULTIPART_CONCURRENCY,
+        max_size_bytes=settings.IMAGE_MAX_SIZE_BYTES,
+    )
+
+
+def create_access_policy(postgres: PostgresInfrastructure) -> AccessPolicySnapshotProvider:
+    return AccessPolicySnapshotProvider(
+        # Версия и роли читаются в одной транзакции с primary: реплика может отставать.
+        uow_factory=lambda: SqlUnitOfWork(postgres.get_pool(), readonly=True),
+        refresh_interval_seconds=settings.ACCESS_POLICY_REFRESH_SECONDS,
+        superuser_role_ids=(settings.DEFAULT_ADMIN_ROLE_ID,),
+        superuser_role_names=("admin",),
+    )
+
+
+def create_image_derivative_pipeline(
+    storage: S3FieStorage,
+    postgres: PostgresInfrastructure,
+    executor: ProcessPoolExecutor,
+    cache: TieredCacheStorage,
+) -> ImageDerivativePipeline:
+    return ImageDerivativePipeline(
+        storage=storage,
+        uow_factory=lambda: SqlUnitOfWork(postgres.get_pool()),
+        cache=cache,
+        executor=executor,
+        widths=settings.image_derivative_widths,
+        quality=settings.IMAGE_DERIVATIVE_QUALITY,
+        max_queue_size=settings.IMAGE_DERIVATIVE_QUEUE_MAX_SIZE,
+        # Больше воркеров, чем процессов, не ускорит рендер — только займёт память оригиналами.
+        concurrency=settings.IMAGE_DERIVATIVE_PROCESSES,
+        drain_timeout_seconds=settings.IMAGE_DERIVATIVE_DRAIN_TIMEOUT_SECONDS,
+    )
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # bcrypt on its own bounded thread pool
+    password_hasher = create_password_hasher()
+    # verified access tokens, reused across requests until exp
+    token_verifier = create_token_verifier()
+
     # postgres
     postgres = create_postgres_infrastructure()
     await postgres.connect()
 
+    postgres_replica = create_postgres_replica_infrastructure()
+    if postgres_replica is not None:
+        await postgres_replica.connect()
+    db_replicas = create_replica_router(postgres, postgres_replica)
+
+    # role -> permission bitsets, refreshed when the policy version changes
+    access_policy = create_access_policy(postgres)
+    await access_policy.start()
+
+    # redis: two-tier cache + cross-instance invalidation
+    redis = create_redis_infrastructure()
+    await redis.connect()
+    # Кеш хранит бинарные блобы кодека, поэтому клиент без decode_responses.
+    cache_client = Redis.from_url(settings.REDIS_URL)
+    cache_storage = create_cache_storage(cache_client)
+    cache_invalidation = CacheInvalidationListener(
+        client=cache_client,
+        channel=settings.CACHE_INVALIDATION_CHANNEL,
+        cache=cache_storage,
+    )
+    await cache_invalidation.start()
+    cache_codec = create_cache_codec(settings.CACHE_CODEC)
+    read_through_cache = create_read_through_cache(cache_storage, cache_client, cache_codec)
+    # failed logins: sliding window + block, one Lua call per failure
+    login_attempts = create_login_attempt_service(Redis(connection_pool=redis.get_pool()))
+
+    # mongo: event log is written in batches by a background task
+    mongo = create_mongo_infrastructure()
+    mongo.connect()
+    mongo_db = mongo.get_client()[settings.MONGODB_DB]
+    await ensure_event_log_indexes(mongo_db)
+    event_log_batcher = create_event_log_batcher(mongo_db)
+    await event_log_batcher.start()
+    event_log_rollup = create_event_log_rollup_job(mongo_db)
+    await event_log_rollup.start()
+    # filtered event log totals, shared by the per-request repositories
+    event_log_counts = create_event_log_count_cache()
+
     # S3 infrastructure + adapters
     minio = create_minio_infrastructure()
     await minio.connect()
@@ -46,19 +251,50 @@ async def lifespan(app: FastAPI):
     storage = create_storage(minio)
     # await storage.ensure_ready()
 
-    # app.state.ext = AppState(
-    #     db_pool=db_pool,
-    #     cache_service=cache_service,
-    #     mongo_client=mongo_client,
-    #     mongo_db=mongo_db,
-    #     session_service=session_service,
-    #     storage=storage,
-    #     storage_readiness=storage,
-    # )
+    # image derivatives: resized off the event loop in worker processes
+    image_executor = ProcessPoolExecutor(max_workers=settings.IMAGE_DERIVATIVE_PROCESSES)
+    image_derivatives = create_image_derivative_pipeline(
+        storage, postgres, image_executor, cache_storage
+    )
+    await image_derivatives.start()
+
+    # CacheService и SessionService собираются вне этого дерева — их поля остаются
+    # пустыми. Без SessionService нет и трекера активности сессий: сбрасывать
+    # отметки некуда, поэтому session_activity тоже не заполняется.
+    app.state.ext = AppState(
+        db_pool=postgres.get_pool(),
+        mongo_client=mongo.get_client(),
+        mongo_db=mongo_db,
+        storage=storage,
+        storage_readiness=storage,
+        password_hasher=password_hasher,
+        db_replicas=db_replicas,
+        cache_storage=cache_storage,
+        cache_codec=cache_codec,
+        read_through_cache=read_through_cache,
+        event_log_batcher=event_log_batcher,
+        event_log_counts=event_log_counts,
+        image_derivatives=image_derivatives,
+        token_verifier=token_verifier,
+        access_policy=access_policy,
+        login_attempts=login_attempts,
+    )
 
     yield
 
     # --- shutdown ---
 
+    await image_derivatives.close()
+    image_executor.shutdown(cancel_futures=True)
     await minio.close()
+    await event_log_rollup.close()
+    await event_log_batcher.close()
+    mongo.close()
+    await cache_invalidation.close()
+    await cache_client.aclose()
+    await redis.close()
+    await access_policy.close()
+    if postgres_replica is not None:
+        await postgres_replica.close()
     await postgres.close()
+    password_hasher.close()
@@ -1,8 +1,13 @@
 import logging
 
 from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import IndexModel
 
 from shop.app.core.config import settings
+from shop.app.infrastructure.persistence.mongo.event_log_rollup import (
+    ROLLUP_COLLECTION,
+    USER_ROLLUP_COLLECTION,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -53,3 +58,80 @@ async def ensure_event_log_search_indexes(db: AsyncIOMotorDatabase) -> None:
         logger.info("Created search index '%s' on event_log collection", index_name)
     except Exception as exc:
         logger.warning("Failed to ensure search index on event_log: %s", exc)
+
+
+# Формы запросов EventLogRepositoryMongo.get_filtered: равенство по фильтру,
+# затем диапазон и сортировка по (created_at, id) — правило ESR.
+_EVENT_LOG_QUERY_INDEXES = {
+    "event_log_created_at_id": [("created_at", -1), ("id", -1)],
+    "event_log_user_created_at": [("user_id", 1), ("created_at", -1), ("id", -1)],
+    "event_log_type_created_at": [("event_type", 1), ("created_at", -1), ("id", -1)],
+}
+
+
+async def ensure_event_log_query_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Составные индексы под фильтры и keyset-пагинацию логов, плюс уникальный по id.
+    """
+    logger.info("Ensuring query indexes on event_log collection")
+    collection = db["event_log"]
+    existing = {index["name"] async for index in collection.list_indexes()}
+
+    indexes = [
+        IndexModel(keys, name=name)
+        for name, keys in _EVENT_LOG_QUERY_INDEXES.items()
+        if name not in existing
+    ]
+    if "event_log_id" not in existing:
+        indexes.append(IndexModel([("id", 1)], name="event_log_id", unique=True))
+    if not indexes:
+        return
+    try:
+        await collection.create_indexes(indexes)
+        logger.info(
+            "Created indexes %s on event_log collection",
+            ", ".join(index.document["name"] for index in indexes),
+        )
+    except Exception as exc:
+        logger.warning("Failed to ensure query indexes on event_log: %s", exc)
+
+
+async def ensure_event_log_rollup_indexes(db: AsyncIOMotorDatabase) -> None:
+    """
+    Уникальные ключи бакетов роллапов и TTL: роллапы живут на день дольше событий.
+    """
+    logger.info("Ensuring indexes on event_log rollup collections")
+    ttl_seconds = (settings.EVENT_LOG_TTL_DAYS + 1) * 24 * 60 * 60
+    indexes = {
+        ROLLUP_COLLECTION: [
+            IndexModel([("unit", 1), ("bucket", 1)], name="event_log_rollup_bucket", unique=True),
+            IndexModel("bucket", name="event_log_rollup_ttl", expireAfterSeconds=ttl_seconds),
+        ],
+        USER_ROLLUP_COLLECTION: [
+            IndexModel(
+                [("user_id", 1), ("day", 1), ("window_start", 1)],
+                name="event_log_user_rollup_window",
+                unique=True,
+            ),
+            IndexModel("day", name="event_log_user_rollup_ttl", expireAfterSeconds=ttl_seconds),
+        ],
+    }
+    # Старый уникальный ключ (user_id, day) не даёт хранить строку на окно.
+    try:
+        existing = {index["name"] async for index in db[USER_ROLLUP_COLLECTION].list_indexes()}
+        if "event_log_user_rollup_day" in existing:
+            await db[USER_ROLLUP_COLLECTION].drop_index("event_log_user_rollup_day")
+    except Exception as exc:
+        logger.warning("Failed to drop obsolete index on %s: %s", USER_ROLLUP_COLLECTION, exc)
+    for collection_name, models in indexes.items():
+        try:
+            await db[collection_name].create_indexes(models)
+        except Exception as exc:
+            logger.warning("Failed to ensure indexes on %s: %s", collection_name, exc)
+
+
+async def ensure_event_log_indexes(db: AsyncIOMotorDatabase) -> None:
+    await ensure_event_log_ttl_index(db)
+    await ensure_event_log_search_indexes(db)
+    await ensure_event_log_query_indexes(db)
+    await ensure_event_log_rollup_indexes(db)
@@ -8,7 +8,19 @@ from fastapi import Request
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 
 from shop.app.core.ports.base import HealthCheckPort
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
+from shop.app.infrastructure.persistence.mongo.count_cache import CountCache
+from shop.app.infrastructure.persistence.mongo.event_log_batcher import EventLogBatcher
+from shop.app.infrastructure.persistence.postgres.replica import ReplicaRouter
+from shop.app.infrastructure.persistence.redis.session_activity import SessionActivityTracker
+from shop.app.infrastructure.services.images.pipeline import ImageDerivativePipeline
+from shop.app.infrastructure.services.security.access_policy import AccessPolicySnapshotProvider
+from shop.app.infrastructure.services.security.password_hasher import BcryptPasswordHasher
+from shop.app.infrastructure.services.security.token_verifier import AccessTokenVerifier
 from shop.app.application.interfaces.services.files.file_storage import FileStoragePort
+from shop.app.services.login_attempt_service import LoginAttemptService
 from depricated.services.cache_service import CacheService
 from depricated.services.session_service import SessionService
 
@@ -17,12 +29,26 @@ from depricated.services.session_service import SessionService
 class AppState:
 
     db_pool: asyncpg.Pool
-    cache_service: CacheService
     mongo_client: AsyncIOMotorClient
     mongo_db: AsyncIOMotorDatabase
-    session_service: SessionService
     storage: FileStoragePort
     storage_readiness: HealthCheckPort
+    password_hasher: BcryptPasswordHasher
+    # Реализации CacheService/SessionService живут вне этого дерева; пока lifespan
+    # их не собирает, зависимости от них отвечают 503.
+    cache_service: CacheService | None = None
+    session_service: SessionService | None = None
+    db_replicas: ReplicaRouter | None = None
+    cache_storage: CacheStorage | None = None
+    cache_codec: CacheCodec | None = None
+    read_through_cache: ReadThroughCache | None = None
+    event_log_batcher: EventLogBatcher | None = None
+    event_log_counts: CountCache | None = None
+    image_derivatives: ImageDerivativePipeline | None = None
+    session_activity: SessionActivityTracker | None = None
+    token_verifier: AccessTokenVerifier | None = None
+    access_policy: AccessPolicySnapshotProvider | None = None
+    login_attempts: LoginAttemptService | None = None
 
 
 def get_app_state(request: Request) -> AppState:
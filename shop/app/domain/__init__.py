@@ -1,7 +1,7 @@
 """Domain model package (entities and value objects)."""
 
 from shop.app.domain.attributes import coerce_attributes_dict
-from shop.app.domain.enums import MovementReason, OrderStatus, PaymentStatus
+from shop.app.domain.enums import MovementReason, OrderStatus, PaymentStatus, PermissionCode
 from shop.app.domain.entities.brand import Brand
 from shop.app.domain.entities.cart import Cart, CartItem, validate_line_quantity, validate_max_stock
 from shop.app.domain.entities.category import Category, CategoryCreateData, CategoryUpdateData
@@ -50,6 +50,7 @@ __all__ = [
     "CategoryCreateData",
     "CategoryUpdateData",
     "MovementReason",
+    "PermissionCode",
     "Order",
     "OrderItem",
     "OrderStatus",
@@ -3,6 +3,7 @@ from decimal import Decimal
 from uuid import UUID
 
 from shop.app.domain.errors import DomainValidationError, EmptyProductTitleError
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
 
 
 class Product:
@@ -19,6 +20,7 @@ class Product:
         is_published: bool,
         category_id: UUID,
         thumbnail_key: str,
+        thumbnail_derivatives: tuple[ImageDerivative, ...] = (),
     ) -> None:
         if not isinstance(id, UUID):
             raise DomainValidationError("Product id must be UUID")
@@ -55,6 +57,7 @@ class Product:
         self._is_published = is_published
         self._category_id = category_id
         self._thumbnail_key = thumbnail_key.strip()
+        self._thumbnail_derivatives = tuple(thumbnail_derivatives)
 
     @property
     def id(self) -> UUID:
@@ -92,5 +95,9 @@ class Product:
     def thumbnail_key(self) -> str:
         return self._thumbnail_key
 
+    @property
+    def thumbnail_derivatives(self) -> tuple[ImageDerivative, ...]:
+        return self._thumbnail_derivatives
+
     def __repr__(self) -> str:
         return f"<Product {self._title!r} ({self._id})>"
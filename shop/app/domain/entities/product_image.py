@@ -3,7 +3,7 @@ from uuid import UUID
 
 from uuid6 import uuid7
 
-from shop.app.domain.value_objects.catalog_values import StorageKey
+from shop.app.domain.value_objects.catalog_values import ImageDerivative, StorageKey
 
 
 class ProductImage:
@@ -13,11 +13,13 @@ class ProductImage:
         product_id: UUID,
         storage_key: StorageKey,
         created_at: datetime | None = None,
+        derivatives: tuple[ImageDerivative, ...] = (),
     ):
         self._id = id
         self._product_id = product_id
         self._storage_key = storage_key
         self._created_at = created_at or datetime.now(UTC)
+        self._derivatives = tuple(derivatives)
 
     @classmethod
     def create(cls, product_id: UUID, storage_key: StorageKey) -> "ProductImage":
@@ -35,11 +37,21 @@ class ProductImage:
     def storage_key(self) -> StorageKey:
         return self._storage_key
 
+    @property
+    def derivatives(self) -> tuple[ImageDerivative, ...]:
+        """Resized copies; empty until the derivative pipeline has processed the upload."""
+        return self._derivatives
+
     def generate_public_url(self, base_url: str) -> str:
         return f"{base_url.rstrip('/')}/{self._storage_key}"
 
     def rename_storage_key(self, new_key: StorageKey) -> None:
+        # Производные построены по старому ключу и больше ему не соответствуют.
         self._storage_key = new_key
+        self._derivatives = ()
+
+    def record_derivatives(self, derivatives: tuple[ImageDerivative, ...]) -> None:
+        self._derivatives = tuple(sorted(derivatives, key=lambda d: (d.format, d.width)))
 
     def __repr__(self) -> str:
         return f"<ProductImage(id={self._id}, product={self._product_id})>"
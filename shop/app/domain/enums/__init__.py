@@ -1,7 +1,8 @@
 """Domain enums package."""
 
+from .access_enums import PermissionCode
 from .inventory_enums import MovementReason
 from .order_enums import OrderStatus, PaymentStatus
 
-__all__ = ["MovementReason", "OrderStatus", "PaymentStatus"]
+__all__ = ["MovementReason", "OrderStatus", "PaymentStatus", "PermissionCode"]
 
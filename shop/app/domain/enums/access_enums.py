@@ -0,0 +1,19 @@
+from enum import StrEnum
+
+
+class PermissionCode(StrEnum):
+    USERS_READ = "users:read"
+    USERS_WRITE = "users:write"
+    ROLES_READ = "roles:read"
+    ROLES_WRITE = "roles:write"
+    PRODUCTS_WRITE = "products:write"
+    PRODUCT_IMAGES_WRITE = "product_images:write"
+    PRODUCT_SPECIFICATIONS_WRITE = "product_specifications:write"
+    CATEGORIES_WRITE = "categories:write"
+    ORDERS_READ = "orders:read"
+    ORDERS_WRITE = "orders:write"
+    EVENT_LOGS_READ = "event_logs:read"
+    ANALYTICS_READ = "analytics:read"
+
+
+__all__ = ["PermissionCode"]
@@ -1,3 +1,4 @@
+from .access_errors import MissingPermissionsError
 from .base import DomainError, DomainValidationError
 from .catalog_errors import CurrencyMismatchError, EmptySkuError, EmptyStorageKeyError
 from .cart_errors import CartCurrencyMismatchError, CartItemOwnershipError, CartLineNotFoundError, CartLinePriceMismatchError
@@ -56,4 +57,5 @@ __all__ = [
     "ZeroStockMovementAmountError",
     "InvalidSaleMovementAmountError",
     "InvalidReceiptMovementAmountError",
+    "MissingPermissionsError",
 ]
@@ -0,0 +1,5 @@
+from shop.app.domain.errors.base import DomainError
+
+
+class MissingPermissionsError(DomainError):
+    pass
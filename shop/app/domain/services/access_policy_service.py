@@ -1,7 +1,7 @@
-
 from collections.abc import Sequence
 
 from shop.app.domain import Permission, Role, User
+from shop.app.domain.errors import MissingPermissionsError
 
 
 class AccessPolicyDomainService:
@@ -13,7 +13,9 @@ class AccessPolicyDomainService:
         roles: Sequence[Role],
     ) -> set[str]:
         """Return effective permission codes for the user."""
-        raise NotImplementedError("Domain service is not implemented yet")
+        if not user.is_active:
+            return set()
+        return {permission.name for role in roles for permission in role.permissions}
 
     def ensure_permissions(
         self,
@@ -22,8 +24,10 @@ class AccessPolicyDomainService:
         required_permissions: Sequence[Permission],
     ) -> None:
         """Validate that user has all required permissions."""
-        raise NotImplementedError("Domain service is not implemented yet")
+        effective = self.collect_effective_permissions(user, roles)
+        missing = sorted({p.name for p in required_permissions} - effective)
+        if missing:
+            raise MissingPermissionsError(f"Missing permissions: {', '.join(missing)}")
 
 
 __all__ = ["AccessPolicyDomainService"]
-
@@ -1,6 +1,6 @@
 """Domain value objects package."""
 
-from .catalog_values import Sku, StorageKey
+from .catalog_values import ImageDerivative, Sku, StorageKey
 from .order_values import OrderNumber, PaymentMethod, ShippingAddress
 from .price import Price, quantize_money_amount
 from .review_values import Rating, ReviewDescription, ReviewTitle, normalize_review_description
@@ -9,6 +9,7 @@ from .user_values import Email, FullName, Username
 __all__ = [
     "Email",
     "FullName",
+    "ImageDerivative",
     "OrderNumber",
     "PaymentMethod",
     "Price",
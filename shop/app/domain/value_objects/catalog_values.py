@@ -1,7 +1,12 @@
 
+from dataclasses import dataclass
 from typing import cast
 
-from shop.app.domain.errors import EmptySkuError, EmptyStorageKeyError
+from shop.app.domain.errors import (
+    DomainValidationError,
+    EmptySkuError,
+    EmptyStorageKeyError,
+)
 
 
 class Sku(str):
@@ -24,4 +29,21 @@ class StorageKey(str):
         return cast(StorageKey, str.__new__(cls, clean))
 
 
-__all__ = ["Sku", "StorageKey"]
+@dataclass(frozen=True, slots=True)
+class ImageDerivative:
+    """Resized copy of an uploaded image: one width in one format."""
+
+    width: int
+    format: str
+    storage_key: StorageKey
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.width, int) or isinstance(self.width, bool) or self.width <= 0:
+            raise DomainValidationError("Image derivative width must be a positive integer")
+        if not isinstance(self.format, str) or not self.format.strip():
+            raise DomainValidationError("Image derivative format cannot be empty")
+        object.__setattr__(self, "format", self.format.strip().lower())
+        object.__setattr__(self, "storage_key", StorageKey(self.storage_key))
+
+
+__all__ = ["ImageDerivative", "Sku", "StorageKey"]
@@ -13,7 +13,8 @@ class MongoInfrastructure(Lifecycle, ClientProvider):
     def connect(self) -> None:
         if self._client is not None:
             return
-        self._client = AsyncIOMotorClient(self._url)
+        # id событий — UUIDv7; хранятся как BSON binary subtype 4.
+        self._client = AsyncIOMotorClient(self._url, uuidRepresentation="standard")
 
     def close(self) -> None:
         if self._client is not None:
@@ -0,0 +1,50 @@
+"""In-process cache of ``count_documents`` results per filter."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+
+class CountCache:
+    """
+    Size-bounded LRU of document counts with a fixed TTL.
+
+    One instance is shared by every repository built for a request, so a
+    count computed for one filter set answers the following requests until
+    it expires. Not thread-safe; intended for a single event loop.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, int]] = OrderedDict()
+
+    def get(self, key: str) -> int | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, count = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return count
+
+    def set(self, key: str, count: int) -> None:
+        self._entries[key] = (self._clock() + self._ttl_seconds, count)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,140 @@
+"""Asynchronous, batched writes of event log documents to MongoDB."""
+
+import asyncio
+import logging
+from dataclasses import asdict, dataclass
+
+from shop.app.infrastructure.persistence.mongo.repositories.event_log_mongo_repository import (
+    EventLogRepositoryMongo,
+)
+
+logger = logging.getLogger(__name__)
+
+_DROP_WARNING_EVERY = 1000
+
+
+@dataclass(slots=True)
+class EventLogBatcherStats:
+    enqueued: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    queue_size: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class EventLogBatcher:
+    """
+    Bounded in-process queue in front of ``EventLogRepositoryMongo``.
+
+    ``submit`` never waits: when the queue is full the new event is dropped
+    and counted, so a slow or unavailable Mongo cannot add latency to
+    requests. A background task writes events with ``create_many`` once
+    ``batch_size`` are collected or ``flush_interval_seconds`` has passed
+    since the first one. A failed batch is logged and discarded. ``close``
+    flushes whatever is still queued.
+    """
+
+    def __init__(
+        self,
+        *,
+        repo: EventLogRepositoryMongo,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+    ) -> None:
+        self._repo = repo
+        self._queue: asyncio.Queue[dict] = asyncio.Queue(maxsize=max_queue_size)
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._task: asyncio.Task[None] | None = None
+        self._writing: asyncio.Future[None] | None = None
+        # Пачка, которую фоновая задача собирает прямо сейчас (уже не в очереди).
+        self._collecting: list[dict] = []
+        self._stats = EventLogBatcherStats()
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stats(self) -> EventLogBatcherStats:
+        self._stats.queue_size = self._queue.qsize()
+        return self._stats
+
+    def submit(self, event: dict) -> bool:
+        """Queue an event for writing; ``False`` if it was dropped."""
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self._stats.dropped += 1
+            if self._stats.dropped % _DROP_WARNING_EVERY == 1:
+                logger.warning(
+                    "Event log queue is full, dropping events (dropped so far: %d)",
+                    self._stats.dropped,
+                )
+            return False
+        self._stats.enqueued += 1
+        return True
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-log-batcher")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._writing is not None:
+            # Начатую пачку не прерываем: insert_many мог уже частично пройти.
+            await self._writing
+            self._writing = None
+        batch, self._collecting = self._collecting, []
+        await self._write(batch)
+        while not self._queue.empty():
+            await self._write(self._take_ready())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = self._collecting
+            batch.append(await self._queue.get())
+            deadline = loop.time() + self._flush_interval_seconds
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except TimeoutError:
+                    break
+            self._collecting = []
+            self._writing = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._writing)
+            self._writing = None
+
+    def _take_ready(self) -> list[dict]:
+        batch: list[dict] = []
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def _write(self, batch: list[dict]) -> None:
+        if not batch:
+            return
+        try:
+            await self._repo.create_many(batch)
+        except Exception:
+            self._stats.failed += len(batch)
+            logger.exception("Failed to write %d event log entries", len(batch))
+            return
+        self._stats.batches += 1
+        self._stats.written += len(batch)
@@ -0,0 +1,484 @@
+"""
+Pre-aggregated event log rollups for analytics.
+
+``EventLogRollupJob`` periodically folds raw ``event_log`` documents older
+than a watermark into:
+
+* ``event_log_rollup`` — one document per ``(unit, bucket)`` for minute,
+  hour and day buckets: event count, counts per event type and the bucket's
+  users — distinct ids for minutes, a HyperLogLog sketch for hours and days;
+* ``event_log_user_rollup`` — activity of a user in a day: event count, last
+  activity and event types. While the day is open there is one row per job
+  window (``window_start``); once the watermark passes the day, it is
+  recomputed into a single row with ``window_start: None`` and the window
+  rows are deleted. Readers take the day row when it exists and sum the
+  window rows otherwise (see ``user_day_rollup_stages``).
+
+Everything before the watermark (``event_log_rollup_state``) is served from
+rollups; analytics scan raw events only after it and on bucket edges.
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import UpdateOne
+from pymongo.errors import DuplicateKeyError
+
+from shop.app.utils.get_utc_now import get_utc_now
+from shop.app.utils.hyperloglog import HyperLogLog
+
+logger = logging.getLogger(__name__)
+
+ROLLUP_COLLECTION = "event_log_rollup"
+USER_ROLLUP_COLLECTION = "event_log_user_rollup"
+STATE_COLLECTION = "event_log_rollup_state"
+
+# От крупного к мелкому: так их перебирает разбиение интервала на бакеты.
+ROLLUP_UNITS: tuple[str, ...] = ("day", "hour", "minute")
+_UNIT_STEPS = {
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+}
+
+_STATE_ID = "watermark"
+
+# Точность HLL-скетчей уникальных пользователей (~1.6% ошибки, 4 КиБ на бакет).
+# Менять нельзя без пересчёта роллапов: скетчи разной точности не сливаются.
+UNIQUE_USERS_PRECISION = 12
+
+
+def as_utc(dt: datetime) -> datetime:
+    """Mongo отдаёт naive UTC; наружу и в сравнения — aware UTC."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt.astimezone(UTC)
+
+
+def truncate(dt: datetime, unit: str) -> datetime:
+    """Аналог ``$dateTrunc`` в UTC (неделя начинается с воскресенья, как в Mongo)."""
+    dt = as_utc(dt)
+    if unit == "minute":
+        return dt.replace(second=0, microsecond=0)
+    if unit == "hour":
+        return dt.replace(minute=0, second=0, microsecond=0)
+    day = dt.replace(hour=0, minute=0, second=0, microsecond=0)
+    if unit == "day":
+        return day
+    if unit == "week":
+        return day - timedelta(days=(day.weekday() + 1) % 7)
+    if unit == "month":
+        return day.replace(day=1)
+    if unit == "quarter":
+        return day.replace(month=(day.month - 1) // 3 * 3 + 1, day=1)
+    if unit == "year":
+        return day.replace(month=1, day=1)
+    raise ValueError(f"Unsupported time unit: {unit!r}")
+
+
+def ceil_to(dt: datetime, unit: str) -> datetime:
+    floor = truncate(dt, unit)
+    return floor if floor == as_utc(dt) else floor + _UNIT_STEPS[unit]
+
+
+def next_bucket(bucket: datetime, unit: str) -> datetime:
+    """Начало следующего бакета ``unit`` после ``bucket`` (выровненного)."""
+    if unit in _UNIT_STEPS:
+        return bucket + _UNIT_STEPS[unit]
+    # Недели, месяцы, кварталы и годы разной длины: шагаем с запасом и выравниваем.
+    overshoot = {"week": 7, "month": 32, "quarter": 93, "year": 366}[unit]
+    return truncate(bucket + timedelta(days=overshoot), unit)
+
+
+def units_for_period(period: str) -> tuple[str, ...]:
+    """Единицы роллапов, бакеты которых целиком лежат внутри бакета ``period``."""
+    if period in _UNIT_STEPS:
+        return ROLLUP_UNITS[ROLLUP_UNITS.index(period) :]
+    truncate(get_utc_now(), period)  # ValueError для неизвестной единицы
+    return ROLLUP_UNITS
+
+
+def add_users(sketch: HyperLogLog, row: dict) -> None:
+    """Добавить пользователей бакета в скетч: минутные хранят id, крупные — скетч."""
+    if (registers := row.get("users_hll")) is not None:
+        sketch.merge(HyperLogLog.from_bytes(registers))
+    else:
+        sketch.update(row.get("user_ids", ()))
+
+
+def minute_buckets_pipeline(start: datetime, end: datetime) -> list[dict]:
+    """Сырые события ``[start, end)`` → документы минутных бакетов."""
+    return [
+        {"$match": {"created_at": {"$gte": start, "$lt": end}}},
+        {
+            "$group": {
+                "_id": {
+                    "bucket": {"$dateTrunc": {"date": "$created_at", "unit": "minute"}},
+                    "event_type": "$event_type",
+                },
+                "count": {"$sum": 1},
+                "user_ids": {"$addToSet": "$user_id"},
+            }
+        },
+        {
+            "$group": {
+                "_id": "$_id.bucket",
+                "event_count": {"$sum": "$count"},
+                "event_types": {"$push": {"event_type": "$_id.event_type", "count": "$count"}},
+                "user_ids": {"$push": "$user_ids"},
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "bucket": "$_id",
+                "event_count": 1,
+                "event_types": 1,
+                "user_ids": {
+                    "$setDifference": [
+                        {
+                            "$reduce": {
+                                "input": "$user_ids",
+                                "initialValue": [],
+                                "in": {"$setUnion": ["$$value", "$$this"]},
+                            }
+                        },
+                        [None],
+                    ]
+                },
+            }
+        },
+    ]
+
+
+def user_days_pipeline(start: datetime | None, end: datetime | None = None) -> list[dict]:
+    """Сырые события ``[start, end)`` → активность пользователей по дням."""
+    match: dict = {"user_id": {"$ne": None}}
+    if start is not None or end is not None:
+        match["created_at"] = {}
+        if start is not None:
+            match["created_at"]["$gte"] = start
+        if end is not None:
+            match["created_at"]["$lt"] = end
+    return [
+        {"$match": match},
+        {
+            "$group": {
+                "_id": {
+                    "user_id": "$user_id",
+                    "day": {"$dateTrunc": {"date": "$created_at", "unit": "day"}},
+                },
+                "event_count": {"$sum": 1},
+                "last_activity": {"$max": "$created_at"},
+                "event_types": {"$addToSet": "$event_type"},
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "user_id": "$_id.user_id",
+                "day": "$_id.day",
+                "event_count": 1,
+                "last_activity": 1,
+                "event_types": 1,
+            }
+        },
+    ]
+
+
+def user_day_rollup_stages() -> list[dict]:
+    """
+    Строки ``event_log_user_rollup`` → одна строка на (user_id, day).
+
+    Строка дня (``window_start: None``) важнее строк окон: между её записью
+    и удалением окон (или при повторе окна после сжатия) есть и те и другие.
+    """
+    is_day_row = {"$eq": [{"$ifNull": ["$window_start", None]}, None]}
+    return [
+        {
+            "$group": {
+                "_id": {"user_id": "$user_id", "day": "$day"},
+                "day_count": {"$max": {"$cond": [is_day_row, "$event_count", None]}},
+                "window_count": {"$sum": {"$cond": [is_day_row, 0, "$event_count"]}},
+                "last_activity": {"$max": "$last_activity"},
+                "event_types": {"$addToSet": "$event_types"},
+            }
+        },
+        {
+            "$project": {
+                "_id": 0,
+                "user_id": "$_id.user_id",
+                "day": "$_id.day",
+                "event_count": {"$ifNull": ["$day_count", "$window_count"]},
+                "last_activity": 1,
+                "event_types": {
+                    "$reduce": {
+                        "input": "$event_types",
+                        "initialValue": [],
+                        "in": {"$setUnion": ["$$value", "$$this"]},
+                    }
+                },
+            }
+        },
+    ]
+
+
+async def read_watermark(db: AsyncIOMotorDatabase) -> datetime | None:
+    """Граница, до которой (не включая) события свёрнуты в роллапы."""
+    state = await db[STATE_COLLECTION].find_one({"_id": _STATE_ID})
+    if state is None or state.get("value") is None:
+        return None
+    return as_utc(state["value"])
+
+
+class EventLogRollupJob:
+    """
+    Background task that advances the rollup watermark.
+
+    Every ``interval_seconds`` it rolls closed minutes up to
+    ``now - delay_seconds`` (at most ``max_window`` per run). The delay must
+    cover the event log batcher's flush interval: events written with an
+    older ``created_at`` after their minute was rolled up are not counted in
+    rollups.
+
+    Every write is idempotent, so a run that failed before moving the
+    watermark can simply be repeated: minute/hour/day buckets are
+    recomputed, per-user rows are keyed by the window start and overwritten,
+    and a day closed by the run is recomputed from raw events into one row
+    per user before its window rows are deleted.
+    Only one instance runs the job at a time: the lease in the state
+    document carries the owner id, is renewed while a run is in progress,
+    and the watermark is moved and the lease released only by its owner.
+    """
+
+    def __init__(
+        self,
+        *,
+        db: AsyncIOMotorDatabase,
+        interval_seconds: float,
+        delay_seconds: float,
+        max_window: timedelta,
+    ) -> None:
+        self._db = db
+        self._interval_seconds = interval_seconds
+        self._delay = timedelta(seconds=delay_seconds)
+        self._max_window = max_window
+        self._lease = timedelta(seconds=max(interval_seconds, 60) * 5)
+        self._owner = uuid.uuid4().hex
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="event-log-rollup")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                while await self.run_once():
+                    pass
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Event log rollup failed")
+            await asyncio.sleep(self._interval_seconds)
+
+    async def run_once(self) -> bool:
+        """Свернуть очередное окно; ``True``, если есть ещё что сворачивать."""
+        now = as_utc(get_utc_now())
+        if not await self._acquire_lease(now):
+            return False
+        heartbeat = asyncio.create_task(self._keep_lease(), name="event-log-rollup-lease")
+        try:
+            start = await read_watermark(self._db) or await self._first_event_minute()
+            if start is None:
+                return False
+            target = truncate(now - self._delay, "minute")
+            end = min(target, start + self._max_window)
+            if end <= start:
+                return False
+
+            await self._roll_minutes(start, end)
+            await self._roll_coarser("minute", "hour", start, end)
+            await self._roll_coarser("hour", "day", start, end)
+            await self._roll_user_days(start, end)
+            await self._compact_user_days(start, end)
+            # Аренду могли перехватить (например, процесс завис дольше её срока) —
+            # тогда отметку двигает новый владелец, а наша работа просто повторится.
+            result = await self._db[STATE_COLLECTION].update_one(
+                {"_id": _STATE_ID, "lease_owner": self._owner}, {"$set": {"value": end}}
+            )
+            if result.matched_count == 0:
+                logger.warning("Event log rollup lease lost, watermark not moved")
+                return False
+            return end < target
+        finally:
+            heartbeat.cancel()
+            await asyncio.gather(heartbeat, return_exceptions=True)
+            await self._release_lease()
+
+    async def _first_event_minute(self) -> datetime | None:
+        doc = await self._db["event_log"].find_one(
+            {}, sort=[("created_at", 1)], projection={"created_at": 1}
+        )
+        if doc is None:
+            return None
+        return truncate(doc["created_at"], "minute")
+
+    async def _roll_minutes(self, start: datetime, end: datetime) -> None:
+        cursor = self._db["event_log"].aggregate(minute_buckets_pipeline(start, end))
+        ops = [
+            UpdateOne(
+                {"unit": "minute", "bucket": doc["bucket"]},
+                {"$set": {**doc, "unit": "minute"}},
+                upsert=True,
+            )
+            async for doc in cursor
+        ]
+        if ops:
+            await self._db[ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+
+    async def _roll_coarser(
+        self, src_unit: str, dst_unit: str, start: datetime, end: datetime
+    ) -> None:
+        # Пересчитываем затронутые бакеты целиком: бакет на границе окна
+        # будет неполным до следующего прогона, но читается только после
+        # того, как водяная отметка его пройдёт.
+        start = truncate(start, dst_unit)
+        end = ceil_to(end, dst_unit)
+        cursor = self._db[ROLLUP_COLLECTION].find(
+            {"unit": src_unit, "bucket": {"$gte": start, "$lt": end}},
+            projection={"_id": 0},
+        )
+        buckets: dict[datetime, dict] = {}
+        async for row in cursor:
+            bucket = truncate(row["bucket"], dst_unit)
+            acc = buckets.get(bucket)
+            if acc is None:
+                acc = buckets[bucket] = {
+                    "event_count": 0,
+                    "event_types": {},
+                    "users": HyperLogLog(UNIQUE_USERS_PRECISION),
+                }
+            acc["event_count"] += row["event_count"]
+            for item in row["event_types"]:
+                types = acc["event_types"]
+                types[item["event_type"]] = types.get(item["event_type"], 0) + item["count"]
+            add_users(acc["users"], row)
+
+        ops = [
+            UpdateOne(
+                {"unit": dst_unit, "bucket": bucket},
+                {
+                    "$set": {
+                        "unit": dst_unit,
+                        "bucket": bucket,
+                        "event_count": acc["event_count"],
+                        "event_types": [
+                            {"event_type": event_type, "count": count}
+                            for event_type, count in acc["event_types"].items()
+                        ],
+                        "users_hll": acc["users"].to_bytes(),
+                    },
+                    "$unset": {"user_ids": ""},
+                },
+                upsert=True,
+            )
+            for bucket, acc in buckets.items()
+        ]
+        if ops:
+            await self._db[ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+
+    async def _roll_user_days(self, start: datetime, end: datetime) -> None:
+        cursor = self._db["event_log"].aggregate(user_days_pipeline(start, end))
+        ops = [
+            # Строка на окно, а не $inc в строку дня: повтор окна перезаписывает её же.
+            UpdateOne(
+                {"user_id": doc["user_id"], "day": doc["day"], "window_start": start},
+                {"$set": {**doc, "window_start": start}},
+                upsert=True,
+            )
+            async for doc in cursor
+        ]
+        if ops:
+            await self._db[USER_ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+
+    async def _compact_user_days(self, start: datetime, end: datetime) -> None:
+        """Дни, закрытые этим окном, — в одну строку на пользователя вместо строки на окно."""
+        day = truncate(start, "day")
+        while (day_end := day + _UNIT_STEPS["day"]) <= end:
+            if day_end > start:
+                # Пересчёт по сырым событиям, а не сумма окон: повтор после удаления
+                # окон даёт тот же результат.
+                cursor = self._db["event_log"].aggregate(user_days_pipeline(day, day_end))
+                ops = [
+                    UpdateOne(
+                        {"user_id": doc["user_id"], "day": doc["day"], "window_start": None},
+                        {"$set": {**doc, "window_start": None}},
+                        upsert=True,
+                    )
+                    async for doc in cursor
+                ]
+                if ops:
+                    await self._db[USER_ROLLUP_COLLECTION].bulk_write(ops, ordered=False)
+                await self._db[USER_ROLLUP_COLLECTION].delete_many(
+                    {"day": day, "window_start": {"$ne": None}}
+                )
+            day = day_end
+
+    async def _acquire_lease(self, now: datetime) -> bool:
+        try:
+            result = await self._db[STATE_COLLECTION].update_one(
+                {
+                    "_id": _STATE_ID,
+                    "$or": [
+                        {"lease_until": {"$exists": False}},
+                        {"lease_until": None},
+                        {"lease_until": {"$lt": now}},
+                        {"lease_owner": self._owner},
+                    ],
+                },
+                {"$set": {"lease_until": now + self._lease, "lease_owner": self._owner}},
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            # Документ есть и аренда занята другим экземпляром.
+            return False
+        return result.matched_count > 0 or result.upserted_id is not None
+
+    async def _keep_lease(self) -> None:
+        """Продлевать аренду, пока идёт прогон: окно в сутки может считаться дольше её срока."""
+        while True:
+            await asyncio.sleep(self._lease.total_seconds() / 3)
+            try:
+                result = await self._db[STATE_COLLECTION].update_one(
+                    {"_id": _STATE_ID, "lease_owner": self._owner},
+                    {"$set": {"lease_until": as_utc(get_utc_now()) + self._lease}},
+                )
+            except Exception:
+                logger.warning("Failed to renew event log rollup lease", exc_info=True)
+                continue
+            if result.matched_count == 0:
+                return
+
+    async def _release_lease(self) -> None:
+        await self._db[STATE_COLLECTION].update_one(
+            {"_id": _STATE_ID, "lease_owner": self._owner},
+            {"$set": {"lease_until": None, "lease_owner": None}},
+        )
@@ -0,0 +1,363 @@
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta
+from statistics import fmean, pstdev
+
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+
+from shop.app.core.config import settings
+from shop.app.infrastructure.persistence.mongo.event_log_rollup import (
+    ROLLUP_COLLECTION,
+    ROLLUP_UNITS,
+    UNIQUE_USERS_PRECISION,
+    USER_ROLLUP_COLLECTION,
+    add_users,
+    as_utc,
+    ceil_to,
+    minute_buckets_pipeline,
+    read_watermark,
+    truncate,
+    units_for_period,
+    user_day_rollup_stages,
+    user_days_pipeline,
+)
+from shop.app.repositories.protocols import EventLogAnalyticsRepository
+from shop.app.utils.get_utc_now import get_utc_now
+from shop.app.utils.hyperloglog import HyperLogLog
+
+# (unit, start, end): бакеты роллапа ``unit`` в [start, end); unit=None — сырые события.
+Segment = tuple[str | None, datetime, datetime]
+
+
+def _split(start: datetime, end: datetime, units: tuple[str, ...]) -> list[Segment]:
+    """Покрывает [start, end) самыми крупными целыми бакетами, края — более мелкими."""
+    if start >= end:
+        return []
+    if not units:
+        return [(None, start, end)]
+    unit, finer = units[0], units[1:]
+    first, last = ceil_to(start, unit), truncate(end, unit)
+    if first >= last:
+        return _split(start, end, finer)
+    return [*_split(start, first, finer), (unit, first, last), *_split(last, end, finer)]
+
+
+def _segments(
+    start: datetime, end: datetime, watermark: datetime | None, units: tuple[str, ...]
+) -> list[Segment]:
+    rolled_end = min(end, watermark) if watermark is not None else start
+    segments = _split(start, rolled_end, units)
+    raw_start = max(start, rolled_end)
+    if raw_start < end:
+        segments.append((None, raw_start, end))
+    return segments
+
+
+def _time_range(time_from: datetime | None, time_to: datetime | None) -> tuple[datetime, datetime]:
+    """Полуоткрытый интервал; без time_from — с горизонта TTL коллекции event_log."""
+    now = as_utc(get_utc_now())
+    if time_from is not None:
+        start = as_utc(time_from)
+    else:
+        start = truncate(now - timedelta(days=settings.EVENT_LOG_TTL_DAYS), "day")
+    # time_to включительно, как в $lte исходных запросов (Mongo хранит миллисекунды).
+    end = as_utc(time_to) + timedelta(milliseconds=1) if time_to is not None else now
+    return start, end
+
+
+class EventLogAnalyticsRepositoryMongo(EventLogAnalyticsRepository):
+    """
+    Аналитика по логам событий поверх роллапов ``EventLogRollupJob``.
+
+    Целые бакеты до водяной отметки читаются из ``event_log_rollup`` /
+    ``event_log_user_rollup``; сырые события сканируются только на неровных
+    краях интервала и в ещё не свёрнутом хвосте после отметки.
+    """
+
+    # Хвост после отметки в одном запросе с роллапами пользователей ($unionWith).
+    _TOP_USERS_GROUP = {
+        "$group": {
+            "_id": "$user_id",
+            "event_count": {"$sum": "$event_count"},
+            "last_activity": {"$max": "$last_activity"},
+            "event_types": {"$addToSet": "$event_types"},
+        }
+    }
+
+    def __init__(self, db: AsyncIOMotorDatabase):
+        self._db = db
+
+    @property
+    def collection(self) -> AsyncIOMotorCollection:
+        return self._db["event_log"]
+
+    @property
+    def rollups(self) -> AsyncIOMotorCollection:
+        return self._db[ROLLUP_COLLECTION]
+
+    @property
+    def user_rollups(self) -> AsyncIOMotorCollection:
+        return self._db[USER_ROLLUP_COLLECTION]
+
+    async def _bucket_rows(
+        self, start: datetime, end: datetime, units: tuple[str, ...]
+    ) -> list[dict]:
+        """
+        Бакеты (minute/hour/day) с event_count, event_types и
+        user_ids/users_hll, покрывающие интервал.
+        """
+        watermark = await read_watermark(self._db)
+        queries = []
+        for unit, seg_start, seg_end in _segments(start, end, watermark, units):
+            if unit is None:
+                cursor = self.collection.aggregate(minute_buckets_pipeline(seg_start, seg_end))
+            else:
+                cursor = self.rollups.find(
+                    {"unit": unit, "bucket": {"$gte": seg_start, "$lt": seg_end}},
+                    projection={"_id": 0},
+                )
+            queries.append(cursor.to_list(length=None))
+        return [row for rows in await asyncio.gather(*queries) for row in rows]
+
+    async def _user_day_rows(self, time_from: datetime | None) -> list[dict]:
+        """
+        Активность (user_id, day) начиная с time_from; день на отметке приходит
+        двумя строками — из роллапа и из хвоста сырых событий.
+        """
+        watermark = await read_watermark(self._db)
+        if watermark is None:
+            pipeline = user_days_pipeline(as_utc(time_from) if time_from is not None else None)
+            return await self.collection.aggregate(pipeline).to_list(length=None)
+
+        queries = []
+        rollup_filter: dict = {}
+        tail_start = watermark
+        if time_from is not None:
+            time_from = as_utc(time_from)
+            first_day = ceil_to(time_from, "day")
+            rollup_filter["day"] = {"$gte": first_day}
+            head_end = min(first_day, watermark)
+            if time_from < head_end:
+                queries.append(
+                    self.collection.aggregate(user_days_pipeline(time_from, head_end)).to_list(
+                        length=None
+                    )
+                )
+            tail_start = max(watermark, time_from)
+        rollup_pipeline = [{"$match": rollup_filter}, *user_day_rollup_stages()]
+        queries.append(self.user_rollups.aggregate(rollup_pipeline).to_list(length=None))
+        queries.append(
+            self.collection.aggregate(user_days_pipeline(tail_start)).to_list(length=None)
+        )
+        return [row for rows in await asyncio.gather(*queries) for row in rows]
+
+    async def aggregate_activity_by_period(
+        self,
+        period: str,
+        time_from: datetime | None = None,
+        time_to: datetime | None = None,
+        exact_unique_users: bool = False,
+    ) -> list[dict]:
+        """
+        События и уникальные пользователи по периодам.
+
+        unique_users — оценка HyperLogLog (~1.6%), если период захватывает
+        часовые/дневные роллапы; с ``exact_unique_users`` считается точно по
+        сырым событиям.
+        """
+        start, end = _time_range(time_from, time_to)
+        if exact_unique_users:
+            return await self._exact_activity_by_period(period, start, end)
+
+        periods: dict[datetime, dict] = {}
+        for row in await self._bucket_rows(start, end, units_for_period(period)):
+            acc = periods.get(key := truncate(row["bucket"], period))
+            if acc is None:
+                acc = periods[key] = {
+                    "event_count": 0,
+                    "user_ids": set(),
+                    "users": HyperLogLog(UNIQUE_USERS_PRECISION),
+                    "approximate": False,
+                }
+            acc["event_count"] += row["event_count"]
+            if "users_hll" in row:
+                acc["approximate"] = True
+            else:
+                acc["user_ids"].update(row["user_ids"])
+            add_users(acc["users"], row)
+        return [
+            {
+                "period": key,
+                "event_count": acc["event_count"],
+                # Пока скетчей не было, точный ответ дёшев — множество id минут.
+                "unique_users": (
+                    acc["users"].count() if acc["approximate"] else len(acc["user_ids"])
+                ),
+            }
+            for key, acc in sorted(periods.items())
+        ]
+
+    async def _exact_activity_by_period(
+        self, period: str, start: datetime, end: datetime
+    ) -> list[dict]:
+        # Группировка (период, пользователь) вместо $addToSet: множества id
+        # не собираются в памяти одной группы, а стадии могут уйти на диск.
+        pipeline = [
+            {"$match": {"created_at": {"$gte": start, "$lt": end}}},
+            {
+                "$group": {
+                    "_id": {
+                        "period": {"$dateTrunc": {"date": "$created_at", "unit": period}},
+                        "user_id": "$user_id",
+                    },
+                    "event_count": {"$sum": 1},
+                }
+            },
+            {
+                "$group": {
+                    "_id": "$_id.period",
+                    "event_count": {"$sum": "$event_count"},
+                    "unique_users": {
+                        "$sum": {"$cond": [{"$eq": ["$_id.user_id", None]}, 0, 1]}
+                    },
+                }
+            },
+            {"$project": {"_id": 0, "period": "$_id", "event_count": 1, "unique_users": 1}},
+            {"$sort": {"period": 1}},
+        ]
+        cursor = self.collection.aggregate(pipeline, allowDiskUse=True)
+        return await cursor.to_list(length=None)
+
+    async def aggregate_top_users(self, limit: int = 10) -> list[dict]:
+        """
+        Группировка, сортировка и limit — в Mongo: в память приходят ``limit``
+        строк, а не строки всех пользователей за все дни.
+        """
+        top_stages = [
+            self._TOP_USERS_GROUP,
+            {"$sort": {"event_count": -1, "_id": 1}},
+            {"$limit": limit},
+        ]
+        watermark = await read_watermark(self._db)
+        if watermark is None:
+            cursor = self.collection.aggregate(
+                [*user_days_pipeline(None), *top_stages], allowDiskUse=True
+            )
+        else:
+            pipeline = [
+                *user_day_rollup_stages(),
+                {
+                    "$unionWith": {
+                        "coll": self.collection.name,
+                        "pipeline": user_days_pipeline(watermark),
+                    }
+                },
+                *top_stages,
+            ]
+            cursor = self.user_rollups.aggregate(pipeline, allowDiskUse=True)
+        return [
+            {
+                "user_id": row["_id"],
+                "event_count": row["event_count"],
+                "last_activity": as_utc(row["last_activity"]),
+                "event_types": sorted({t for types in row["event_types"] for t in types}),
+            }
+            async for row in cursor
+        ]
+
+    async def aggregate_event_type_stats(self) -> list[dict]:
+        start, end = _time_range(None, None)
+        counts: dict[str, int] = {}
+        for row in await self._bucket_rows(start, end, ROLLUP_UNITS):
+            for item in row["event_types"]:
+                counts[item["event_type"]] = counts.get(item["event_type"], 0) + item["count"]
+        total = sum(counts.values())
+        stats = [
+            {
+                "event_type": event_type,
+                "count": count,
+                "percentage": round(count / total * 100, 2),
+            }
+            for event_type, count in counts.items()
+        ]
+        stats.sort(key=lambda item: item["count"], reverse=True)
+        return stats
+
+    async def aggregate_time_series(
+        self,
+        time_from: datetime,
+        time_to: datetime,
+        granularity: str = "hour",  # "minute" | "hour" | "day"
+    ) -> list[dict]:
+        start, end = _time_range(time_from, time_to)
+        points: dict[datetime, int] = {}
+        for row in await self._bucket_rows(start, end, units_for_period(granularity)):
+            key = truncate(row["bucket"], granularity)
+            points[key] = points.get(key, 0) + row["event_count"]
+        return [{"timestamp": key, "count": count} for key, count in sorted(points.items())]
+
+    async def aggregate_user_anomalies(
+        self,
+        time_from: datetime,
+        std_threshold: float = 1.0,
+    ) -> list[dict]:
+        # Шаг 1: дневная активность каждого пользователя
+        daily: dict[int, dict[datetime, int]] = {}
+        for row in await self._user_day_rows(time_from):
+            days = daily.setdefault(row["user_id"], {})
+            day = as_utc(row["day"])
+            days[day] = days.get(day, 0) + row["event_count"]
+
+        anomalies = []
+        for user_id, days in daily.items():
+            # Шаг 2: статистика по пользователю
+            counts = list(days.values())
+            avg_daily = fmean(counts)
+            std_daily = pstdev(counts)
+            max_daily = max(counts)
+            # Шаг 3: отсеиваем тех, у кого max > avg + threshold * std
+            threshold = avg_daily + std_daily * std_threshold
+            if max_daily <= threshold:
+                continue
+            anomalies.append(
+                {
+                    "user_id": user_id,
+                    "avg_daily_events": round(avg_daily, 2),
+                    "std_deviation": round(std_daily, 2),
+                    "max_daily_events": max_daily,
+                    "days_active": len(counts),
+                    "anomaly_score": round(max_daily / threshold, 2),
+                }
+            )
+        anomalies.sort(key=lambda item: item["anomaly_score"], reverse=True)
+        return anomalies
+
+    async def iter_events(
+        self,
+        time_from: datetime | None = None,
+        time_to: datetime | None = None,
+        *,
+        user_id: int | None = None,
+        event_type: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        """Сырые события по возрастанию (created_at, id), курсором пачками по batch_size."""
+        query: dict = {}
+        if time_from is not None or time_to is not None:
+            query["created_at"] = {}
+            if time_from is not None:
+                query["created_at"]["$gte"] = time_from
+            if time_to is not None:
+                query["created_at"]["$lte"] = time_to
+        if user_id is not None:
+            query["user_id"] = user_id
+        if event_type is not None:
+            query["event_type"] = event_type
+        cursor = (
+            self.collection.find(query, projection={"_id": 0})
+            .sort([("created_at", 1), ("id", 1)])
+            .batch_size(batch_size)
+        )
+        async for doc in cursor:
+            doc["created_at"] = as_utc(doc["created_at"])
+            yield doc
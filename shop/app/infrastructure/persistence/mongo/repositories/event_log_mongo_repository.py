@@ -1,13 +1,25 @@
+import json
 from datetime import UTC, datetime
+from uuid import UUID
 
 from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from uuid6 import uuid7
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.core.config import settings
+from shop.app.infrastructure.persistence.mongo.count_cache import CountCache
+from shop.app.infrastructure.persistence.mongo.repositories.exceptions import (
+    RepositoryMappingError,
+)
 from shop.app.models.schemas import EventLogOut
 from shop.app.application.interfaces.persistence import EventLogRepository
 from shop.app.utils.get_utc_now import get_utc_now
 
 
+_EVENT_LOG_SORT = [("created_at", -1), ("id", -1)]
+_EVENT_LOG_SORT_REVERSED = [("created_at", 1), ("id", 1)]
+
+
 def _event_log_now() -> datetime:
     """Момент записи лога в настроенном часовом поясе (в BSON уходит тот же инстант в UTC)."""
     return get_utc_now()
@@ -42,18 +54,36 @@ def _build_filter_query(
     return query
 
 
+def _with_keyset(query: dict, cursor: PageCursor) -> dict:
+    """Добавляет к запросу условие keyset-пагинации по (created_at, id), порядок — по убыванию."""
+    if len(cursor.values) != 2:
+        raise RepositoryMappingError("Pagination cursor does not match event log sort key")
+    created_at, event_id = cursor.values
+    op = "$gt" if cursor.backward else "$lt"
+    keyset = {
+        "$or": [
+            {"created_at": {op: created_at}},
+            {"created_at": created_at, "id": {op: event_id}},
+        ]
+    }
+    return {"$and": [query, keyset]} if query else keyset
+
+
+def _count_cache_key(query: dict) -> str:
+    return json.dumps(query, sort_keys=True, default=str)
+
+
 class EventLogRepositoryMongo(EventLogRepository):
-    def __init__(self, db: AsyncIOMotorDatabase):
+    def __init__(self, db: AsyncIOMotorDatabase, count_cache: CountCache | None = None):
         self._db = db
+        # Общий для всех экземпляров репозитория (они создаются на запрос);
+        # без него итог по фильтрам считается каждый раз.
+        self._count_cache = count_cache
 
     @property
     def collection(self) -> AsyncIOMotorCollection:
         return self._db["event_log"]
 
-    @property
-    def counter_collection(self) -> AsyncIOMotorCollection:
-        return self._db["counter_collection"]
-
     def _to_out(self, doc: dict) -> EventLogOut:
         data = {k: v for k, v in doc.items() if k != "_id"}
         if (ca := data.get("created_at")) is not None:
@@ -65,7 +95,7 @@ class EventLogRepositoryMongo(EventLogRepository):
         docs = await cursor.to_list(length=limit)
         return [self._to_out(d) for d in docs]
 
-    async def get_by_id(self, event_id: int) -> EventLogOut | None:
+    async def get_by_id(self, event_id: UUID) -> EventLogOut | None:
         doc = await self.collection.find_one({"id": event_id})
         return self._to_out(doc) if doc else None
 
@@ -85,36 +115,69 @@ class EventLogRepositoryMongo(EventLogRepository):
         event_type: str | None = None,
         limit: int,
         offset: int,
+        cursor: PageCursor | None = None,
+        exact_total: bool = False,
     ) -> tuple[list[EventLogOut], int]:
+        """
+        Страница логов и общее число подходящих записей.
+
+        Без ``exact_total`` итог приблизительный: для запроса без фильтров —
+        estimated_document_count по метаданным коллекции, для фильтров —
+        count_documents, закешированный в процессе на короткое время.
+        Листать лучше через ``cursor`` (keyset), а не ``offset``.
+        """
         query = _build_filter_query(
             time_from=time_from,
             time_to=time_to,
             user_id=user_id,
             event_type=event_type,
         )
-        total = await self.collection.count_documents(query)
-        cursor = (
-            self.collection.find(query).sort("created_at", -1).skip(offset).limit(limit)
-        )
-        docs = await cursor.to_list(length=limit)
+        total = await self._count(query, exact=exact_total)
+        if cursor is None:
+            find = self.collection.find(query).sort(_EVENT_LOG_SORT).skip(offset)
+        else:
+            find = self.collection.find(_with_keyset(query, cursor)).sort(
+                _EVENT_LOG_SORT_REVERSED if cursor.backward else _EVENT_LOG_SORT
+            )
+        docs = await find.limit(limit).to_list(length=limit)
+        if cursor is not None and cursor.backward:
+            docs.reverse()
         return [self._to_out(d) for d in docs], total
 
-    async def get_next_id(self, counter_name: str):
-        result = await self.counter_collection.find_one_and_update(
-            {"_id": counter_name},
-            {"$inc": {"seq": 1}},
-            upsert=True,
-            return_document=True,
-        )
-        return result["seq"]
+    async def _count(self, query: dict, *, exact: bool) -> int:
+        if exact:
+            return await self.collection.count_documents(query)
+        if not query:
+            return await self.collection.estimated_document_count()
+        if self._count_cache is None:
+            return await self.collection.count_documents(query)
+        key = _count_cache_key(query)
+        cached = self._count_cache.get(key)
+        if cached is not None:
+            return cached
+        total = await self.collection.count_documents(query)
+        self._count_cache.set(key, total)
+        return total
 
-    async def create(self, data: dict) -> int:
-        next_id = await self.get_next_id("entity_id")
-        data["id"] = next_id
+    async def create(self, data: dict) -> UUID:
+        # UUIDv7 генерируется на месте: без общего счётчика в Mongo, а порядок
+        # id совпадает с порядком создания (нужно для keyset по (created_at, id)).
+        data["id"] = uuid7()
         data.setdefault("created_at", _event_log_now())
         await self.collection.insert_one(data)
-        return next_id
-
-    async def delete(self, event_id: int) -> bool:
+        return data["id"]
+
+    async def create_many(self, docs: list[dict]) -> list[UUID]:
+        """Пакетная вставка одним insert_many."""
+        if not docs:
+            return []
+        now = _event_log_now()
+        for doc in docs:
+            doc["id"] = uuid7()
+            doc.setdefault("created_at", now)
+        await self.collection.insert_many(docs, ordered=False)
+        return [doc["id"] for doc in docs]
+
+    async def delete(self, event_id: UUID) -> bool:
         result = await self.collection.delete_one({"id": event_id})
         return result.deleted_count > 0
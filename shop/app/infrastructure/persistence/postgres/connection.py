@@ -2,6 +2,10 @@ import asyncpg
 
 from shop.app.core.ports.base import Lifecycle
 from shop.app.core.ports.pool_provider import PoolProvider
+from shop.app.infrastructure.persistence.postgres.statements import (
+    PreparedConnection,
+    init_connection,
+)
 
 
 class PostgresInfrastructure(Lifecycle, PoolProvider):
@@ -20,10 +24,12 @@ class PostgresInfrastructure(Lifecycle, PoolProvider):
     async def connect(self) -> None:
         if self._pool is not None:
             return
-        await asyncpg.create_pool(
+        self._pool = await asyncpg.create_pool(
             dsn=self._url,
             min_size=self._min_size,
             max_size=self._max_size,
+            connection_class=PreparedConnection,
+            init=init_connection,
         )
 
     async def close(self) -> None:
@@ -0,0 +1,93 @@
+"""Routing of read-only units of work to a streaming replica."""
+
+import asyncio
+import logging
+import time
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+# Lag is zero while the WAL receiver is streaming and everything received has been
+# replayed. Otherwise it is the age of the last replayed transaction: a replica
+# whose receiver has disconnected stops receiving WAL, so "received == replayed"
+# says nothing about how far behind the primary it is. No replayed transaction
+# yet gives NULL, which is treated as unhealthy.
+# pg_stat_wal_receiver.status is visible only to roles with pg_read_all_stats;
+# for other roles it is NULL and the probe always uses the timestamp.
+_REPLICA_LAG_SQL = """
+SELECT CASE
+    WHEN EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming')
+        AND pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END AS lag_seconds;
+"""
+
+
+class ReplicaRouter:
+    """
+    Chooses the pool for read-only work.
+
+    Replica lag is probed at most once per ``check_interval_seconds`` and
+    cached; while it exceeds ``max_lag_seconds`` (or the probe fails or takes
+    longer than ``probe_timeout_seconds``) reads go to the primary pool. The
+    probe runs inline on the request that triggers it, hence the timeout.
+    """
+
+    def __init__(
+        self,
+        *,
+        primary: asyncpg.Pool,
+        replica: asyncpg.Pool | None,
+        max_lag_seconds: float,
+        check_interval_seconds: float,
+        probe_timeout_seconds: float,
+    ) -> None:
+        self._primary = primary
+        self._replica = replica
+        self._max_lag_seconds = max_lag_seconds
+        self._check_interval_seconds = check_interval_seconds
+        self._probe_timeout_seconds = probe_timeout_seconds
+        self._replica_healthy = replica is not None
+        self._checked_at: float | None = None
+
+    @property
+    def primary(self) -> asyncpg.Pool:
+        return self._primary
+
+    async def pool_for_read(self) -> tuple[asyncpg.Pool, bool]:
+        """Return ``(pool, is_replica)`` for a read-only unit of work."""
+        if self._replica is None:
+            return self._primary, False
+
+        now = time.monotonic()
+        if self._checked_at is None or now - self._checked_at >= self._check_interval_seconds:
+            self._checked_at = now
+            self._replica_healthy = await self._probe_replica()
+
+        if self._replica_healthy:
+            return self._replica, True
+        return self._primary, False
+
+    async def _probe_replica(self) -> bool:
+        try:
+            # Таймаут покрывает и ожидание соединения из пула, не только запрос.
+            async with asyncio.timeout(self._probe_timeout_seconds):
+                lag = await self._replica.fetchval(_REPLICA_LAG_SQL)
+        except TimeoutError:
+            logger.warning(
+                "Replica lag probe timed out after %ss, reading from primary",
+                self._probe_timeout_seconds,
+            )
+            return False
+        except (asyncpg.PostgresError, OSError):
+            logger.warning("Replica lag probe failed, reading from primary", exc_info=True)
+            return False
+
+        if lag is None:
+            logger.warning("Replica lag is unknown, reading from primary")
+            return False
+        if float(lag) > self._max_lag_seconds:
+            logger.warning("Replica lag %ss exceeds threshold, reading from primary", lag)
+            return False
+        return True
@@ -11,6 +11,7 @@ from shop.app.infrastructure.persistence.postgres.repositories.exceptions import
     RepositoryUnavailableError,
     RepositoryUniqueConstraintError,
 )
+from shop.app.infrastructure.persistence.postgres.statements import CATEGORY_GET_BY_ID
 from shop.app.application.interfaces.repositories import CategoryRepository
 
 
@@ -20,10 +21,7 @@ class CategoryRepositorySql(CategoryRepository):
 
     async def get_by_id(self, category_id: UUID) -> Category | None:
         try:
-            row = await self._conn.fetchrow(
-                "SELECT id, name FROM categories WHERE id = $1;",
-                category_id,
-            )
+            row = await self._conn.fetchrow_named(CATEGORY_GET_BY_ID, category_id)
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to fetch category") from exc
 
@@ -46,6 +44,23 @@ class CategoryRepositorySql(CategoryRepository):
             raise RepositoryUnavailableError("Failed to fetch categories") from exc
         return [self._map_row(row) for row in rows]
 
+    async def list_paginated(self, limit: int, offset: int) -> list[Category]:
+        try:
+            rows = await self._conn.fetch(
+                "SELECT id, name FROM categories ORDER BY id LIMIT $1 OFFSET $2;",
+                limit,
+                offset,
+            )
+        except asyncpg.PostgresError as exc:
+            raise RepositoryUnavailableError("Failed to fetch categories") from exc
+        return [self._map_row(row) for row in rows]
+
+    async def count(self) -> int:
+        try:
+            return await self._conn.fetchval("SELECT COUNT(*) FROM categories;")
+        except asyncpg.PostgresError as exc:
+            raise RepositoryUnavailableError("Failed to count categories") from exc
+
     async def add(self, category: Category) -> None:
         try:
             await self._conn.execute(
@@ -0,0 +1,27 @@
+"""JSONB (de)serialization of image derivatives shared by SQL repositories."""
+
+import json
+from collections.abc import Iterable
+from typing import Any
+
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
+
+
+def dump_derivatives(derivatives: Iterable[ImageDerivative]) -> str:
+    return json.dumps(
+        [
+            {"width": item.width, "format": item.format, "key": str(item.storage_key)}
+            for item in derivatives
+        ]
+    )
+
+
+def load_derivatives(raw: Any) -> tuple[ImageDerivative, ...]:
+    # Без кодека asyncpg отдаёт jsonb строкой; NULL — у строк до появления колонки.
+    if raw is None:
+        return ()
+    items = json.loads(raw) if isinstance(raw, (str, bytes)) else raw
+    return tuple(
+        ImageDerivative(width=item["width"], format=item["format"], storage_key=item["key"])
+        for item in items
+    )
@@ -0,0 +1,41 @@
+"""Keyset (seek) pagination helpers shared by SQL repositories."""
+
+from collections.abc import Sequence
+from typing import Any
+
+from shop.app.application.dto.pagination import PageCursor
+from shop.app.core.exceptions import DomainValidationError
+
+
+def keyset_clause(
+    columns: Sequence[str],
+    cursor: PageCursor,
+    *,
+    descending: bool,
+    first_param: int,
+) -> tuple[str, str, list[Any]]:
+    """
+    Build the seek predicate and ORDER BY for a page relative to ``cursor``.
+
+    Returns ``(predicate, order_by, params)``; the predicate uses positional
+    parameters starting at ``$first_param``. For backward pages the order is
+    inverted, so callers must reverse the fetched rows (see ``restore_order``).
+    """
+    if len(cursor.values) != len(columns):
+        raise DomainValidationError("Pagination cursor does not match listing sort key")
+
+    forward_desc = descending != cursor.backward
+    operator = "<" if forward_desc else ">"
+    direction = "DESC" if forward_desc else "ASC"
+
+    placeholders = ", ".join(f"${first_param + i}" for i in range(len(columns)))
+    predicate = f"({', '.join(columns)}) {operator} ({placeholders})"
+    order_by = ", ".join(f"{column} {direction}" for column in columns)
+    return predicate, order_by, list(cursor.values)
+
+
+def restore_order(rows: list, cursor: PageCursor | None) -> list:
+    """Return rows in listing order regardless of the direction they were fetched in."""
+    if cursor is not None and cursor.backward:
+        return rows[::-1]
+    return rows
@@ -1,105 +1,95 @@
+from collections import defaultdict
+from collections.abc import Sequence
 from decimal import Decimal
+from typing import Any
 from uuid import UUID
 
 from shop.app.domain.entities.order import Order, OrderItem, OrderStatus, PaymentStatus
 from shop.app.domain.value_objects.price import Price
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.application.interfaces.repositories import OrderRepository
+from shop.app.infrastructure.persistence.postgres.repositories.keyset import (
+    keyset_clause,
+    restore_order,
+)
+
+_ORDER_KEYSET_COLUMNS = ("o.created_at", "o.id")
+
+_ORDER_SELECT = """
+    SELECT o.id, o.user_id, o.order_number, o.status, o.total_amount,
+           o.shipping_address, o.payment_method, o.payment_status, o.created_at
+    FROM orders o
+"""
+
+_ORDER_WITH_ITEMS_SELECT = """
+    SELECT
+        o.id,
+        o.user_id,
+        o.order_number,
+        o.status,
+        o.total_amount,
+        o.shipping_address,
+        o.payment_method,
+        o.payment_status,
+        o.created_at,
+        oi.id AS item_id,
+        oi.product_id,
+        oi.quantity,
+        oi.unit_price
+    FROM orders o
+    LEFT JOIN orders_items oi ON oi.order_id = o.id
+"""
 
 
 class OrderRepositorySql(OrderRepository):
+    """
+    Order pages are loaded in two round-trips: one LIMITed query over ``orders``
+    (so a page always holds ``limit`` orders) and one batched ``ANY($1)`` query
+    for the lines of every order on the page.
+    """
+
     def __init__(self, conn):
         self._conn = conn
 
-    async def get_all(self, limit: int, offset: int) -> list[Order]:
-        rows = await self._conn.fetch(
-            """
-            SELECT
-                o.id AS order_id,
-                o.user_id,
-                o.order_number,
-                o.status,
-                o.total_amount,
-                o.shipping_address,
-                o.payment_method,
-                o.payment_status,
-                o.created_at,
-                oi.id AS item_id,
-                oi.product_id,
-                oi.quantity,
-                oi.unit_price
-            FROM orders o
-            LEFT JOIN orders_items oi ON oi.order_id = o.id
-            ORDER BY o.created_at DESC, oi.id
-            LIMIT $1 OFFSET $2;
-            """,
-            limit,
-            offset,
-        )
-        return self._map_orders(rows)
+    async def get_all(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Order]:
+        return await self._list_page("", [], limit=limit, offset=offset, cursor=cursor)
 
     async def get_total(self) -> int:
         row = await self._conn.fetchrow("SELECT COUNT(*) AS total FROM orders;")
         return row["total"]
 
     async def get_by_id(self, order_id: UUID) -> Order | None:
-        row = await self._conn.fetchrow(
-            """
-            SELECT o.id, o.user_id, o.order_number, o.status, o.total_amount,
-                   o.shipping_address, o.payment_method, o.payment_status, o.created_at
-            FROM orders o
-            WHERE o.id = $1;
-            """,
-            order_id,
-        )
-        if not row:
-            return None
-        return await self._map_order(row)
+        return await self._get_one("o.id = $1", order_id)
 
     async def get_by_order_number(self, order_number: str) -> Order | None:
-        row = await self._conn.fetchrow(
-            """
-            SELECT o.id, o.user_id, o.order_number, o.status, o.total_amount,
-                   o.shipping_address, o.payment_method, o.payment_status, o.created_at
-            FROM orders o
-            WHERE o.order_number = $1;
-            """,
-            order_number,
-        )
-        if not row:
-            return None
-        return await self._map_order(row)
+        return await self._get_one("o.order_number = $1", order_number)
 
-    async def list_for_user(self, user_id: UUID, limit: int, offset: int) -> list[Order]:
+    async def get_many(self, order_ids: Sequence[UUID]) -> list[Order]:
+        if not order_ids:
+            return []
         rows = await self._conn.fetch(
-            """
-            SELECT
-                o.id AS order_id,
-                o.user_id,
-                o.order_number,
-                o.status,
-                o.total_amount,
-                o.shipping_address,
-                o.payment_method,
-                o.payment_status,
-                o.created_at,
-                oi.id AS item_id,
-                oi.product_id,
-                oi.quantity,
-                oi.unit_price
-            FROM orders o
-            LEFT JOIN orders_items oi ON oi.order_id = o.id
-            WHERE o.user_id = $1
-            ORDER BY o.created_at DESC, oi.id
-            LIMIT $2 OFFSET $3;
+            f"""
+            {_ORDER_SELECT}
+            WHERE o.id = ANY($1)
+            ORDER BY o.created_at DESC, o.id DESC;
             """,
-            user_id,
-            limit,
-            offset,
+            list(order_ids),
         )
-        return self._map_orders(rows)
+        return await self._attach_items(rows)
 
-    async def list_paginated(self, limit: int, offset: int) -> list[Order]:
-        return await self.get_all(limit, offset)
+    async def list_for_user(
+        self, user_id: UUID, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Order]:
+        return await self._list_page(
+            "o.user_id = $1", [user_id], limit=limit, offset=offset, cursor=cursor
+        )
+
+    async def list_paginated(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Order]:
+        return await self.get_all(limit, offset, cursor)
 
     async def add(self, order: Order) -> None:
         await self._conn.execute(
@@ -166,26 +156,104 @@ class OrderRepositorySql(OrderRepository):
         )
         return result["id"]
 
-    async def _map_order(self, row) -> Order | None:
+    async def _get_one(self, condition: str, value: Any) -> Order | None:
+        # A single order fits in one joined round-trip; its lines bound the row count.
+        rows = await self._conn.fetch(
+            f"""
+            {_ORDER_WITH_ITEMS_SELECT}
+            WHERE {condition}
+            ORDER BY oi.id;
+            """,
+            value,
+        )
+        if not rows:
+            return None
+        items = [
+            self._map_item(row, order_id=row["id"], item_id=row["item_id"])
+            for row in rows
+            if row["item_id"] is not None
+        ]
+        return self._map_order(rows[0], items)
+
+    async def _list_page(
+        self,
+        condition: str,
+        args: list[Any],
+        *,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None,
+    ) -> list[Order]:
+        limit_param = len(args) + 1
+        if cursor is None:
+            where = f"WHERE {condition}" if condition else ""
+            rows = await self._conn.fetch(
+                f"""
+                {_ORDER_SELECT}
+                {where}
+                ORDER BY o.created_at DESC, o.id DESC
+                LIMIT ${limit_param} OFFSET ${limit_param + 1};
+                """,
+                *args,
+                limit,
+                offset,
+            )
+            return await self._attach_items(rows)
+
+        predicate, order_by, params = keyset_clause(
+            _ORDER_KEYSET_COLUMNS, cursor, descending=True, first_param=limit_param + 1
+        )
+        where = f"WHERE {condition} AND {predicate}" if condition else f"WHERE {predicate}"
+        rows = await self._conn.fetch(
+            f"""
+            {_ORDER_SELECT}
+            {where}
+            ORDER BY {order_by}
+            LIMIT ${limit_param};
+            """,
+            *args,
+            limit,
+            *params,
+        )
+        return await self._attach_items(restore_order(rows, cursor))
+
+    async def _attach_items(self, order_rows) -> list[Order]:
+        if not order_rows:
+            return []
         item_rows = await self._conn.fetch(
             """
             SELECT id, order_id, product_id, quantity, unit_price
             FROM orders_items
-            WHERE order_id = $1
-            ORDER BY id;
+            WHERE order_id = ANY($1)
+            ORDER BY order_id, id;
             """,
-            row["id"],
+            [row["id"] for row in order_rows],
         )
-        items = [
-            OrderItem(
-                id=item["id"],
-                order_id=item["order_id"],
-                product_id=item["product_id"],
-                quantity=item["quantity"],
-                unit_price=Price(Decimal(str(item["unit_price"])), "USD"),
+        items_by_order: dict[UUID, list[OrderItem]] = defaultdict(list)
+        for item in item_rows:
+            items_by_order[item["order_id"]].append(
+                self._map_item(item, order_id=item["order_id"], item_id=item["id"])
             )
-            for item in item_rows
-        ]
+
+        result: list[Order] = []
+        for row in order_rows:
+            order = self._map_order(row, items_by_order.get(row["id"], []))
+            if order is not None:
+                result.append(order)
+        return result
+
+    @staticmethod
+    def _map_item(row, *, order_id: UUID, item_id: UUID) -> OrderItem:
+        return OrderItem(
+            id=item_id,
+            order_id=order_id,
+            product_id=row["product_id"],
+            quantity=row["quantity"],
+            unit_price=Price(Decimal(str(row["unit_price"])), "USD"),
+        )
+
+    @staticmethod
+    def _map_order(row, items: list[OrderItem]) -> Order | None:
         if not items:
             return None
         return Order(
@@ -199,51 +267,3 @@ class OrderRepositorySql(OrderRepository):
             items=items,
             created_at=row["created_at"],
         )
-
-    @staticmethod
-    def _map_orders(rows) -> list[Order]:
-        grouped: dict[UUID, dict] = {}
-        for row in rows:
-            order_id = row["order_id"]
-            entry = grouped.get(order_id)
-            if entry is None:
-                entry = {
-                    "user_id": row["user_id"],
-                    "order_number": row["order_number"],
-                    "status": row["status"],
-                    "payment_status": row["payment_status"],
-                    "shipping_address": row["shipping_address"],
-                    "payment_method": row["payment_method"],
-                    "created_at": row["created_at"],
-                    "items": [],
-                }
-                grouped[order_id] = entry
-            if row["item_id"] is not None:
-                entry["items"].append(
-                    OrderItem(
-                        id=row["item_id"],
-                        order_id=order_id,
-                        product_id=row["product_id"],
-                        quantity=row["quantity"],
-                        unit_price=Price(Decimal(str(row["unit_price"])), "USD"),
-                    )
-                )
-
-        result: list[Order] = []
-        for order_id, data in grouped.items():
-            if not data["items"]:
-                continue
-            result.append(
-                Order(
-                    id=order_id,
-                    user_id=data["user_id"],
-                    order_number=data["order_number"],
-                    status=OrderStatus(str(data["status"])),
-                    payment_status=PaymentStatus(str(data["payment_status"])),
-                    shipping_address=data["shipping_address"] or "n/a",
-                    payment_method=data["payment_method"] or "n/a",
-                    items=data["items"],
-                    created_at=data["created_at"],
-                )
-            )
-        return result
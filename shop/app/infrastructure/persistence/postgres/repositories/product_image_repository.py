@@ -6,6 +6,7 @@ import asyncpg
 from shop.app.domain.entities.product_image import (
     ProductImage,
 )
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
 from shop.app.infrastructure.persistence.postgres.repositories.exceptions import (
     RepositoryUnavailableError,
     RepositoryMappingError,
@@ -13,6 +14,10 @@ from shop.app.infrastructure.persistence.postgres.repositories.exceptions import
     RepositoryForeignKeyError,
     RepositoryUniqueConstraintError,
 )
+from shop.app.infrastructure.persistence.postgres.repositories.image_derivatives import (
+    dump_derivatives,
+    load_derivatives,
+)
 from shop.app.application.interfaces.repositories import ProductImageRepository
 
 
@@ -24,7 +29,7 @@ class ProductImageRepositorySql(ProductImageRepository):
         try:
             rows = await self._conn.fetch(
                 """
-                SELECT id, product_id, storage_key
+                SELECT id, product_id, storage_key, derivatives
                 FROM product_images
                 WHERE product_id = $1
                 ORDER BY id;
@@ -39,7 +44,11 @@ class ProductImageRepositorySql(ProductImageRepository):
     async def get_by_id(self, image_id: UUID) -> ProductImage | None:
         try:
             row = await self._conn.fetchrow(
-                "SELECT id, product_id, storage_key FROM product_images WHERE id = $1;",
+                """
+                SELECT id, product_id, storage_key, derivatives
+                FROM product_images
+                WHERE id = $1;
+                """,
                 image_id,
             )
         except asyncpg.PostgresError as exc:
@@ -51,11 +60,12 @@ class ProductImageRepositorySql(ProductImageRepository):
         try:
             await self._conn.execute(
                 """
-                INSERT INTO product_images (product_id, storage_key)
-                VALUES ($1, $2)
+                INSERT INTO product_images (product_id, storage_key, derivatives)
+                VALUES ($1, $2, $3::jsonb)
                 """,
                 image.product_id,
                 image.storage_key,
+                dump_derivatives(image.derivatives),
             )
         except asyncpg.ForeignKeyViolationError as exc:
             raise RepositoryForeignKeyError("Product does not exist") from exc
@@ -72,7 +82,12 @@ class ProductImageRepositorySql(ProductImageRepository):
                 """
                 UPDATE product_images
                 SET product_id = $2,
-                    storage_key = $3
+                    storage_key = $3,
+                    -- производные пишет только пайплайн; при смене ключа они устаревают
+                    derivatives = CASE
+                        WHEN storage_key = $3 THEN derivatives
+                        ELSE '[]'::jsonb
+                    END
                 WHERE id = $1
                 """,
                 image.id,
@@ -88,6 +103,24 @@ class ProductImageRepositorySql(ProductImageRepository):
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to update product image") from exc
 
+    async def set_derivatives(
+        self, storage_key: str, derivatives: tuple[ImageDerivative, ...]
+    ) -> int:
+        try:
+            result = await self._conn.execute(
+                """
+                UPDATE product_images
+                SET derivatives = $2::jsonb
+                WHERE storage_key = $1
+                """,
+                storage_key,
+                dump_derivatives(derivatives),
+            )
+        except asyncpg.PostgresError as exc:
+            raise RepositoryUnavailableError("Failed to record image derivatives") from exc
+
+        return int(result.split()[-1])
+
     async def delete(self, image_id: UUID) -> None:
         try:
             await self._conn.execute(
@@ -107,7 +140,7 @@ class ProductImageRepositorySql(ProductImageRepository):
                 """
                 DELETE FROM product_images
                 WHERE product_id = $1
-                RETURNING id, product_id, storage_key;
+                RETURNING id, product_id, storage_key, derivatives;
                 """,
                 product_id,
             )
@@ -128,7 +161,7 @@ class ProductImageRepositorySql(ProductImageRepository):
         await self.add(image_data)
         row = await self._conn.fetchrow(
             """
-            SELECT id, product_id, storage_key
+            SELECT id, product_id, storage_key, derivatives
             FROM product_images
             WHERE product_id = $1 AND storage_key = $2
             ORDER BY id DESC
@@ -151,6 +184,7 @@ class ProductImageRepositorySql(ProductImageRepository):
                 id=row["id"],
                 product_id=row["product_id"],
                 storage_key=row["storage_key"],
+                derivatives=load_derivatives(row["derivatives"]),
             )
         except (KeyError, TypeError, ValueError) as exc:
             raise RepositoryMappingError("Product image row has invalid shape") from exc
@@ -4,7 +4,9 @@ from uuid import UUID
 
 import asyncpg
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.domain.entities.product import Product
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
 from shop.app.infrastructure.persistence.postgres.repositories.exceptions import (
     RepositoryForeignKeyError,
     RepositoryMappingError,
@@ -12,6 +14,18 @@ from shop.app.infrastructure.persistence.postgres.repositories.exceptions import
     RepositoryUniqueConstraintError,
     RepositoryUnavailableError,
 )
+from shop.app.infrastructure.persistence.postgres.repositories.image_derivatives import (
+    dump_derivatives,
+    load_derivatives,
+)
+from shop.app.infrastructure.persistence.postgres.repositories.keyset import (
+    keyset_clause,
+    restore_order,
+)
+from shop.app.infrastructure.persistence.postgres.statements import (
+    PRODUCT_EXISTS_BY_ID,
+    PRODUCT_GET_BY_ID,
+)
 from shop.app.application.interfaces.repositories import ProductRepository
 
 
@@ -21,36 +35,57 @@ class ProductRepositorySql(ProductRepository):
 
     async def get_by_id(self, product_id: UUID) -> Product | None:
         try:
-            row = await self._conn.fetchrow(
-                """
-                SELECT id, title, description, price, stock, brand, thumbnail_key, is_published, category_id
-                FROM products
-                WHERE id = $1;
-                """,
-                product_id,
-            )
+            row = await self._conn.fetchrow_named(PRODUCT_GET_BY_ID, product_id)
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to fetch product") from exc
 
         return self._map_row(row) if row else None
 
-    async def list_published(self, limit: int, offset: int) -> list[Product]:
+    async def list_published(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]:
         try:
-            rows = await self._conn.fetch(
-                """
-                SELECT id, title, description, price, stock, brand, thumbnail_key, is_published, category_id
-                FROM products
-                WHERE is_published = TRUE
-                ORDER BY id
-                LIMIT $1 OFFSET $2;
-                """,
-                limit,
-                offset,
-            )
+            if cursor is None:
+                rows = await self._conn.fetch(
+                    """
+                    SELECT id, title, description, price, stock, brand,
+                           thumbnail_key, thumbnail_derivatives, is_published, category_id
+                    FROM products
+                    WHERE is_published = TRUE
+                    ORDER BY id
+                    LIMIT $1 OFFSET $2;
+                    """,
+                    limit,
+                    offset,
+                )
+            else:
+                predicate, order_by, params = keyset_clause(
+                    ("id",), cursor, descending=False, first_param=2
+                )
+                rows = await self._conn.fetch(
+                    f"""
+                    SELECT id, title, description, price, stock, brand,
+                           thumbnail_key, thumbnail_derivatives, is_published, category_id
+                    FROM products
+                    WHERE is_published = TRUE AND {predicate}
+                    ORDER BY {order_by}
+                    LIMIT $1;
+                    """,
+                    limit,
+                    *params,
+                )
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to fetch products") from exc
 
-        return [self._map_row(row) for row in rows]
+        return [self._map_row(row) for row in restore_order(rows, cursor)]
+
+    async def count_published(self) -> int:
+        try:
+            return await self._conn.fetchval(
+                "SELECT COUNT(*) FROM products WHERE is_published = TRUE;"
+            )
+        except asyncpg.PostgresError as exc:
+            raise RepositoryUnavailableError("Failed to count products") from exc
 
     async def get_total(self) -> int:
         try:
@@ -64,7 +99,8 @@ class ProductRepositorySql(ProductRepository):
         try:
             rows = await self._conn.fetch(
                 """
-                SELECT id, title, description, price, stock, brand, thumbnail_key, is_published, category_id
+                SELECT id, title, description, price, stock, brand,
+                       thumbnail_key, thumbnail_derivatives, is_published, category_id
                 FROM products
                 WHERE category_id = $1
                 ORDER BY id;
@@ -112,6 +148,11 @@ class ProductRepositorySql(ProductRepository):
                     stock = $5,
                     brand = $6,
                     thumbnail_key = $7,
+                    -- производные старой миниатюры не подходят новой; пайплайн запишет свои
+                    thumbnail_derivatives = CASE
+                        WHEN thumbnail_key = $7 THEN thumbnail_derivatives
+                        ELSE '[]'::jsonb
+                    END,
                     is_published = $8,
                     category_id = $9,
                     updated_at = NOW()
@@ -134,6 +175,24 @@ class ProductRepositorySql(ProductRepository):
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to update product") from exc
 
+    async def set_thumbnail_derivatives(
+        self, thumbnail_key: str, derivatives: tuple[ImageDerivative, ...]
+    ) -> int:
+        try:
+            result = await self._conn.execute(
+                """
+                UPDATE products
+                SET thumbnail_derivatives = $2::jsonb
+                WHERE thumbnail_key = $1
+                """,
+                thumbnail_key,
+                dump_derivatives(derivatives),
+            )
+        except asyncpg.PostgresError as exc:
+            raise RepositoryUnavailableError("Failed to record thumbnail derivatives") from exc
+
+        return int(result.split()[-1])
+
     async def delete(self, product_id: UUID) -> None:
         try:
             await self._conn.execute(
@@ -146,8 +205,10 @@ class ProductRepositorySql(ProductRepository):
             raise RepositoryUnavailableError("Failed to delete product") from exc
 
     # Backward-compatible aliases.
-    async def get_all(self, limit: int, offset: int) -> list[Product]:
-        return await self.list_published(limit, offset)
+    async def get_all(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]:
+        return await self.list_published(limit, offset, cursor)
 
     async def create(self, product_data) -> Product:
         created = await self._conn.fetchrow(
@@ -156,7 +217,8 @@ class ProductRepositorySql(ProductRepository):
                 title, description, price, stock, brand, thumbnail_key, is_published, category_id
             )
             VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            RETURNING id, title, description, price, stock, brand, thumbnail_key, is_published, category_id;
+            RETURNING id, title, description, price, stock, brand,
+                      thumbnail_key, thumbnail_derivatives, is_published, category_id;
             """,
             product_data.title,
             product_data.description,
@@ -173,10 +235,7 @@ class ProductRepositorySql(ProductRepository):
 
     async def exists_product_with_id(self, product_id: UUID) -> bool:
         try:
-            row = await self._conn.fetchrow(
-                "SELECT EXISTS(SELECT 1 FROM products WHERE id = $1) AS exists;",
-                product_id,
-            )
+            row = await self._conn.fetchrow_named(PRODUCT_EXISTS_BY_ID, product_id)
         except asyncpg.PostgresError as exc:
             raise RepositoryUnavailableError("Failed to check product") from exc
 
@@ -201,6 +260,7 @@ class ProductRepositorySql(ProductRepository):
                 is_published=row["is_published"],
                 category_id=row["category_id"],
                 thumbnail_key=thumbnail_key,
+                thumbnail_derivatives=load_derivatives(row["thumbnail_derivatives"]),
             )
         except (KeyError, TypeError, ValueError) as exc:
             raise RepositoryMappingError("Product row has invalid shape") from exc
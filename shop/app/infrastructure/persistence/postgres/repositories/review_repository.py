@@ -1,28 +1,55 @@
 from uuid import UUID
 
 from shop.app.domain.entities.review import Review
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.application.interfaces.repositories import ReviewRepository
+from shop.app.infrastructure.persistence.postgres.repositories.keyset import (
+    keyset_clause,
+    restore_order,
+)
 
 
 class ReviewRepositorySql(ReviewRepository):
     def __init__(self, conn):
         self._conn = conn
 
-    async def list_paginated(self, limit: int, offset: int) -> list[Review]:
+    async def list_paginated(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Review]:
+        if cursor is None:
+            rows = await self._conn.fetch(
+                """
+                SELECT r.id, r.user_id, u.username, r.product_id, p.title AS product_title,
+                       r.title, r.description, r.rating, r.created_at, r.updated_at
+                FROM reviews r
+                LEFT JOIN users u ON r.user_id = u.id
+                LEFT JOIN products p ON r.product_id = p.id
+                ORDER BY r.id
+                LIMIT $1 OFFSET $2;
+                """,
+                limit,
+                offset,
+            )
+            return [self._map_review(row) for row in rows]
+
+        predicate, order_by, params = keyset_clause(
+            ("r.id",), cursor, descending=False, first_param=2
+        )
         rows = await self._conn.fetch(
-            """
+            f"""
             SELECT r.id, r.user_id, u.username, r.product_id, p.title AS product_title,
                    r.title, r.description, r.rating, r.created_at, r.updated_at
             FROM reviews r
             LEFT JOIN users u ON r.user_id = u.id
             LEFT JOIN products p ON r.product_id = p.id
-            ORDER BY r.id
-            LIMIT $1 OFFSET $2;
+            WHERE {predicate}
+            ORDER BY {order_by}
+            LIMIT $1;
             """,
             limit,
-            offset,
+            *params,
         )
-        return [self._map_review(row) for row in rows]
+        return [self._map_review(row) for row in restore_order(rows, cursor)]
 
     async def get_by_id(self, review_id: UUID) -> Review | None:
         row = await self._conn.fetchrow(
@@ -57,20 +84,40 @@ class ReviewRepositorySql(ReviewRepository):
         )
         return self._map_review(row) if row else None
 
-    async def list_by_product(self, product_id: UUID, limit: int, offset: int) -> list[Review]:
+    async def list_by_product(
+        self, product_id: UUID, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Review]:
+        if cursor is None:
+            rows = await self._conn.fetch(
+                """
+                SELECT r.id, r.user_id, r.product_id, r.title, r.description, r.rating, r.created_at, r.updated_at
+                FROM reviews r
+                WHERE r.product_id = $1
+                ORDER BY r.id
+                LIMIT $2 OFFSET $3;
+                """,
+                product_id,
+                limit,
+                offset,
+            )
+            return [self._map_review(row) for row in rows]
+
+        predicate, order_by, params = keyset_clause(
+            ("r.id",), cursor, descending=False, first_param=3
+        )
         rows = await self._conn.fetch(
-            """
+            f"""
             SELECT r.id, r.user_id, r.product_id, r.title, r.description, r.rating, r.created_at, r.updated_at
             FROM reviews r
-            WHERE r.product_id = $1
-            ORDER BY r.id
-            LIMIT $2 OFFSET $3;
+            WHERE r.product_id = $1 AND {predicate}
+            ORDER BY {order_by}
+            LIMIT $2;
             """,
             product_id,
             limit,
-            offset,
+            *params,
         )
-        return [self._map_review(row) for row in rows]
+        return [self._map_review(row) for row in restore_order(rows, cursor)]
 
     async def add(self, review: Review) -> None:
         await self._conn.execute(
@@ -122,8 +169,10 @@ class ReviewRepositorySql(ReviewRepository):
             review_id,
         )
 
-    async def get_all(self, limit: int, offset: int) -> list[Review]:
-        return await self.list_paginated(limit, offset)
+    async def get_all(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Review]:
+        return await self.list_paginated(limit, offset, cursor)
 
     @staticmethod
     def _map_review(row) -> Review:
@@ -4,34 +4,39 @@ from shop.app.domain.entities.permission import Permission
 from shop.app.domain.entities.role import Role
 from shop.app.application.interfaces.repositories import RoleRepository
 
+# Роль и её права одним запросом; LEFT JOIN оставляет роли без прав.
+_ROLES_WITH_PERMISSIONS = """
+    SELECT
+        r.id AS role_id,
+        r.name AS role_name,
+        p.id AS permission_id,
+        p.name AS permission_name
+    FROM roles r
+    LEFT JOIN role_permissions rp ON rp.role_id = r.id
+    LEFT JOIN permissions p ON p.id = rp.permission_id
+"""
+
 
 class RoleRepositorySql(RoleRepository):
     def __init__(self, conn):
         self._conn = conn
 
     async def list_all(self) -> list[Role]:
-        rows = await self._conn.fetch(
-            """
-            SELECT
-                r.id AS role_id,
-                r.name AS role_name,
-                p.id AS permission_id,
-                p.name AS permission_name
-            FROM roles r
-            LEFT JOIN role_permissions rp ON rp.role_id = r.id
-            LEFT JOIN permissions p ON p.id = rp.permission_id
-            ORDER BY r.id;
-            """
-        )
+        rows = await self._conn.fetch(f"{_ROLES_WITH_PERMISSIONS} ORDER BY r.id;")
         return self._map_roles_with_permissions(rows)
 
     async def get_by_id(self, role_id: UUID) -> Role | None:
-        row = await self._conn.fetchrow("SELECT id, name FROM roles WHERE id = $1;", role_id)
-        return await self._hydrate_role(row) if row else None
+        rows = await self._conn.fetch(f"{_ROLES_WITH_PERMISSIONS} WHERE r.id = $1;", role_id)
+        roles = self._map_roles_with_permissions(rows)
+        return roles[0] if roles else None
 
     async def get_by_name(self, name: str) -> Role | None:
-        row = await self._conn.fetchrow("SELECT id, name FROM roles WHERE name = $1;", name)
-        return await self._hydrate_role(row) if row else None
+        rows = await self._conn.fetch(f"{_ROLES_WITH_PERMISSIONS} WHERE r.name = $1;", name)
+        roles = self._map_roles_with_permissions(rows)
+        return roles[0] if roles else None
+
+    async def get_policy_version(self) -> int:
+        return await self._conn.fetchval("SELECT version FROM access_policy_version;")
 
     async def add(self, role: Role) -> None:
         await self._conn.execute(
@@ -69,19 +74,6 @@ class RoleRepositorySql(RoleRepository):
         )
         return result["exists"]
 
-    async def _hydrate_role(self, row) -> Role:
-        permission_rows = await self._conn.fetch(
-            """
-            SELECT p.id, p.name
-            FROM permissions p
-            JOIN role_permissions rp ON rp.permission_id = p.id
-            WHERE rp.role_id = $1;
-            """,
-            row["id"],
-        )
-        permissions = {Permission(id=p["id"], name=p["name"]) for p in permission_rows}
-        return Role(id=row["id"], name=row["name"], permissions=permissions)
-
     @staticmethod
     def _map_roles_with_permissions(rows) -> list[Role]:
         roles_map: dict[UUID, dict] = {}
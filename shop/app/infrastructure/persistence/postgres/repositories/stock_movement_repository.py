@@ -2,9 +2,14 @@ from datetime import datetime
 from typing import Any, Mapping
 from uuid import UUID
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.application.interfaces.repositories import StockMovementRepository
 from shop.app.domain import StockMovement
 from shop.app.domain.entities.stock_movement import MovementReason
+from shop.app.infrastructure.persistence.postgres.repositories.keyset import (
+    keyset_clause,
+    restore_order,
+)
 
 
 class StockMovementRepositorySql(StockMovementRepository):
@@ -29,55 +34,37 @@ class StockMovementRepositorySql(StockMovementRepository):
         )
 
     async def list_by_warehouse(
-        self, warehouse_id: UUID, limit: int, offset: int
+        self,
+        warehouse_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
-        rows = await self._conn.fetch(
-            """
-            SELECT id, product_id, warehouse_id, amount, reason, created_at, product_variant_id
-            FROM stock_movements
-            WHERE warehouse_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3;
-            """,
-            warehouse_id,
-            limit,
-            offset,
+        return await self._list_where(
+            "warehouse_id = $1", [warehouse_id], limit=limit, offset=offset, cursor=cursor
         )
-        return [self._map_row(row) for row in rows]
 
     async def list_by_product(
-        self, product_id: UUID, limit: int, offset: int
+        self,
+        product_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
-        rows = await self._conn.fetch(
-            """
-            SELECT id, product_id, warehouse_id, amount, reason, created_at, product_variant_id
-            FROM stock_movements
-            WHERE product_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3;
-            """,
-            product_id,
-            limit,
-            offset,
+        return await self._list_where(
+            "product_id = $1", [product_id], limit=limit, offset=offset, cursor=cursor
         )
-        return [self._map_row(row) for row in rows]
 
     async def list_by_variant(
-        self, variant_id: UUID, limit: int, offset: int
+        self,
+        variant_id: UUID,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
-        rows = await self._conn.fetch(
-            """
-            SELECT id, product_id, warehouse_id, amount, reason, created_at, product_variant_id
-            FROM stock_movements
-            WHERE product_variant_id = $1
-            ORDER BY created_at DESC
-            LIMIT $2 OFFSET $3;
-            """,
-            variant_id,
-            limit,
-            offset,
+        return await self._list_where(
+            "product_variant_id = $1", [variant_id], limit=limit, offset=offset, cursor=cursor
         )
-        return [self._map_row(row) for row in rows]
 
     async def list_by_period(
         self,
@@ -86,21 +73,57 @@ class StockMovementRepositorySql(StockMovementRepository):
         *,
         limit: int,
         offset: int,
+        cursor: PageCursor | None = None,
     ) -> list[StockMovement]:
+        return await self._list_where(
+            "created_at >= $1 AND created_at <= $2",
+            [time_from, time_to],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+        )
+
+    async def _list_where(
+        self,
+        condition: str,
+        args: list[Any],
+        *,
+        limit: int,
+        offset: int,
+        cursor: PageCursor | None,
+    ) -> list[StockMovement]:
+        limit_param = len(args) + 1
+        if cursor is None:
+            rows = await self._conn.fetch(
+                f"""
+                SELECT id, product_id, warehouse_id, amount, reason, created_at, product_variant_id
+                FROM stock_movements
+                WHERE {condition}
+                ORDER BY created_at DESC, id DESC
+                LIMIT ${limit_param} OFFSET ${limit_param + 1};
+                """,
+                *args,
+                limit,
+                offset,
+            )
+            return [self._map_row(row) for row in rows]
+
+        predicate, order_by, params = keyset_clause(
+            ("created_at", "id"), cursor, descending=True, first_param=limit_param + 1
+        )
         rows = await self._conn.fetch(
-            """
+            f"""
             SELECT id, product_id, warehouse_id, amount, reason, created_at, product_variant_id
             FROM stock_movements
-            WHERE created_at >= $1 AND created_at <= $2
-            ORDER BY created_at DESC
-            LIMIT $3 OFFSET $4;
+            WHERE {condition} AND {predicate}
+            ORDER BY {order_by}
+            LIMIT ${limit_param};
             """,
-            time_from,
-            time_to,
+            *args,
             limit,
-            offset,
+            *params,
         )
-        return [self._map_row(row) for row in rows]
+        return [self._map_row(row) for row in restore_order(rows, cursor)]
 
     @staticmethod
     def _map_row(row: Mapping[str, Any]) -> StockMovement:
@@ -1,38 +1,11 @@
+from collections.abc import Callable
+from typing import Any
+
 import asyncpg
 from asyncpg.connection import Connection
 from asyncpg.transaction import Transaction
-from typing import cast
-
-from shop.app.application.interfaces.repositories.cart_item_repository import (
-    CartItemRepository,
-)
-from shop.app.application.interfaces.repositories.order_item_repository import (
-    OrderItemRepository,
-)
-from shop.app.application.interfaces.repositories.product_specification_repository import (
-    ProductSpecificationRepository,
-)
-from shop.app.application.interfaces.repositories.refresh_token_repository import (
-    RefreshTokenRepository,
-)
-from shop.app.application.interfaces.repositories import (
-    BrandRepository,
-    CartRepository,
-    CategoryRepository,
-    OrderRepository,
-    PermissionRepository,
-    ProductDetailsRepository,
-    ProductImageRepository,
-    ProductRepository,
-    ProductVariantDetailsRepository,
-    ProductVariantRepository,
-    ReviewRepository,
-    RoleRepository,
-    StockMovementRepository,
-    UnitOfWork,
-    UserRepository,
-    WarehouseRepository,
-)
+
+from shop.app.application.interfaces.repositories import QuerySession, UnitOfWork
 from shop.app.infrastructure.persistence.postgres.repositories.cart_item_repository import (
     CartItemRepositorySql,
 )
@@ -90,19 +63,103 @@ from shop.app.infrastructure.persistence.postgres.repositories.user_repository i
 from shop.app.infrastructure.persistence.postgres.repositories.warehouse_repository import (
     WarehouseRepositorySql,
 )
+from shop.app.infrastructure.persistence.postgres.replica import ReplicaRouter
+
+
+class _LazyRepository:
+    """
+    Создаёт репозиторий при первом обращении и кеширует его в ``__dict__`` UoW.
+
+    Non-data descriptor: after the first access the instance attribute shadows
+    it, so repeated access costs a plain attribute lookup.
+    """
+
+    __slots__ = ("_factory", "_name")
+
+    def __init__(self, factory: Callable[[Connection], Any]) -> None:
+        self._factory = factory
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, instance: "SqlUnitOfWork | None", owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        repository = self._factory(instance._conn)
+        instance.__dict__[self._name] = repository
+        return repository
+
+
+class _SqlRepositories:
+    """Repositories bound to ``self._conn`` of a unit of work or query session."""
+
+    _conn: Connection
+
+    categories = _LazyRepository(CategoryRepositorySql)
+    brands = _LazyRepository(BrandRepositorySql)
+    products = _LazyRepository(ProductRepositorySql)
+    product_variants = _LazyRepository(ProductVariantRepositorySql)
+    product_details = _LazyRepository(ProductDetailsRepositorySql)
+    product_variant_details = _LazyRepository(ProductVariantDetailsRepositorySql)
+    product_images = _LazyRepository(ProductImageRepositorySql)
+    users = _LazyRepository(UserRepositorySql)
+    permissions = _LazyRepository(PermissionRepositorySql)
+    roles = _LazyRepository(RoleRepositorySql)
+    carts = _LazyRepository(CartRepositorySql)
+    orders = _LazyRepository(OrderRepositorySql)
+    reviews = _LazyRepository(ReviewRepositorySql)
+    warehouses = _LazyRepository(WarehouseRepositorySql)
+    stock_movements = _LazyRepository(StockMovementRepositorySql)
+
+    refresh_tokens = _LazyRepository(RefreshTokenRepositorySql)
+    product_specifications = _LazyRepository(ProductSpecificationRepositorySql)
+    cart_items = _LazyRepository(CartItemRepositorySql)
+    order_items = _LazyRepository(OrderItemRepositorySql)
 
+    def _reset_repositories(self) -> None:
+        # Репозитории привязаны к соединению: при повторном входе создаём их заново.
+        for name in _REPOSITORY_NAMES:
+            self.__dict__.pop(name, None)
 
-class SqlUnitOfWork(UnitOfWork):
 
-    def __init__(self, pool: asyncpg.Pool) -> None:
+class SqlUnitOfWork(_SqlRepositories, UnitOfWork):
+    """
+    Транзакция поверх пула asyncpg.
+
+    With ``readonly=True`` the transaction is opened as ``READ ONLY`` and, when a
+    ``ReplicaRouter`` is given, the connection is taken from the replica pool
+    unless the router reports excessive replication lag.
+    """
+
+    def __init__(
+        self,
+        pool: asyncpg.Pool,
+        *,
+        readonly: bool = False,
+        replicas: ReplicaRouter | None = None,
+    ) -> None:
         self._pool: asyncpg.Pool = pool
+        self._readonly = readonly
+        self._replicas = replicas
 
     async def __aenter__(self) -> "SqlUnitOfWork":
-        self._conn: Connection = await self._pool.acquire()
-        self._tx: Transaction = self._conn.transaction()
-        await self._tx.start()
+        self._conn_pool: asyncpg.Pool = await self._select_pool()
+        self._conn: Connection = await self._conn_pool.acquire()
+        try:
+            if self._readonly:
+                # Hot standby отклоняет SERIALIZABLE, поэтому DEFERRABLE здесь неприменим.
+                self._tx: Transaction = self._conn.transaction(
+                    isolation="repeatable_read", readonly=True
+                )
+            else:
+                self._tx = self._conn.transaction()
+            await self._tx.start()
+        except BaseException:
+            await self._conn_pool.release(self._conn)
+            raise
         self._committed = False
-        self._init_repositories()
+        self._reset_repositories()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -110,7 +167,13 @@ class SqlUnitOfWork(UnitOfWork):
             if not self._committed:
                 await self._tx.rollback()
         finally:
-            await self._pool.release(self._conn)
+            await self._conn_pool.release(self._conn)
+
+    async def _select_pool(self) -> asyncpg.Pool:
+        if self._readonly and self._replicas is not None:
+            pool, _ = await self._replicas.pool_for_read()
+            return pool
+        return self._pool
 
     async def commit(self) -> None:
         await self._tx.commit()
@@ -119,29 +182,33 @@ class SqlUnitOfWork(UnitOfWork):
     async def rollback(self) -> None:
         await self._tx.rollback()
 
-    def _init_repositories(self) -> None:
-        c = self._conn
-        self.categories = cast(CategoryRepository, CategoryRepositorySql(c))
-        self.brands = cast(BrandRepository, BrandRepositorySql(c))
-        self.products = cast(ProductRepository, ProductRepositorySql(c))
-        self.product_variants = cast(ProductVariantRepository, ProductVariantRepositorySql(c))
-        self.product_details = cast(ProductDetailsRepository, ProductDetailsRepositorySql(c))
-        self.product_variant_details = cast(
-            ProductVariantDetailsRepository, ProductVariantDetailsRepositorySql(c)
-        )
-        self.product_images = cast(ProductImageRepository, ProductImageRepositorySql(c))
-        self.users = cast(UserRepository, UserRepositorySql(c))
-        self.permissions = cast(PermissionRepository, PermissionRepositorySql(c))
-        self.roles = cast(RoleRepository, RoleRepositorySql(c))
-        self.carts = cast(CartRepository, CartRepositorySql(c))
-        self.orders = cast(OrderRepository, OrderRepositorySql(c))
-        self.reviews = cast(ReviewRepository, ReviewRepositorySql(c))
-        self.warehouses = cast(WarehouseRepository, WarehouseRepositorySql(c))
-        self.stock_movements = cast(StockMovementRepository, StockMovementRepositorySql(c))
-
-        self.refresh_tokens = cast(RefreshTokenRepository, RefreshTokenRepositorySql(c))
-        self.product_specifications = cast(
-            ProductSpecificationRepository, ProductSpecificationRepositorySql(c)
-        )
-        self.cart_items = cast(CartItemRepository, CartItemRepositorySql(c))
-        self.order_items = cast(OrderItemRepository, OrderItemRepositorySql(c))
+
+class SqlQuerySession(_SqlRepositories, QuerySession):
+    """
+    Connection from the pool without BEGIN/ROLLBACK around it.
+
+    Only for single-statement reads: every repository call is its own implicit
+    transaction. With ``replicas`` the connection comes from the replica pool
+    on the same terms as a read-only ``SqlUnitOfWork``.
+    """
+
+    def __init__(self, pool: asyncpg.Pool, *, replicas: ReplicaRouter | None = None) -> None:
+        self._pool: asyncpg.Pool = pool
+        self._replicas = replicas
+
+    async def __aenter__(self) -> "SqlQuerySession":
+        if self._replicas is not None:
+            self._conn_pool, _ = await self._replicas.pool_for_read()
+        else:
+            self._conn_pool = self._pool
+        self._conn = await self._conn_pool.acquire()
+        self._reset_repositories()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self._conn_pool.release(self._conn)
+
+
+_REPOSITORY_NAMES: tuple[str, ...] = tuple(
+    name for name, attr in vars(_SqlRepositories).items() if isinstance(attr, _LazyRepository)
+)
@@ -2,6 +2,7 @@ from datetime import datetime
 from uuid import UUID
 
 from shop.app.domain.entities.user import User
+from shop.app.infrastructure.persistence.postgres.statements import USER_GET_BY_ID
 from shop.app.application.interfaces.repositories import UserRepository
 
 
@@ -28,15 +29,7 @@ class UserRepositorySql(UserRepository):
         return row["total"]
 
     async def get_by_id(self, user_id: UUID) -> User | None:
-        row = await self._conn.fetchrow(
-            """
-            SELECT u.id, u.username, u.email, u.full_name, u.is_active,
-                   u.last_login, u.created_at, u.updated_at, u.password_hash
-            FROM users u
-            WHERE u.id = $1;
-            """,
-            user_id,
-        )
+        row = await self._conn.fetchrow_named(USER_GET_BY_ID, user_id)
         return self._map_user(row) if row else None
 
     async def get_by_email(self, email: str) -> User | None:
@@ -0,0 +1,147 @@
+"""
+Named prepared statements for hot repository reads.
+
+Statements are declared once in ``statements`` and prepared on every new pool
+connection through the pool ``init`` hook, so the first request served by a
+fresh connection does not pay the parse/plan round trip. Repositories address
+them by name via ``fetchrow_named`` / ``fetch_named`` / ``fetchval_named``.
+"""
+
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import asyncpg
+from asyncpg.prepared_stmt import PreparedStatement
+
+
+class StatementRegistry:
+    def __init__(self) -> None:
+        self._sql: dict[str, str] = {}
+
+    def register(self, name: str, sql: str) -> str:
+        existing = self._sql.get(name)
+        if existing is not None and existing != sql:
+            raise ValueError(f"Statement {name!r} is already registered with different SQL")
+        self._sql[name] = sql
+        return name
+
+    def get_sql(self, name: str) -> str:
+        try:
+            return self._sql[name]
+        except KeyError:
+            raise LookupError(f"Unknown prepared statement {name!r}") from None
+
+    def items(self) -> Iterator[tuple[str, str]]:
+        return iter(self._sql.items())
+
+    def __len__(self) -> int:
+        return len(self._sql)
+
+
+@dataclass(slots=True)
+class StatementCacheStats:
+    prepared_on_connect: int = 0
+    hits: int = 0
+    misses: int = 0
+    reprepared: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+statements = StatementRegistry()
+statement_cache_stats = StatementCacheStats()
+
+
+PRODUCT_GET_BY_ID = statements.register(
+    "products.get_by_id",
+    """
+    SELECT id, title, description, price, stock, brand,
+           thumbnail_key, thumbnail_derivatives, is_published, category_id
+    FROM products
+    WHERE id = $1;
+    """,
+)
+PRODUCT_EXISTS_BY_ID = statements.register(
+    "products.exists_by_id",
+    "SELECT EXISTS(SELECT 1 FROM products WHERE id = $1) AS exists;",
+)
+CATEGORY_GET_BY_ID = statements.register(
+    "categories.get_by_id",
+    "SELECT id, name FROM categories WHERE id = $1;",
+)
+USER_GET_BY_ID = statements.register(
+    "users.get_by_id",
+    """
+    SELECT u.id, u.username, u.email, u.full_name, u.is_active,
+           u.last_login, u.created_at, u.updated_at, u.password_hash
+    FROM users u
+    WHERE u.id = $1;
+    """,
+)
+
+
+class PreparedConnection(asyncpg.Connection):
+    """asyncpg connection that keeps registry statements prepared for its lifetime."""
+
+    __slots__ = ("_named_statements",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._named_statements: dict[str, PreparedStatement] = {}
+
+    async def prepare_registered(self) -> None:
+        for name, sql in statements.items():
+            self._named_statements[name] = await self.prepare(sql)
+        statement_cache_stats.prepared_on_connect += len(statements)
+
+    async def named(self, name: str) -> PreparedStatement:
+        stmt = self._named_statements.get(name)
+        if stmt is not None:
+            statement_cache_stats.hits += 1
+            return stmt
+
+        statement_cache_stats.misses += 1
+        stmt = await self.prepare(statements.get_sql(name))
+        self._named_statements[name] = stmt
+        return stmt
+
+    async def fetch_named(self, name: str, *args: Any) -> list[asyncpg.Record]:
+        return await self._run_named(name, "fetch", args)
+
+    async def fetchrow_named(self, name: str, *args: Any) -> asyncpg.Record | None:
+        return await self._run_named(name, "fetchrow", args)
+
+    async def fetchval_named(self, name: str, *args: Any) -> Any:
+        return await self._run_named(name, "fetchval", args)
+
+    async def _run_named(self, name: str, method: str, args: tuple[Any, ...]) -> Any:
+        stmt = await self.named(name)
+        try:
+            return await getattr(stmt, method)(*args)
+        except asyncpg.InvalidCachedStatementError:
+            # Схема изменилась после подготовки запроса — готовим заново один раз.
+            statement_cache_stats.reprepared += 1
+            self._named_statements.pop(name, None)
+            stmt = await self.named(name)
+            return await getattr(stmt, method)(*args)
+
+
+async def init_connection(conn: PreparedConnection) -> None:
+    """Pool ``init`` hook: warm up registry statements on a new connection."""
+    await conn.prepare_registered()
+
+
+__all__ = [
+    "CATEGORY_GET_BY_ID",
+    "PRODUCT_EXISTS_BY_ID",
+    "PRODUCT_GET_BY_ID",
+    "USER_GET_BY_ID",
+    "PreparedConnection",
+    "StatementCacheStats",
+    "StatementRegistry",
+    "init_connection",
+    "statement_cache_stats",
+    "statements",
+]
@@ -0,0 +1,239 @@
+"""Result cache for event log analytics."""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import datetime, timedelta
+
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.core.exceptions import StorageUnavailableError
+from shop.app.infrastructure.persistence.mongo.event_log_rollup import (
+    as_utc,
+    next_bucket,
+    truncate,
+)
+from shop.app.repositories.protocols import EventLogAnalyticsRepository
+from shop.app.utils.get_utc_now import get_utc_now
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "analytics"
+# Репозиторий принимает конец интервала включительно; Mongo хранит миллисекунды.
+_EPSILON = timedelta(milliseconds=1)
+
+# Loads the rows of a time series for [start, end]; end inclusive, as in the repository.
+RangeLoader = Callable[[datetime, datetime], Awaitable[list[dict]]]
+
+
+class CachedEventLogAnalyticsRepository(EventLogAnalyticsRepository):
+    """
+    Caches analytics results in front of another analytics repository.
+
+    Time-bucketed reports (activity, time series) are cached per bucket,
+    keyed by report, normalized parameters and the bucket start. Buckets
+    that ended more than ``settle_seconds`` ago are closed and cached for
+    ``closed_ttl_seconds``; the unaligned head of the range and the still
+    open buckets are recomputed on every call. Other reports are cached as
+    a whole for ``ttl_seconds``. Cache failures fall back to the inner
+    repository.
+    """
+
+    def __init__(
+        self,
+        *,
+        inner: EventLogAnalyticsRepository,
+        storage: CacheStorage,
+        codec: CacheCodec,
+        ttl_seconds: int,
+        closed_ttl_seconds: int,
+        settle_seconds: float,
+    ) -> None:
+        self._inner = inner
+        self._storage = storage
+        self._codec = codec
+        self._ttl_seconds = ttl_seconds
+        self._closed_ttl_seconds = closed_ttl_seconds
+        self._settle = timedelta(seconds=settle_seconds)
+
+    async def aggregate_activity_by_period(
+        self,
+        period: str,
+        time_from: datetime | None = None,
+        time_to: datetime | None = None,
+        exact_unique_users: bool = False,
+    ) -> list[dict]:
+        if time_from is None:
+            # Без начала интервала бакеты зависят от горизонта TTL — не кешируем по бакетам.
+            return await self._inner.aggregate_activity_by_period(
+                period, time_from, time_to, exact_unique_users
+            )
+
+        async def load(start: datetime, end: datetime) -> list[dict]:
+            return await self._inner.aggregate_activity_by_period(
+                period, start, end, exact_unique_users
+            )
+
+        return await self._bucketed(
+            report=f"activity:{period}:{'exact' if exact_unique_users else 'hll'}",
+            unit=period,
+            bucket_field="period",
+            time_from=time_from,
+            time_to=time_to,
+            load=load,
+        )
+
+    async def aggregate_time_series(
+        self,
+        time_from: datetime,
+        time_to: datetime,
+        granularity: str = "hour",
+    ) -> list[dict]:
+        async def load(start: datetime, end: datetime) -> list[dict]:
+            return await self._inner.aggregate_time_series(start, end, granularity)
+
+        return await self._bucketed(
+            report=f"time_series:{granularity}",
+            unit=granularity,
+            bucket_field="timestamp",
+            time_from=time_from,
+            time_to=time_to,
+            load=load,
+        )
+
+    async def aggregate_top_users(self, limit: int = 10) -> list[dict]:
+        return await self._cached(
+            f"{_KEY_PREFIX}:top_users:{limit}",
+            lambda: self._inner.aggregate_top_users(limit),
+        )
+
+    async def aggregate_event_type_stats(self) -> list[dict]:
+        return await self._cached(
+            f"{_KEY_PREFIX}:event_types",
+            self._inner.aggregate_event_type_stats,
+        )
+
+    async def aggregate_user_anomalies(
+        self,
+        time_from: datetime,
+        std_threshold: float = 1.0,
+    ) -> list[dict]:
+        # Начало интервала до минуты: соседние запросы дашборда попадают в один ключ.
+        start = truncate(time_from, "minute")
+        return await self._cached(
+            f"{_KEY_PREFIX}:anomalies:{start.isoformat()}:{std_threshold}",
+            lambda: self._inner.aggregate_user_anomalies(start, std_threshold),
+        )
+
+    def iter_events(
+        self,
+        time_from: datetime | None = None,
+        time_to: datetime | None = None,
+        *,
+        user_id: int | None = None,
+        event_type: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict]:
+        return self._inner.iter_events(
+            time_from, time_to, user_id=user_id, event_type=event_type, batch_size=batch_size
+        )
+
+    async def _bucketed(
+        self,
+        *,
+        report: str,
+        unit: str,
+        bucket_field: str,
+        time_from: datetime,
+        time_to: datetime | None,
+        load: RangeLoader,
+    ) -> list[dict]:
+        start = as_utc(time_from)
+        now = as_utc(get_utc_now())
+        end = as_utc(time_to) if time_to is not None else now
+        settled = min(end, now - self._settle)
+
+        # Закрытые бакеты: целиком внутри [start, settled].
+        buckets: list[datetime] = []
+        bucket = truncate(start, unit)
+        if bucket < start:
+            bucket = next_bucket(bucket, unit)
+        first_closed = bucket
+        while (bucket_end := next_bucket(bucket, unit)) <= settled:
+            buckets.append(bucket)
+            bucket = bucket_end
+        if not buckets:
+            return await load(start, end)
+        open_from = next_bucket(buckets[-1], unit)
+
+        rows: list[dict] = []
+        if start < first_closed:
+            rows.extend(await load(start, first_closed - _EPSILON))
+        rows.extend(await self._closed_buckets(report, unit, bucket_field, buckets, load))
+        if open_from <= end:
+            rows.extend(await load(open_from, end))
+        return rows
+
+    async def _closed_buckets(
+        self,
+        report: str,
+        unit: str,
+        bucket_field: str,
+        buckets: list[datetime],
+        load: RangeLoader,
+    ) -> list[dict]:
+        keys = [f"{_KEY_PREFIX}:{report}:{bucket.isoformat()}" for bucket in buckets]
+        try:
+            cached = await self._storage.get_many(keys)
+        except StorageUnavailableError:
+            logger.warning("Analytics cache is unavailable, computing %s", report)
+            return await load(buckets[0], next_bucket(buckets[-1], unit) - _EPSILON)
+
+        # Пустой бакет тоже кешируется (как []), иначе его пересчитывали бы всегда.
+        results: dict[datetime, list[dict]] = {}
+        missing = [b for b, raw in zip(buckets, cached) if raw is None]
+        for bucket, raw in zip(buckets, cached):
+            if raw is not None:
+                results[bucket] = self._codec.decode(raw)
+        if missing:
+            # Один запрос на весь диапазон пропусков вместо запроса на бакет.
+            loaded = await load(missing[0], next_bucket(missing[-1], unit) - _EPSILON)
+            by_bucket: dict[datetime, list[dict]] = {bucket: [] for bucket in missing}
+            for row in loaded:
+                bucket = as_utc(row[bucket_field])
+                if bucket in by_bucket:
+                    by_bucket[bucket].append(row)
+            results.update(by_bucket)
+            await self._store_closed(report, by_bucket)
+        return [row for bucket in buckets for row in results[bucket]]
+
+    async def _store_closed(self, report: str, by_bucket: dict[datetime, list[dict]]) -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    self._storage.set_value(
+                        f"{_KEY_PREFIX}:{report}:{bucket.isoformat()}",
+                        self._codec.encode(rows),
+                        ttl_seconds=self._closed_ttl_seconds,
+                    )
+                    for bucket, rows in by_bucket.items()
+                )
+            )
+        except StorageUnavailableError:
+            logger.warning("Failed to cache analytics buckets for %s", report)
+
+    async def _cached(self, key: str, load: Callable[[], Awaitable[list[dict]]]) -> list[dict]:
+        try:
+            raw = await self._storage.get_value(key)
+        except StorageUnavailableError:
+            return await load()
+        if raw is not None:
+            return self._codec.decode(raw)
+        rows = await load()
+        try:
+            await self._storage.set_value(
+                key, self._codec.encode(rows), ttl_seconds=self._ttl_seconds
+            )
+        except StorageUnavailableError:
+            logger.warning("Failed to cache analytics result %s", key)
+        return rows
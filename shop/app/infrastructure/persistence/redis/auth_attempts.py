@@ -1,37 +1,114 @@
 import json
+import secrets
 
 from redis import RedisError
 
 from shop.app.core.exceptions import StorageUnavailableError
-from shop.app.application.interfaces.auth.auth_attempt_storage import AuthAttemptStorage
+from shop.app.application.interfaces.auth.auth_attempt_storage import (
+    AuthAttemptStorage,
+    FailedAttemptResult,
+)
 from redis.asyncio import Redis
 
+# KEYS[1] — ZSET попыток (score = время попытки в мс), KEYS[2] — ключ блокировки.
+# ARGV: окно (мс), лимит попыток (0 — не блокировать), длительность блокировки (с),
+# уникальный суффикс элемента, JSON-пейлоад блокировки.
+# Время берётся с сервера Redis: у всех инстансов приложения одни часы.
+# Ответ: {blocked, attempts, retry_after_ms}.
+_REGISTER_FAILED_ATTEMPT = """
+local block_ttl = redis.call('PTTL', KEYS[2])
+if block_ttl > 0 or block_ttl == -1 then
+    return {1, redis.call('ZCARD', KEYS[1]), block_ttl}
+end
+
+local now = redis.call('TIME')
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
+local window_ms = tonumber(ARGV[1])
+local max_attempts = tonumber(ARGV[2])
+
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now_ms - window_ms)
+redis.call('ZADD', KEYS[1], now_ms, now_ms .. ':' .. ARGV[4])
+local attempts = redis.call('ZCARD', KEYS[1])
+
+if max_attempts > 0 and attempts >= max_attempts then
+    local block_ms = tonumber(ARGV[3]) * 1000
+    redis.call('SET', KEYS[2], ARGV[5], 'PX', block_ms)
+    redis.call('DEL', KEYS[1])
+    return {1, attempts, block_ms}
+end
+
+redis.call('PEXPIRE', KEYS[1], window_ms)
+return {0, attempts, 0}
+"""
+
+
+def _retry_after_seconds(ttl_ms: int) -> int:
+    # PTTL -1: блокировка без срока (выставлена вручную), Retry-After не отдаём.
+    return -(-int(ttl_ms) // 1000) if ttl_ms > 0 else 0
+
 
 class RedisAuthAttemptsStorage(AuthAttemptStorage):
+    """
+    Failed attempts are kept per user in a sorted set of timestamps, so the
+    limit applies to a sliding window rather than to a counter whose expiry
+    is pushed forward by each attempt. ``register_failed_attempt`` checks
+    the blocklist, records the attempt and installs the block in one Lua
+    script: one round-trip per failed login and no gap between check and
+    increment for concurrent attempts to slip through.
+    """
+
     def __init__(self, client: Redis):
         self._client = client
-        self._failed_attempts_key_prefix = "auth:attempts"
+        # Не "auth:attempts": там строковые счётчики старого адаптера (RedisAuthAttempts),
+        # ZSET-команды по ним упали бы с WRONGTYPE.
+        self._failed_attempts_key_prefix = "auth:failed_attempts"
         self._black_list_key_prefix = "auth:blacklist"
+        # register_script вызывает EVALSHA и сам догружает скрипт при NOSCRIPT.
+        self._register_failed_attempt = client.register_script(_REGISTER_FAILED_ATTEMPT)
 
     async def get_failed_attempts(self, username: str) -> int:
         key = self._failed_attempts_key(username)
         try:
-            attempts = await self._client.get(key)
-            return int(attempts) if attempts else 0
+            # Устаревшие попытки вычищает скрипт при следующей записи, а ключ живёт не дольше окна.
+            return await self._client.zcard(key)
         except RedisError as exc:
             raise StorageUnavailableError("Failed to get auth attempts") from exc
 
     async def increment_failed_attempts(self, username: str, window_seconds: int) -> int:
-        key = self._failed_attempts_key(username)
+        result = await self._run_register_script(
+            username, max_attempts=0, window_seconds=window_seconds, block_seconds=0
+        )
+        return result.attempts
+
+    async def register_failed_attempt(
+        self,
+        username: str,
+        *,
+        max_attempts: int,
+        window_seconds: int,
+        block_seconds: int,
+    ) -> FailedAttemptResult:
+        return await self._run_register_script(
+            username,
+            max_attempts=max_attempts,
+            window_seconds=window_seconds,
+            block_seconds=block_seconds,
+        )
 
+    async def get_attempt_state(self, username: str) -> FailedAttemptResult:
         try:
-            async with self._client.pipeline(transaction=True) as pipe:
-                pipe.incr(key)
-                pipe.expire(key, window_seconds)
-                results = await pipe.execute()
-            return results[0]
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.pttl(self._black_list_key(username))
+                pipe.zcard(self._failed_attempts_key(username))
+                block_ttl_ms, attempts = await pipe.execute()
         except RedisError as exc:
-            raise StorageUnavailableError("Failed to increment auth attempts") from exc
+            raise StorageUnavailableError("Failed to get auth attempts") from exc
+        # PTTL: -2 — ключа нет, -1 — блокировка без срока.
+        return FailedAttemptResult(
+            attempts=int(attempts),
+            blocked=block_ttl_ms > 0 or block_ttl_ms == -1,
+            retry_after_seconds=_retry_after_seconds(block_ttl_ms),
+        )
 
     async def reset_failed_attempts(self, username: str) -> None:
         key = self._failed_attempts_key(username)
@@ -42,14 +119,8 @@ class RedisAuthAttemptsStorage(AuthAttemptStorage):
 
     async def add_to_blocklist(self, username: str, duration_seconds: int) -> None:
         key = self._black_list_key(username)
-        payload = json.dumps(
-            {
-                "username": username,
-                "reason": "Too many failed attempts",
-            }
-        )
         try:
-            await self._client.setex(key, duration_seconds, payload)
+            await self._client.setex(key, duration_seconds, self._blocklist_payload(username))
         except RedisError as exc:
             raise StorageUnavailableError("Failed to add to blocklist") from exc
 
@@ -60,6 +131,43 @@ class RedisAuthAttemptsStorage(AuthAttemptStorage):
         except RedisError as exc:
             raise StorageUnavailableError("Failed to check blacklist status") from exc
 
+    async def _run_register_script(
+        self,
+        username: str,
+        *,
+        max_attempts: int,
+        window_seconds: int,
+        block_seconds: int,
+    ) -> FailedAttemptResult:
+        keys = [self._failed_attempts_key(username), self._black_list_key(username)]
+        args = [
+            window_seconds * 1000,
+            max_attempts,
+            block_seconds,
+            secrets.token_hex(4),
+            self._blocklist_payload(username),
+        ]
+        try:
+            blocked, attempts, retry_after_ms = await self._register_failed_attempt(
+                keys=keys, args=args
+            )
+        except RedisError as exc:
+            raise StorageUnavailableError("Failed to register auth attempt") from exc
+        return FailedAttemptResult(
+            attempts=int(attempts),
+            blocked=bool(blocked),
+            retry_after_seconds=_retry_after_seconds(retry_after_ms),
+        )
+
+    @staticmethod
+    def _blocklist_payload(username: str) -> str:
+        return json.dumps(
+            {
+                "username": username,
+                "reason": "Too many failed attempts",
+            }
+        )
+
     def _failed_attempts_key(self, username: str) -> str:
         return f"{self._failed_attempts_key_prefix}:{username}"
 
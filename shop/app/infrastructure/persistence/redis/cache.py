@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from redis import RedisError
 from redis.asyncio import Redis
 
@@ -10,13 +12,23 @@ class RedisCacheStorage(CacheStorage):
         self._client = client
         self._cache_prefix = "cache"
 
-    async def get_value(self, key: str) -> str | None:
+    async def get_value(self, key: str) -> str | bytes | None:
         try:
             return await self._client.get(self._get_key(key))
         except RedisError as exc:
             raise StorageUnavailableError("Cache storage is unavailable") from exc
 
-    async def set_value(self, key: str, value: str, ttl_seconds: int | None = None) -> None:
+    async def get_many(self, keys: Sequence[str]) -> list[str | bytes | None]:
+        if not keys:
+            return []
+        try:
+            return await self._client.mget([self._get_key(key) for key in keys])
+        except RedisError as exc:
+            raise StorageUnavailableError("Cache storage is unavailable") from exc
+
+    async def set_value(
+        self, key: str, value: str | bytes, ttl_seconds: int | None = None
+    ) -> None:
         try:
             full_key = self._get_key(key)
             if ttl_seconds:
@@ -51,6 +63,19 @@ class RedisCacheStorage(CacheStorage):
         except RedisError as exc:
             raise StorageUnavailableError("Failed to check cache existence") from exc
 
+    async def get_generation(self, namespace: str) -> int:
+        try:
+            value = await self._client.get(self._generation_key(namespace))
+        except RedisError as exc:
+            raise StorageUnavailableError("Cache storage is unavailable") from exc
+        return int(value) if value is not None else 0
+
+    async def bump_generation(self, namespace: str) -> int:
+        try:
+            return await self._client.incr(self._generation_key(namespace))
+        except RedisError as exc:
+            raise StorageUnavailableError("Failed to invalidate cache namespace") from exc
+
     async def _batch_scan(self, pattern: str, count: int):
         batch = []
         async for key in self._client.scan_iter(match=pattern, count=count):
@@ -64,5 +89,8 @@ class RedisCacheStorage(CacheStorage):
     def _get_key(self, key: str) -> str:
         return f"{self._cache_prefix}:{key}"
 
+    def _generation_key(self, namespace: str) -> str:
+        return f"{self._cache_prefix}:{namespace}:generation"
+
     def _get_pattern_key(self, pattern: str):
         return f"{self._cache_prefix}:{pattern}"
@@ -0,0 +1,108 @@
+"""Cache codecs: compact msgpack (default) and tagged JSON."""
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import msgpack
+
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+
+_EXT_DECIMAL = 1
+_EXT_UUID = 2
+_EXT_DATETIME = 3
+_EXT_DATE = 4
+
+
+class MsgpackCacheCodec(CacheCodec):
+    """
+    msgpack with extension types; UUIDs are stored as 16 raw bytes.
+
+    Timezone-aware datetimes use the native msgpack timestamp and come back
+    in UTC; naive ones are kept as ISO strings in an extension.
+    """
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, default=self._default, use_bin_type=True, datetime=True)
+
+    def decode(self, data: bytes) -> Any:
+        try:
+            return msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, timestamp=3)
+        except (msgpack.UnpackException, ValueError) as exc:
+            raise ValueError("Malformed msgpack cache payload") from exc
+
+    @staticmethod
+    def _default(value: Any) -> msgpack.ExtType:
+        if isinstance(value, Decimal):
+            return msgpack.ExtType(_EXT_DECIMAL, str(value).encode("ascii"))
+        if isinstance(value, UUID):
+            return msgpack.ExtType(_EXT_UUID, value.bytes)
+        # datetime проверяется раньше date: он его подкласс.
+        if isinstance(value, datetime):
+            return msgpack.ExtType(_EXT_DATETIME, value.isoformat().encode("ascii"))
+        if isinstance(value, date):
+            return msgpack.ExtType(_EXT_DATE, value.isoformat().encode("ascii"))
+        raise TypeError(f"Unsupported cache value type: {type(value).__name__}")
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        if code == _EXT_DECIMAL:
+            return Decimal(data.decode("ascii"))
+        if code == _EXT_UUID:
+            return UUID(bytes=data)
+        if code == _EXT_DATETIME:
+            return datetime.fromisoformat(data.decode("ascii"))
+        if code == _EXT_DATE:
+            return date.fromisoformat(data.decode("ascii"))
+        return msgpack.ExtType(code, data)
+
+
+class JsonCacheCodec(CacheCodec):
+    """UTF-8 JSON with tagged objects for non-JSON types; readable in redis-cli."""
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, default=self._default, separators=(",", ":")).encode("utf-8")
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data, object_hook=self._object_hook)
+
+    @staticmethod
+    def _default(value: Any) -> Any:
+        if isinstance(value, Decimal):
+            return {"$dec": str(value)}
+        if isinstance(value, UUID):
+            return {"$uuid": str(value)}
+        if isinstance(value, datetime):
+            return {"$dt": value.isoformat()}
+        if isinstance(value, date):
+            return {"$date": value.isoformat()}
+        raise TypeError(f"Unsupported cache value type: {type(value).__name__}")
+
+    @staticmethod
+    def _object_hook(obj: dict[str, Any]) -> Any:
+        if len(obj) == 1:
+            ((tag, raw),) = obj.items()
+            if tag == "$dec":
+                return Decimal(raw)
+            if tag == "$uuid":
+                return UUID(raw)
+            if tag == "$dt":
+                return datetime.fromisoformat(raw)
+            if tag == "$date":
+                return date.fromisoformat(raw)
+        return obj
+
+
+_CODECS: dict[str, type[CacheCodec]] = {
+    "msgpack": MsgpackCacheCodec,
+    "json": JsonCacheCodec,
+}
+
+
+def create_cache_codec(name: str) -> CacheCodec:
+    try:
+        return _CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cache codec: {name!r}") from None
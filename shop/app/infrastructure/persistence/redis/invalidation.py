@@ -0,0 +1,87 @@
+"""Applies cross-instance cache invalidation messages to the local cache tier."""
+
+import asyncio
+import json
+import logging
+from typing import Any
+
+from redis.asyncio import Redis, RedisError
+
+from shop.app.infrastructure.persistence.redis.local_cache import TieredCacheStorage
+
+logger = logging.getLogger(__name__)
+
+_RECONNECT_DELAY_SECONDS = 1.0
+
+
+class CacheInvalidationListener:
+    """
+    Subscribes to the cache invalidation channel and evicts local entries.
+
+    Messages are the ones services publish in ``_after_mutation``: a JSON
+    object whose ``data`` carries ``key`` or ``pattern`` (falling back to
+    ``"<entity>:*"``). Anything unparseable, and any gap in the subscription,
+    clears the whole local tier because messages may have been missed.
+    """
+
+    def __init__(self, *, client: Redis, channel: str, cache: TieredCacheStorage) -> None:
+        self._client = client
+        self._channel = channel
+        self._cache = cache
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="cache-invalidation-listener")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                async with self._client.pubsub() as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    # Пока подписки не было, сообщения могли потеряться.
+                    self._cache.invalidate_local()
+                    async for message in pubsub.listen():
+                        if message.get("type") == "message":
+                            self.apply(message.get("data"))
+            except asyncio.CancelledError:
+                raise
+            except (RedisError, OSError):
+                logger.warning(
+                    "Cache invalidation subscription lost, retrying", exc_info=True
+                )
+                self._cache.invalidate_local()
+                await asyncio.sleep(_RECONNECT_DELAY_SECONDS)
+
+    def apply(self, raw: Any) -> None:
+        try:
+            payload = json.loads(raw)
+            data = payload.get("data", payload)
+            key = data.get("key")
+            pattern = data.get("pattern")
+            entity = data.get("entity")
+        except (TypeError, ValueError, AttributeError):
+            logger.warning("Malformed cache invalidation message: %r", raw)
+            self._cache.invalidate_local()
+            return
+
+        if key is None and pattern is None:
+            if entity is None:
+                self._cache.invalidate_local()
+                return
+            pattern = f"{entity}:*"
+        self._cache.invalidate_local(key=key, pattern=pattern)
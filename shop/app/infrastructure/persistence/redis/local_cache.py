@@ -0,0 +1,144 @@
+"""In-process cache tier in front of Redis."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from fnmatch import fnmatchcase
+
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+
+
+class LocalCache:
+    """
+    Size-bounded LRU with per-entry TTL.
+
+    Not thread-safe; intended for a single event loop. Expired entries are
+    dropped lazily on access and evicted first when the cache is full.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, str | bytes]] = OrderedDict()
+
+    def get(self, key: str) -> str | bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str | bytes, ttl_seconds: float | None = None) -> None:
+        ttl = self._ttl_seconds if not ttl_seconds else min(ttl_seconds, self._ttl_seconds)
+        self._entries[key] = (self._clock() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def delete_matching(self, pattern: str) -> None:
+        for key in [k for k in self._entries if fnmatchcase(k, pattern)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class TieredCacheStorage(CacheStorage):
+    """
+    CacheStorage that answers from process memory before going to ``remote``.
+
+    The local tier is populated on remote reads and writes and is evicted by
+    local mutations and by ``CACHE_INVALIDATION`` messages from other
+    instances (see ``CacheInvalidationListener``). Its short TTL bounds
+    staleness if a pub/sub message is lost.
+    """
+
+    def __init__(self, remote: CacheStorage, local: LocalCache) -> None:
+        self._remote = remote
+        self._local = local
+
+    async def get_value(self, key: str) -> str | bytes | None:
+        value = self._local.get(key)
+        if value is not None:
+            return value
+        value = await self._remote.get_value(key)
+        if value is not None:
+            self._local.set(key, value)
+        return value
+
+    async def get_many(self, keys: Sequence[str]) -> list[str | bytes | None]:
+        values = [self._local.get(key) for key in keys]
+        missing = [i for i, value in enumerate(values) if value is None]
+        if not missing:
+            return values
+        fetched = await self._remote.get_many([keys[i] for i in missing])
+        for i, value in zip(missing, fetched):
+            if value is not None:
+                self._local.set(keys[i], value)
+                values[i] = value
+        return values
+
+    async def set_value(
+        self, key: str, value: str | bytes, ttl_seconds: int | None = None
+    ) -> None:
+        await self._remote.set_value(key, value, ttl_seconds)
+        self._local.set(key, value, ttl_seconds)
+
+    async def delete_value(self, key: str) -> None:
+        self._local.delete(key)
+        await self._remote.delete_value(key)
+
+    async def delete_value_by_pattern(self, pattern: str) -> None:
+        self._local.delete_matching(pattern)
+        await self._remote.delete_value_by_pattern(pattern)
+
+    async def exists_value(self, key: str) -> bool:
+        if self._local.get(key) is not None:
+            return True
+        return await self._remote.exists_value(key)
+
+    async def get_generation(self, namespace: str) -> int:
+        # Хранится в локальном слое под ключом пространства имён, поэтому
+        # сообщение инвалидации "<namespace>:*" сбрасывает и его.
+        local_key = self._generation_key(namespace)
+        cached = self._local.get(local_key)
+        if cached is not None:
+            return int(cached)
+        generation = await self._remote.get_generation(namespace)
+        self._local.set(local_key, str(generation))
+        return generation
+
+    async def bump_generation(self, namespace: str) -> int:
+        generation = await self._remote.bump_generation(namespace)
+        self._local.set(self._generation_key(namespace), str(generation))
+        return generation
+
+    def invalidate_local(self, *, key: str | None = None, pattern: str | None = None) -> None:
+        """Evict entries from the local tier only; ``None`` for both clears it."""
+        if key is not None:
+            self._local.delete(key)
+        if pattern is not None:
+            self._local.delete_matching(pattern)
+        if key is None and pattern is None:
+            self._local.clear()
+
+    @staticmethod
+    def _generation_key(namespace: str) -> str:
+        return f"{namespace}:generation"
@@ -0,0 +1,249 @@
+"""Read-through cache with stampede protection."""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+from redis.asyncio import Redis, RedisError
+from redis.asyncio.lock import Lock
+from redis.exceptions import LockError
+
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
+from shop.app.core.exceptions import StorageUnavailableError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_WAIT_POLL_SECONDS = 0.05
+
+
+class RedisReadThroughCache(ReadThroughCache):
+    """
+    Read-through cache over ``CacheStorage`` that keeps a key from being
+    rebuilt by many workers at once.
+
+    - in-process single-flight: concurrent misses for one key share one load,
+      which runs in its own task, so a cancelled caller does not abort it;
+    - cross-process lock (``SET NX`` with expiry): only the lock holder loads,
+      other instances poll the cache until the value appears or the lock
+      timeout passes, then load themselves;
+    - entries are stored as one ``codec`` blob: ``[fresh_until, payload]``;
+    - stale-while-revalidate: values are stored with a "fresh until" stamp and
+      kept in Redis ``stale_seconds`` longer; a stale hit is returned at once
+      and refreshed in the background by the lock holder. The refresh stores
+      its result only if the entry is still the stale one it started from, so
+      an invalidation (or a newer write) during the load is not overwritten.
+      ``loader`` may therefore run after the request that supplied it has
+      finished and must not depend on request-scoped resources.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage: CacheStorage,
+        client: Redis,
+        codec: CacheCodec,
+        stale_seconds: int,
+        lock_timeout_seconds: float,
+    ) -> None:
+        self._storage = storage
+        self._client = client
+        self._codec = codec
+        self._stale_seconds = stale_seconds
+        self._lock_timeout_seconds = lock_timeout_seconds
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._refreshing_keys: set[str] = set()
+        self._refreshing: set[asyncio.Task] = set()
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        *,
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        try:
+            raw = await self._storage.get_value(key)
+        except StorageUnavailableError:
+            logger.warning("Cache unavailable, loading %s directly", key, exc_info=True)
+            return await loader()
+
+        if raw is not None:
+            fresh_until, payload = self._unpack(raw)
+            if fresh_until is not None:
+                if fresh_until < time.time():
+                    self._refresh_in_background(key, raw, loader, encode, ttl_seconds)
+                try:
+                    return decode(payload)
+                except (KeyError, TypeError, ValueError):
+                    logger.warning("Cache entry corrupt, reloading: %s", key, exc_info=True)
+
+        return await self._single_flight(key, loader, encode, decode, ttl_seconds)
+
+    async def _single_flight(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            # Загрузка идёт в отдельной задаче: отмена запроса-лидера (обрыв соединения)
+            # не отменяет её и не роняет остальных ожидающих этот ключ.
+            inflight = asyncio.create_task(
+                self._load_with_lock(key, loader, encode, decode, ttl_seconds)
+            )
+            self._inflight[key] = inflight
+            inflight.add_done_callback(lambda task: self._forget_inflight(key, task))
+        return await asyncio.shield(inflight)
+
+    def _forget_inflight(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Исключение уже отдано ожидающим; их может и не остаться.
+            task.exception()
+
+    async def _load_with_lock(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        decode: Callable[[Any], T],
+        ttl_seconds: int | None,
+    ) -> T:
+        lock = self._client.lock(self._lock_key(key), timeout=self._lock_timeout_seconds)
+        try:
+            acquired = await lock.acquire(blocking=False)
+        except RedisError:
+            logger.warning("Cache lock unavailable for %s", key, exc_info=True)
+            acquired = False
+            lock = None
+
+        if acquired:
+            try:
+                return await self._load_and_store(key, loader, encode, ttl_seconds)
+            finally:
+                await self._release(lock)
+
+        if lock is not None:
+            deadline = time.monotonic() + self._lock_timeout_seconds
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_WAIT_POLL_SECONDS)
+                try:
+                    raw = await self._storage.get_value(key)
+                except StorageUnavailableError:
+                    break
+                if raw is not None:
+                    fresh_until, payload = self._unpack(raw)
+                    if fresh_until is not None:
+                        try:
+                            return decode(payload)
+                        except (KeyError, TypeError, ValueError):
+                            break
+
+        return await self._load_and_store(key, loader, encode, ttl_seconds)
+
+    def _refresh_in_background(
+        self,
+        key: str,
+        stale_raw: str | bytes,
+        loader: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        ttl_seconds: int | None,
+    ) -> None:
+        if key in self._refreshing_keys or key in self._inflight:
+            return
+        self._refreshing_keys.add(key)
+        task = asyncio.create_task(self._refresh(key, stale_raw, loader, encode, ttl_seconds))
+        self._refreshing.add(task)
+        task.add_done_callback(self._refreshing.discard)
+
+    async def _refresh(
+        self,
+        key: str,
+        stale_raw: str | bytes,
+        loader: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        ttl_seconds: int | None,
+    ) -> None:
+        lock = self._client.lock(self._lock_key(key), timeout=self._lock_timeout_seconds)
+        try:
+            if not await lock.acquire(blocking=False):
+                return
+            try:
+                await self._load_and_store(
+                    key, loader, encode, ttl_seconds, expected_raw=stale_raw
+                )
+            finally:
+                await self._release(lock)
+        except Exception:
+            logger.warning("Background cache refresh failed: %s", key, exc_info=True)
+        finally:
+            self._refreshing_keys.discard(key)
+
+    async def _load_and_store(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[T]],
+        encode: Callable[[T], Any],
+        ttl_seconds: int | None,
+        *,
+        expected_raw: str | bytes | None = None,
+    ) -> T:
+        value = await loader()
+        try:
+            if expected_raw is not None and not await self._unchanged(key, expected_raw):
+                # Ключ инвалидировали (или уже перезаписали) во время загрузки:
+                # значение могло быть прочитано до изменения — не записываем его.
+                logger.debug("Cache entry changed during refresh, not storing: %s", key)
+                return value
+            fresh_seconds = ttl_seconds or 0
+            stored_ttl = fresh_seconds + self._stale_seconds if fresh_seconds else None
+            fresh_until = time.time() + fresh_seconds if fresh_seconds else float("inf")
+            await self._storage.set_value(
+                key, self._pack(fresh_until, encode(value)), ttl_seconds=stored_ttl
+            )
+        except (StorageUnavailableError, TypeError, ValueError):
+            logger.warning("Failed to write cache entry: %s", key, exc_info=True)
+        return value
+
+    async def _unchanged(self, key: str, expected_raw: str | bytes) -> bool:
+        # Окно между этой проверкой и записью — один round trip, а не вся загрузка.
+        current = await self._storage.get_value(key)
+        return current is not None and self._as_bytes(current) == self._as_bytes(expected_raw)
+
+    @staticmethod
+    async def _release(lock: Lock) -> None:
+        try:
+            await lock.release()
+        except (LockError, RedisError):
+            # Замок истёк или Redis недоступен — он снимется по таймауту.
+            pass
+
+    def _pack(self, fresh_until: float, payload: Any) -> bytes:
+        return self._codec.encode([fresh_until, payload])
+
+    def _unpack(self, raw: str | bytes) -> tuple[float | None, Any]:
+        try:
+            fresh_until, payload = self._codec.decode(self._as_bytes(raw))
+            return float(fresh_until), payload
+        except (TypeError, ValueError):
+            return None, None
+
+    @staticmethod
+    def _as_bytes(raw: str | bytes) -> bytes:
+        return raw.encode("utf-8") if isinstance(raw, str) else raw
+
+    @staticmethod
+    def _lock_key(key: str) -> str:
+        return f"cache:lock:{key}"
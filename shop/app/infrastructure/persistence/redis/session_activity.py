@@ -0,0 +1,193 @@
+"""Write-behind session activity and a short-lived session -> user cache."""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+from shop.app.application.interfaces.persistence.session_storage import SessionActivityStore
+from shop.app.core.exceptions import StorageUnavailableError
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class SessionActivityStats:
+    user_cache_hits: int = 0
+    user_cache_misses: int = 0
+    touches: int = 0
+    coalesced: int = 0
+    written: int = 0
+    failed: int = 0
+    flushes: int = 0
+    pending: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class SessionServiceActivityStore(SessionActivityStore):
+    """
+    Flushes a batch through ``SessionService.update_activity``, so a flushed
+    session gets the same side effects (sliding TTL, its entry in the user's
+    sessions list) as the old per-request call. The batch timestamps are not
+    passed on: ``update_activity`` stamps the flush time, which lags the last
+    request by at most one flush interval.
+    """
+
+    def __init__(
+        self,
+        update_activity: Callable[[str], Awaitable[None]],
+        *,
+        max_concurrency: int,
+    ) -> None:
+        self._update_activity = update_activity
+        self._max_concurrency = max_concurrency
+
+    async def touch_many(self, last_seen: Mapping[str, float]) -> None:
+        if not last_seen:
+            return
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def touch(session_id: str) -> None:
+            async with semaphore:
+                await self._update_activity(session_id)
+
+        results = await asyncio.gather(
+            *(touch(session_id) for session_id in last_seen), return_exceptions=True
+        )
+        errors = [result for result in results if isinstance(result, Exception)]
+        if errors:
+            raise StorageUnavailableError(
+                f"Failed to update activity for {len(errors)} of {len(last_seen)} sessions"
+            ) from errors[0]
+
+
+class SessionActivityTracker:
+    """
+    Keeps per-request session bookkeeping off Redis.
+
+    ``touch`` records activity in process memory and is a no-op if this
+    process already reported the session within ``granularity_seconds``, so
+    last-seen is accurate to that granularity. A background task writes the
+    pending timestamps to ``store`` every ``flush_interval_seconds`` in one
+    batch; a failed batch is logged and dropped (the next touch after the
+    granularity reports the session again). ``close`` flushes what is left.
+
+    ``get_user`` caches the user resolved for a session for
+    ``user_cache_ttl_seconds``: an invalidated session may keep working on
+    this instance for at most that long.
+    """
+
+    def __init__(
+        self,
+        *,
+        store: SessionActivityStore,
+        granularity_seconds: float,
+        flush_interval_seconds: float,
+        user_cache_ttl_seconds: float,
+        user_cache_max_entries: int,
+        clock: Callable[[], float] = time.monotonic,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._store = store
+        self._granularity_seconds = granularity_seconds
+        self._flush_interval_seconds = flush_interval_seconds
+        self._user_cache_ttl_seconds = user_cache_ttl_seconds
+        self._user_cache_max_entries = user_cache_max_entries
+        self._clock = clock
+        self._wall_clock = wall_clock
+        # session_id -> unix time последней активности, ещё не записанной в store.
+        self._pending: dict[str, float] = {}
+        # session_id -> момент (clock), когда активность сессии последний раз ушла в запись.
+        self._reported_at: dict[str, float] = {}
+        self._users: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._task: asyncio.Task[None] | None = None
+        self._stats = SessionActivityStats()
+
+    @property
+    def stats(self) -> SessionActivityStats:
+        self._stats.pending = len(self._pending)
+        return self._stats
+
+    async def get_user(self, session_id: str, load: Callable[[str], Awaitable[Any]]) -> Any:
+        """User for the session from the local cache, else from ``load``; ``None`` is not cached."""
+        now = self._clock()
+        entry = self._users.get(session_id)
+        if entry is not None:
+            expires_at, user = entry
+            if expires_at > now:
+                self._stats.user_cache_hits += 1
+                self._users.move_to_end(session_id)
+                return user
+            del self._users[session_id]
+
+        self._stats.user_cache_misses += 1
+        user = await load(session_id)
+        if user is not None:
+            self._users[session_id] = (self._clock() + self._user_cache_ttl_seconds, user)
+            while len(self._users) > self._user_cache_max_entries:
+                self._users.popitem(last=False)
+        return user
+
+    def forget(self, session_id: str) -> None:
+        """Drop a session from the local caches (logout / invalidation on this instance)."""
+        self._users.pop(session_id, None)
+        self._pending.pop(session_id, None)
+        self._reported_at.pop(session_id, None)
+
+    def touch(self, session_id: str) -> bool:
+        """Record activity; ``False`` if it was coalesced into an earlier report."""
+        self._stats.touches += 1
+        now = self._clock()
+        reported_at = self._reported_at.get(session_id)
+        if reported_at is not None and now - reported_at < self._granularity_seconds:
+            self._stats.coalesced += 1
+            return False
+        self._reported_at[session_id] = now
+        self._pending[session_id] = self._wall_clock()
+        return True
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="session-activity-flush")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.flush()
+
+    async def flush(self) -> None:
+        self._prune_reported()
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, {}
+        try:
+            await self._store.touch_many(batch)
+        except Exception:
+            self._stats.failed += len(batch)
+            logger.warning("Failed to write activity for %d sessions", len(batch), exc_info=True)
+            return
+        self._stats.flushes += 1
+        self._stats.written += len(batch)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval_seconds)
+            await self.flush()
+
+    def _prune_reported(self) -> None:
+        # Отметки старше гранулярности уже ничего не подавляют — держим словарь маленьким.
+        horizon = self._clock() - self._granularity_seconds
+        stale = [sid for sid, at in self._reported_at.items() if at <= horizon]
+        for session_id in stale:
+            del self._reported_at[session_id]
@@ -19,6 +19,8 @@ class FileValidator(FileValidator):
         self._validate_extension(source)
 
     def _validate_size(self, source: UploadSource) -> None:
+        # Content-Length от клиента — только ранний отказ; фактический размер
+        # проверяет хранилище по прочитанным байтам при загрузке.
         if source.content_length is not None and source.content_length > self._rules.max_size_bytes:
             raise StorageValidationError(
                 f"File too large ({source.content_length} bytes). Limit: {self._rules.max_size_bytes}"
@@ -0,0 +1,92 @@
+"""
+Rendering of responsive image derivatives.
+
+Functions here are CPU-bound and take/return only picklable values: the
+pipeline runs them in a ``ProcessPoolExecutor`` so resizing never blocks the
+event loop (Pillow releases the GIL only partially).
+"""
+
+import io
+from dataclasses import dataclass
+
+from PIL import Image, ImageOps
+
+DERIVATIVE_PREFIX = "derivatives"
+WEBP_FORMAT = "webp"
+
+_CONTENT_TYPES = {
+    "webp": "image/webp",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedImage:
+    # slot — запрошенная ширина (часть ключа), width — фактическая ширина копии.
+    slot: int
+    width: int
+    format: str
+    data: bytes
+
+    @property
+    def content_type(self) -> str:
+        return _CONTENT_TYPES[self.format]
+
+
+def derivative_key(source_key: str, slot: int, fmt: str) -> str:
+    return f"{DERIVATIVE_PREFIX}/{source_key.lstrip('/')}/w{slot}.{fmt}"
+
+
+def derivative_keys(source_key: str, widths: tuple[int, ...]) -> list[str]:
+    """Все ключи, которые могли быть созданы для ``source_key`` (для удаления)."""
+    return [derivative_key(source_key, slot, fmt) for slot in widths for fmt in _CONTENT_TYPES]
+
+
+def target_widths(source_width: int, widths: tuple[int, ...]) -> list[tuple[int, int]]:
+    """
+    Pairs ``(slot, width)`` without upscaling: slots at or above the source
+    width collapse into one copy of the source width under the smallest of them.
+    """
+    targets = [(slot, slot) for slot in sorted(set(widths)) if slot < source_width]
+    wider = [slot for slot in widths if slot >= source_width]
+    if wider:
+        targets.append((min(wider), source_width))
+    return targets
+
+
+def render_derivatives(data: bytes, widths: tuple[int, ...], quality: int) -> list[RenderedImage]:
+    """
+    Resize ``data`` to each target width, as WebP and as JPEG (PNG when the
+    source has transparency) for clients without WebP support.
+    """
+    with Image.open(io.BytesIO(data)) as source:
+        image = ImageOps.exif_transpose(source)
+        has_alpha = image.mode in ("RGBA", "LA") or (
+            image.mode == "P" and "transparency" in image.info
+        )
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        fallback = "png" if has_alpha else "jpeg"
+
+        rendered: list[RenderedImage] = []
+        for slot, width in target_widths(image.width, widths):
+            height = max(1, round(image.height * width / image.width))
+            resized = (
+                image
+                if width == image.width
+                else image.resize((width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            )
+            for fmt in (WEBP_FORMAT, fallback):
+                rendered.append(RenderedImage(slot, width, fmt, _encode(resized, fmt, quality)))
+        return rendered
+
+
+def _encode(image: Image.Image, fmt: str, quality: int) -> bytes:
+    buffer = io.BytesIO()
+    if fmt == "webp":
+        image.save(buffer, "WEBP", quality=quality, method=4)
+    elif fmt == "jpeg":
+        image.save(buffer, "JPEG", quality=quality, optimize=True, progressive=True)
+    else:
+        image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
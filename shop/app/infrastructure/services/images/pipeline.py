@@ -0,0 +1,197 @@
+"""Background generation of responsive image derivatives after upload."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from concurrent.futures import Executor
+from dataclasses import asdict, dataclass
+
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.repositories import UnitOfWork
+from shop.app.application.interfaces.services.files.file_storage import FileStorage
+from shop.app.application.interfaces.services.files.image_derivatives import (
+    ImageDerivativeScheduler,
+)
+from shop.app.core.exceptions import StorageUnavailableError
+from shop.app.domain.value_objects.catalog_values import ImageDerivative, StorageKey
+from shop.app.infrastructure.services.images.derivatives import (
+    RenderedImage,
+    derivative_key,
+    derivative_keys,
+    render_derivatives,
+)
+
+logger = logging.getLogger(__name__)
+
+_RENDER = "render"
+_DISCARD = "discard"
+_PRODUCTS_CACHE_NAMESPACE = "products"
+
+
+@dataclass(slots=True)
+class ImageDerivativeStats:
+    scheduled: int = 0
+    dropped: int = 0
+    rendered: int = 0
+    discarded: int = 0
+    failed: int = 0
+    queue_size: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class ImageDerivativePipeline(ImageDerivativeScheduler):
+    """
+    Bounded queue of derivative jobs processed by ``concurrency`` worker tasks.
+
+    For a scheduled key the worker downloads the original, renders every
+    width in WebP and a fallback format in ``executor`` (a process pool),
+    uploads the copies next to the original and records them on the product
+    images / product thumbnails stored under that key, then bumps the
+    ``products`` cache generation so cached listings pick the copies up.
+    Until then presenters serve the original. Like ``EventLogBatcher``, scheduling never waits:
+    jobs over ``max_queue_size`` are dropped and counted. A failed job is
+    logged and discarded. ``close`` waits up to ``drain_timeout_seconds``
+    for queued jobs.
+    """
+
+    def __init__(
+        self,
+        *,
+        storage: FileStorage,
+        uow_factory: Callable[[], UnitOfWork],
+        cache: CacheStorage,
+        executor: Executor,
+        widths: tuple[int, ...],
+        quality: int,
+        max_queue_size: int,
+        concurrency: int,
+        drain_timeout_seconds: float,
+    ) -> None:
+        self._storage = storage
+        self._uow_factory = uow_factory
+        self._cache = cache
+        self._executor = executor
+        self._widths = tuple(sorted(set(widths)))
+        self._quality = quality
+        self._queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=max_queue_size)
+        self._concurrency = concurrency
+        self._drain_timeout_seconds = drain_timeout_seconds
+        self._tasks: list[asyncio.Task[None]] = []
+        self._stats = ImageDerivativeStats()
+
+    @property
+    def stats(self) -> ImageDerivativeStats:
+        self._stats.queue_size = self._queue.qsize()
+        return self._stats
+
+    def schedule(self, storage_key: str) -> bool:
+        return self._submit(_RENDER, storage_key)
+
+    def discard(self, storage_key: str) -> bool:
+        return self._submit(_DISCARD, storage_key)
+
+    def _submit(self, kind: str, storage_key: str) -> bool:
+        try:
+            self._queue.put_nowait((kind, storage_key))
+        except asyncio.QueueFull:
+            self._stats.dropped += 1
+            logger.warning("Image derivative queue is full, dropping %s of %s", kind, storage_key)
+            return False
+        self._stats.scheduled += 1
+        return True
+
+    async def start(self) -> None:
+        if self._tasks:
+            return
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"image-derivatives-{index}")
+            for index in range(self._concurrency)
+        ]
+
+    async def close(self) -> None:
+        if not self._tasks:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), self._drain_timeout_seconds)
+        except TimeoutError:
+            logger.warning(
+                "Image derivative queue not drained on shutdown, %d jobs lost",
+                self._queue.qsize(),
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _run(self) -> None:
+        while True:
+            kind, storage_key = await self._queue.get()
+            try:
+                if kind == _RENDER:
+                    await self._render(storage_key)
+                else:
+                    await self._discard(storage_key)
+            except Exception:
+                self._stats.failed += 1
+                logger.exception("Image derivative %s failed for %s", kind, storage_key)
+            finally:
+                self._queue.task_done()
+
+    async def _render(self, storage_key: str) -> None:
+        original = await self._storage.download(storage_key)
+        loop = asyncio.get_running_loop()
+        rendered: list[RenderedImage] = await loop.run_in_executor(
+            self._executor, render_derivatives, original, self._widths, self._quality
+        )
+        del original
+
+        derivatives = tuple(
+            ImageDerivative(
+                width=item.width,
+                format=item.format,
+                storage_key=StorageKey(derivative_key(storage_key, item.slot, item.format)),
+            )
+            for item in rendered
+        )
+        await asyncio.gather(
+            *(
+                self._storage.upload_bytes(derivative.storage_key, item.data, item.content_type)
+                for derivative, item in zip(derivatives, rendered)
+            )
+        )
+
+        async with self._uow_factory() as uow:
+            recorded = await uow.product_images.set_derivatives(storage_key, derivatives)
+            recorded += await uow.products.set_thumbnail_derivatives(storage_key, derivatives)
+            await uow.commit()
+
+        if not recorded:
+            # Оригинал успели удалить или заменить — копии никому не нужны.
+            await self._discard(storage_key)
+            return
+        self._stats.rendered += 1
+        await self._invalidate_products()
+
+    async def _invalidate_products(self) -> None:
+        # Как ProductService._after_mutation, но без pub/sub: PubSubService собирается
+        # вне этого дерева, и другие инстансы увидят новое поколение по истечении
+        # TTL локального слоя (LOCAL_CACHE_TTL_SECONDS).
+        try:
+            await self._cache.bump_generation(_PRODUCTS_CACHE_NAMESPACE)
+        except StorageUnavailableError:
+            logger.warning(
+                "Product cache unavailable, listings keep originals until it expires",
+                exc_info=True,
+            )
+
+    async def _discard(self, storage_key: str) -> None:
+        results = await asyncio.gather(
+            *(self._storage.delete(key) for key in derivative_keys(storage_key, self._widths)),
+            return_exceptions=True,
+        )
+        failed = [result for result in results if isinstance(result, Exception)]
+        if failed:
+            raise failed[0]
+        self._stats.discarded += 1
@@ -0,0 +1,170 @@
+"""In-process snapshot of role -> permission data compiled to bitsets."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Collection, Hashable, Iterable, Mapping
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+
+from shop.app.application.interfaces.repositories import UnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Все биты установлены: у роли-суперпользователя есть любое право, в том числе ещё не известное.
+ALL_PERMISSIONS = -1
+
+
+@dataclass(frozen=True, slots=True)
+class PermissionSnapshot:
+    """
+    Immutable role -> permission data at one ``version``. Each permission
+    name owns one bit; a role is the OR of its bits, so checking a compiled
+    requirement is a dict lookup and an AND.
+    """
+
+    version: int
+    permission_bits: Mapping[str, int]
+    role_masks: Mapping[Hashable, int]
+
+    @classmethod
+    def build(
+        cls,
+        version: int,
+        role_permissions: Mapping[Hashable, Iterable[str]],
+        superuser_role_ids: Collection[Hashable] = (),
+    ) -> "PermissionSnapshot":
+        names = sorted({name for granted in role_permissions.values() for name in granted})
+        bits = {name: 1 << index for index, name in enumerate(names)}
+        masks: dict[Hashable, int] = {}
+        for role_id, granted in role_permissions.items():
+            mask = 0
+            for name in granted:
+                mask |= bits[name]
+            masks[role_id] = mask
+        for role_id in superuser_role_ids:
+            masks[role_id] = ALL_PERMISSIONS
+        return cls(
+            version=version,
+            permission_bits=MappingProxyType(bits),
+            role_masks=MappingProxyType(masks),
+        )
+
+    def compile(self, names: Iterable[str]) -> int:
+        """Mask of ``names`` for ``allows``; valid only for this snapshot."""
+        # Право, которого нет ни у одной роли, — бит за пределами известных: его нет ни у кого,
+        # кроме суперпользователя.
+        unknown = 1 << len(self.permission_bits)
+        mask = 0
+        for name in names:
+            mask |= self.permission_bits.get(name, unknown)
+        return mask
+
+    def allows(self, role_id: Hashable, mask: int) -> bool:
+        return self.role_masks.get(role_id, 0) & mask == mask
+
+
+@dataclass(slots=True)
+class AccessPolicyStats:
+    version: int = -1
+    roles: int = 0
+    permissions: int = 0
+    polls: int = 0
+    reloads: int = 0
+    failed: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class AccessPolicySnapshotProvider:
+    """
+    Holds the current ``PermissionSnapshot`` for permission checks that
+    never touch Postgres.
+
+    Every ``refresh_interval_seconds`` a background task reads the policy
+    version (bumped by triggers on any role/permission change) and, only
+    when it moved, reloads all roles with their permissions in the same
+    read-only transaction and swaps the snapshot. A change therefore
+    reaches every instance within one interval. Roles in
+    ``superuser_role_ids`` / ``superuser_role_names`` are granted every
+    permission. ``start`` loads the first snapshot and fails if it cannot;
+    later failed polls are logged and the previous snapshot stays in use.
+    """
+
+    def __init__(
+        self,
+        *,
+        uow_factory: Callable[[], UnitOfWork],
+        refresh_interval_seconds: float,
+        superuser_role_ids: Collection[Hashable] = (),
+        superuser_role_names: Collection[str] = (),
+    ) -> None:
+        self._uow_factory = uow_factory
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._superuser_role_ids = frozenset(superuser_role_ids)
+        self._superuser_role_names = frozenset(name.lower() for name in superuser_role_names)
+        self._snapshot = PermissionSnapshot.build(version=-1, role_permissions={})
+        self._task: asyncio.Task[None] | None = None
+        self._stats = AccessPolicyStats()
+
+    @property
+    def current(self) -> PermissionSnapshot:
+        return self._snapshot
+
+    @property
+    def stats(self) -> AccessPolicyStats:
+        snapshot = self._snapshot
+        self._stats.version = snapshot.version
+        self._stats.roles = len(snapshot.role_masks)
+        self._stats.permissions = len(snapshot.permission_bits)
+        return self._stats
+
+    async def refresh(self) -> bool:
+        """Reload the snapshot if the stored version changed; ``True`` if it was swapped."""
+        self._stats.polls += 1
+        async with self._uow_factory() as uow:
+            version = await uow.roles.get_policy_version()
+            if version == self._snapshot.version:
+                return False
+            roles = await uow.roles.list_all()
+
+        superusers = [
+            role.id
+            for role in roles
+            if role.id in self._superuser_role_ids
+            or role.name.lower() in self._superuser_role_names
+        ]
+        self._snapshot = PermissionSnapshot.build(
+            version=version,
+            role_permissions={
+                role.id: [permission.name for permission in role.permissions] for role in roles
+            },
+            superuser_role_ids=superusers,
+        )
+        self._stats.reloads += 1
+        return True
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        await self.refresh()
+        self._task = asyncio.create_task(self._run(), name="access-policy-refresh")
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval_seconds)
+            try:
+                await self.refresh()
+            except Exception:
+                self._stats.failed += 1
+                logger.warning("Failed to refresh access policy snapshot", exc_info=True)
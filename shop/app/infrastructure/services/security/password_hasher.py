@@ -0,0 +1,91 @@
+"""bcrypt hashing off the event loop on a bounded thread pool."""
+
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import TypeVar
+
+from shop.app.application.interfaces.auth.password_hasher import PasswordHasher
+from shop.app.core.exceptions import ApplicationOverloadedError
+from shop.app.utils.security import hash_password, verify_password
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class PasswordHasherStats:
+    completed: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    queue_depth: int = 0
+    max_queue_depth: int = 0
+    max_wait_ms: float = 0.0
+    total_wait_ms: float = 0.0
+
+    def as_dict(self) -> dict[str, int | float]:
+        return asdict(self)
+
+
+class BcryptPasswordHasher(PasswordHasher):
+    """
+    Runs ``hash_password`` / ``verify_password`` on ``max_workers`` threads.
+
+    bcrypt releases the GIL while hashing, so workers hash in parallel and
+    the event loop keeps serving other requests. At most ``max_pending``
+    calls wait for a free worker; beyond that a call is rejected at once
+    with ``ApplicationOverloadedError`` (503) instead of queueing behind
+    seconds of hashing. ``stats`` reports the queue depth and time spent
+    waiting for a worker.
+    """
+
+    def __init__(self, *, max_workers: int, max_pending: int) -> None:
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+        self._max_workers = max_workers
+        self._capacity = max_workers + max_pending
+        self._stats = PasswordHasherStats()
+
+    @property
+    def stats(self) -> PasswordHasherStats:
+        self._stats.queue_depth = max(0, self._stats.in_flight - self._max_workers)
+        return self._stats
+
+    async def hash(self, password: str) -> str:
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, password, hashed_password)
+
+    def close(self) -> None:
+        # Не ждём: close зовётся из event loop, а хеш, который уже считается,
+        # может занять сотни миллисекунд. Ожидающие вызовы отменяются.
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _run(self, fn: Callable[..., T], *args: object) -> T:
+        stats = self._stats
+        if stats.in_flight >= self._capacity:
+            stats.rejected += 1
+            raise ApplicationOverloadedError(
+                "Too many password operations in progress, retry later",
+                details={"capacity": self._capacity},
+            )
+        stats.in_flight += 1
+        stats.max_queue_depth = max(stats.max_queue_depth, stats.in_flight - self._max_workers)
+        submitted_at = time.perf_counter()
+
+        def call() -> tuple[float, T]:
+            # Время ожидания свободного потока — до начала самого хеширования.
+            return time.perf_counter(), fn(*args)
+
+        try:
+            started_at, result = await asyncio.get_running_loop().run_in_executor(
+                self._executor, call
+            )
+        finally:
+            stats.in_flight -= 1
+        wait_ms = (started_at - submitted_at) * 1000
+        stats.completed += 1
+        stats.total_wait_ms += wait_ms
+        stats.max_wait_ms = max(stats.max_wait_ms, wait_ms)
+        return result
@@ -0,0 +1,92 @@
+"""Verified access-token cache: a JWT is checked once per process, not per request."""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Any
+
+from shop.app.utils.security import decode_token, hash_token
+
+ACCESS_TOKEN_SCOPE = "access_token"
+
+
+@dataclass(frozen=True, slots=True)
+class AccessTokenClaims:
+    subject: str | None
+    session_id: str | None
+    scope: str | None
+    expires_at: float | None
+    # Только для чтения: один и тот же объект отдаётся всем запросам с этим токеном.
+    payload: Mapping[str, Any]
+
+    @classmethod
+    def from_payload(cls, payload: dict[str, Any]) -> "AccessTokenClaims":
+        exp = payload.get("exp")
+        return cls(
+            subject=payload.get("sub"),
+            session_id=payload.get("sid"),
+            scope=payload.get("scope"),
+            expires_at=float(exp) if exp is not None else None,
+            payload=MappingProxyType(dict(payload)),
+        )
+
+
+@dataclass(slots=True)
+class TokenVerifierStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evicted: int = 0
+    size: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class AccessTokenVerifier:
+    """
+    Decodes tokens with ``decode_token`` and keeps verified access tokens
+    in an LRU of at most ``max_entries``, keyed by the token's SHA-256
+    digest (the token itself is never stored). An entry is served until the
+    token's ``exp``; after that the token is decoded again, which rejects it
+    as expired. Tokens of other scopes, without ``exp`` and invalid tokens
+    are not cached. Errors of ``decode_token`` propagate unchanged.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, AccessTokenClaims] = OrderedDict()
+        self._stats = TokenVerifierStats()
+
+    @property
+    def stats(self) -> TokenVerifierStats:
+        self._stats.size = len(self._entries)
+        return self._stats
+
+    def verify(self, token: str) -> AccessTokenClaims:
+        digest = hash_token(token)
+        claims = self._entries.get(digest)
+        if claims is not None:
+            if claims.expires_at is not None and claims.expires_at > self._clock():
+                self._entries.move_to_end(digest)
+                self._stats.hits += 1
+                return claims
+            del self._entries[digest]
+            self._stats.expired += 1
+
+        self._stats.misses += 1
+        claims = AccessTokenClaims.from_payload(decode_token(token))
+        if claims.scope == ACCESS_TOKEN_SCOPE and claims.expires_at is not None:
+            self._entries[digest] = claims
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evicted += 1
+        return claims
@@ -1,3 +1,7 @@
+import asyncio
+import logging
+from typing import BinaryIO
+
 from aiobotocore.client import AioBaseClient
 
 from botocore.exceptions import ClientError, BotoCoreError
@@ -7,33 +11,174 @@ from shop.app.core.exceptions import StorageUnavailableError, StorageValidationE
 from shop.app.application.interfaces.services.files.file_storage import FileStorage
 from shop.app.models.contract.upload_source import UploadSource
 
+logger = logging.getLogger(__name__)
+
+# Минимальный размер части multipart upload в S3 (кроме последней).
+MIN_PART_SIZE_BYTES = 5 * 1024 * 1024
+
 
 class S3FieStorage(FileStorage):
-    """File storage adapter S3-compatible client surface"""
+    """
+    File storage adapter S3-compatible client surface
 
-    def __init__(self, *, client: AioBaseClient, bucket_name: str) -> None:
+    Uploads are read from the source stream in ``part_size`` chunks off the
+    event loop. A source that fits in one chunk is stored with a single
+    put_object; larger ones go through a multipart upload with at most
+    ``max_concurrency`` parts in flight, so memory stays bounded by
+    ``part_size * (max_concurrency + 1)``. The size limit is enforced on the
+    bytes actually read, not on the client's Content-Length; a failed or
+    oversized multipart upload is aborted.
+    """
+
+    def __init__(
+        self,
+        *,
+        client: AioBaseClient,
+        bucket_name: str,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+        max_size_bytes: int | None = None,
+    ) -> None:
+        if part_size < MIN_PART_SIZE_BYTES:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE_BYTES} bytes")
         self._client = client
         self._bucket_name = bucket_name
+        self._part_size = part_size
+        self._max_concurrency = max_concurrency
+        self._max_size_bytes = max_size_bytes
 
     async def upload(self, storage_key: str, source: UploadSource) -> str:
         await self._upload_to_s3(source, storage_key)
         return storage_key
 
+    async def upload_bytes(self, storage_key: str, data: bytes, content_type: str) -> str:
+        self._check_size(len(data))
+        try:
+            await self._client.put_object(
+                Body=data,
+                Bucket=self._bucket_name,
+                Key=storage_key,
+                ContentType=content_type,
+            )
+        except (ClientError, BotoCoreError) as exc:
+            raise StorageUnavailableError("Failed to upload object to storage") from exc
+        return storage_key
+
+    async def download(self, key: str) -> bytes:
+        if not key:
+            raise StorageValidationError("Invalid key")
+        try:
+            response = await self._client.get_object(Bucket=self._bucket_name, Key=key)
+            async with response["Body"] as body:
+                return await body.read()
+        except (ClientError, BotoCoreError) as exc:
+            raise StorageUnavailableError("Failed to download object from storage") from exc
+
     async def delete(self, key: str) -> None:
         if not key:
             raise StorageValidationError("Invalid key")
         await self._delete_from_s3(key)
 
     async def _upload_to_s3(self, source: UploadSource, storage_key: str) -> None:
+        first_chunk = await self._read_chunk(source.stream)
+        self._check_size(len(first_chunk))
         try:
-            await self._client.put_object(
-                Body=source.stream,
+            if len(first_chunk) < self._part_size:
+                await self._client.put_object(
+                    Body=first_chunk,
+                    Bucket=self._bucket_name,
+                    Key=storage_key,
+                    ContentType=source.content_type,
+                )
+            else:
+                await self._upload_multipart(source, storage_key, first_chunk)
+        except (ClientError, BotoCoreError) as exc:
+            raise StorageUnavailableError("Failed to upload object to storage") from exc
+
+    async def _upload_multipart(
+        self, source: UploadSource, storage_key: str, first_chunk: bytes
+    ) -> None:
+        kwargs = {"Bucket": self._bucket_name, "Key": storage_key}
+        if source.content_type:
+            kwargs["ContentType"] = source.content_type
+        upload = await self._client.create_multipart_upload(**kwargs)
+        upload_id = upload["UploadId"]
+
+        slots = asyncio.Semaphore(self._max_concurrency)
+        tasks: list[asyncio.Task[dict]] = []
+        try:
+            chunk, part_number, total = first_chunk, 1, 0
+            while chunk:
+                total += len(chunk)
+                self._check_size(total)
+                await slots.acquire()
+                self._raise_failed_part(tasks)
+                tasks.append(
+                    asyncio.create_task(
+                        self._upload_part(storage_key, upload_id, part_number, chunk, slots)
+                    )
+                )
+                part_number += 1
+                chunk = await self._read_chunk(source.stream)
+
+            parts = await asyncio.gather(*tasks)
+            await self._client.complete_multipart_upload(
                 Bucket=self._bucket_name,
                 Key=storage_key,
-                ContentType=source.content_type,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": parts},
             )
-        except (ClientError, BotoCoreError) as exc:
-            raise StorageUnavailableError("Failed to upload object to storage") from exc
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await self._abort_multipart(storage_key, upload_id)
+            raise
+
+    async def _upload_part(
+        self,
+        storage_key: str,
+        upload_id: str,
+        part_number: int,
+        body: bytes,
+        slots: asyncio.Semaphore,
+    ) -> dict:
+        try:
+            response = await self._client.upload_part(
+                Bucket=self._bucket_name,
+                Key=storage_key,
+                UploadId=upload_id,
+                PartNumber=part_number,
+                Body=body,
+            )
+        finally:
+            slots.release()
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    async def _abort_multipart(self, storage_key: str, upload_id: str) -> None:
+        try:
+            await self._client.abort_multipart_upload(
+                Bucket=self._bucket_name, Key=storage_key, UploadId=upload_id
+            )
+        except (ClientError, BotoCoreError):
+            # Незавершённые части подберёт lifecycle-правило бакета.
+            logger.warning("Failed to abort multipart upload %s for %s", upload_id, storage_key)
+
+    async def _read_chunk(self, stream: BinaryIO) -> bytes:
+        # SpooledTemporaryFile может лежать на диске — читаем не в event loop.
+        return await asyncio.to_thread(stream.read, self._part_size)
+
+    def _check_size(self, total: int) -> None:
+        if self._max_size_bytes is not None and total > self._max_size_bytes:
+            raise StorageValidationError(
+                f"File too large (more than {self._max_size_bytes} bytes)"
+            )
+
+    @staticmethod
+    def _raise_failed_part(tasks: list[asyncio.Task[dict]]) -> None:
+        for task in tasks:
+            if task.done() and not task.cancelled() and task.exception() is not None:
+                raise task.exception()
 
     async def _delete_from_s3(self, key: str) -> None:
         try:
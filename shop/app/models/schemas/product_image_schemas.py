@@ -9,6 +9,9 @@ class ProductImageOut(BaseModel):
     id: int
     product_id: int
     image_url: str
+    # Адаптивные копии; пока пайплайн их не построил — None.
+    srcset: str | None = None
+    srcset_webp: str | None = None
 
 
 class ProductImagesDeleteResponse(BaseModel):
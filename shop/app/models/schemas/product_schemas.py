@@ -24,3 +24,6 @@ class ProductUpdate(ProductBase):
 class ProductOut(ProductBase):
     id: int
     thumbnail_url: str
+    # Адаптивные копии миниатюры; пока пайплайн их не построил — None.
+    thumbnail_srcset: str | None = None
+    thumbnail_srcset_webp: str | None = None
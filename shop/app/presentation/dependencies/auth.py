@@ -1,20 +1,45 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 
+from shop.app.core.state import get_app_state
 from shop.app.utils.security import decode_token
-from shop.app.presentation.dependencies.session import get_session_service
+from shop.app.infrastructure.services.security.token_verifier import (
+    ACCESS_TOKEN_SCOPE,
+    AccessTokenClaims,
+    AccessTokenVerifier,
+)
+from shop.app.infrastructure.persistence.redis.session_activity import SessionActivityTracker
+from shop.app.presentation.dependencies.session import (
+    get_session_activity_tracker,
+    get_session_service,
+)
 from shop.app.models.schemas import UserOut
+from shop.app.services.login_attempt_service import LoginAttemptService
 from depricated.services.session_service import SessionService
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 
 
-async def get_current_user(
+async def get_token_verifier(request: Request) -> AccessTokenVerifier | None:
+    return get_app_state(request).token_verifier
+
+
+async def get_login_attempt_service(request: Request) -> LoginAttemptService | None:
+    return get_app_state(request).login_attempts
+
+
+async def get_access_token_claims(
     token: str = Depends(oauth2_scheme),
-    session_service: SessionService = Depends(get_session_service),
-) -> UserOut:
+    verifier: AccessTokenVerifier | None = Depends(get_token_verifier),
+) -> AccessTokenClaims:
+    """
+    Verified claims of the bearer token. FastAPI caches the dependency per
+    request, so get_current_user and the route share one decode.
+    """
     try:
-        payload = decode_token(token)
+        if verifier is not None:
+            return verifier.verify(token)
+        return AccessTokenClaims.from_payload(decode_token(token))
     except Exception:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -22,20 +47,29 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if payload.get("scope") != "access_token":
+
+async def get_current_user(
+    claims: AccessTokenClaims = Depends(get_access_token_claims),
+    session_service: SessionService = Depends(get_session_service),
+    activity: SessionActivityTracker | None = Depends(get_session_activity_tracker),
+) -> UserOut:
+    if claims.scope != ACCESS_TOKEN_SCOPE:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token scope",
         )
 
-    session_id = payload.get("sid")
+    session_id = claims.session_id
     if not session_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Missing session in token",
         )
 
-    user = await session_service.get_user_from_session(session_id)
+    if activity is not None:
+        user = await activity.get_user(session_id, session_service.get_user_from_session)
+    else:
+        user = await session_service.get_user_from_session(session_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -45,5 +79,9 @@ async def get_current_user(
     if not user.is_active:
         raise HTTPException(status_code=403, detail="User is disabled")
 
-    await session_service.update_activity(session_id)
+    if activity is not None:
+        # Активность копится в процессе и пишется пачками, а не на каждый запрос.
+        activity.touch(session_id)
+    else:
+        await session_service.update_activity(session_id)
     return user
@@ -1,7 +1,12 @@
+from collections.abc import Callable
+
 from fastapi import Request
 
 from shop.app.core.state import get_app_state
-from shop.app.infrastructure.persistence.postgres.repositories.unit_of_work import SqlUnitOfWork
+from shop.app.infrastructure.persistence.postgres.repositories.unit_of_work import (
+    SqlQuerySession,
+    SqlUnitOfWork,
+)
 
 
 async def get_db(request: Request):
@@ -16,3 +21,38 @@ async def get_uow(request: Request) -> SqlUnitOfWork:
 
     request.state.used_db = True
     return SqlUnitOfWork(pool=get_app_state(request).db_pool)
+
+
+async def get_readonly_uow(request: Request) -> SqlUnitOfWork:
+
+    request.state.used_db = True
+    app_state = get_app_state(request)
+    return SqlUnitOfWork(
+        pool=app_state.db_pool,
+        readonly=True,
+        replicas=app_state.db_replicas,
+    )
+
+
+# Фабрики отдают новый UoW на каждый вызов: загрузчик read-through кеша может
+# выполняться в фоне уже после ответа и не должен делить UoW с запросом.
+async def get_uow_factory(request: Request) -> Callable[[], SqlUnitOfWork]:
+
+    request.state.used_db = True
+    pool = get_app_state(request).db_pool
+    return lambda: SqlUnitOfWork(pool=pool)
+
+
+async def get_readonly_uow_factory(request: Request) -> Callable[[], SqlUnitOfWork]:
+
+    request.state.used_db = True
+    app_state = get_app_state(request)
+    pool, replicas = app_state.db_pool, app_state.db_replicas
+    return lambda: SqlUnitOfWork(pool=pool, readonly=True, replicas=replicas)
+
+
+async def get_query_session(request: Request) -> SqlQuerySession:
+
+    request.state.used_db = True
+    app_state = get_app_state(request)
+    return SqlQuerySession(pool=app_state.db_pool, replicas=app_state.db_replicas)
@@ -2,7 +2,12 @@ from fastapi import Request
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
 from shop.app.core.state import get_app_state
+from shop.app.infrastructure.persistence.mongo.count_cache import CountCache
 
 
 async def get_mongo_db(request: Request) -> AsyncIOMotorDatabase:
     return get_app_state(request).mongo_db
+
+
+async def get_event_log_count_cache(request: Request) -> CountCache | None:
+    return get_app_state(request).event_log_counts
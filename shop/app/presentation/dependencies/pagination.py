@@ -1,4 +1,13 @@
-from fastapi import Query
+from collections.abc import Callable, Sequence
+from typing import Any
+
+from fastapi import Query, Response
+
+from shop.app.application.dto.pagination import PageCursor, next_page_cursor, prev_page_cursor
+from shop.app.utils.cursor import decode_cursor, encode_cursor
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+PREV_CURSOR_HEADER = "X-Prev-Cursor"
 
 
 class CommonPaginationParams:
@@ -14,7 +23,48 @@ class CommonPaginationParams:
                 default=0,
                 ge=0,
                 description="Количество элементов, которое нужно пропустить"
-            )
+            ),
+            cursor: str | None = Query(
+                default=None,
+                description=(
+                    "Курсор страницы из заголовков X-Next-Cursor / X-Prev-Cursor. "
+                    "Если передан, offset игнорируется"
+                ),
+            ),
     ):
         self.limit = limit
         self.offset = offset
+        self.cursor_token = cursor
+
+    def cursor_for(self, listing: str) -> PageCursor | None:
+        """
+        Проверяет курсор и разбирает его для конкретного листинга.
+
+        Курсор, выданный другим листингом (или для другого ключа сортировки),
+        отклоняется с 400, а не доходит до SQL.
+        """
+        if not self.cursor_token:
+            return None
+        return decode_cursor(self.cursor_token, listing)
+
+
+def set_page_cursor_headers[T](
+        response: Response,
+        pagination: CommonPaginationParams,
+        listing: str,
+        items: Sequence[T],
+        sort_key: Callable[[T], tuple[Any, ...]],
+) -> None:
+    """Выставляет курсоры соседних страниц, если они существуют."""
+    cursor = pagination.cursor_for(listing)
+    full_page = len(items) >= pagination.limit
+    has_next = full_page or (cursor is not None and cursor.backward)
+    has_prev = (
+        (full_page or not cursor.backward) if cursor is not None else pagination.offset > 0
+    )
+    next_cursor = next_page_cursor(items, sort_key) if has_next else None
+    prev_cursor = prev_page_cursor(items, sort_key) if has_prev else None
+    if next_cursor is not None:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(next_cursor, listing)
+    if prev_cursor is not None:
+        response.headers[PREV_CURSOR_HEADER] = encode_cursor(prev_cursor, listing)
@@ -0,0 +1,55 @@
+from fastapi import Depends, HTTPException, Request, status
+
+from shop.app.core.state import get_app_state
+from shop.app.infrastructure.services.security.access_policy import (
+    AccessPolicySnapshotProvider,
+    PermissionSnapshot,
+)
+from shop.app.models.schemas import UserOut
+from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.utils.ensure_admin import is_admin
+
+
+async def get_access_policy(request: Request) -> AccessPolicySnapshotProvider | None:
+    return get_app_state(request).access_policy
+
+
+class PermissionGuard:
+    """
+    Dependency that returns the current user if their role has every
+    permission in ``names`` and answers 403 otherwise.
+
+    The requirement is compiled to a bitmask once per snapshot, so a check
+    is a dict lookup and an AND against in-memory data. Without a snapshot
+    provider only admins pass, as with ``_ensure_admin``.
+    """
+
+    def __init__(self, names: frozenset[str]) -> None:
+        self._names = names
+        self._snapshot: PermissionSnapshot | None = None
+        self._mask = 0
+
+    async def __call__(
+        self,
+        current_user: UserOut = Depends(get_current_user),
+        policy: AccessPolicySnapshotProvider | None = Depends(get_access_policy),
+    ) -> UserOut:
+        if policy is None:
+            allowed = is_admin(current_user)
+        else:
+            snapshot = policy.current
+            if snapshot is not self._snapshot:
+                self._mask = snapshot.compile(self._names)
+                self._snapshot = snapshot
+            allowed = snapshot.allows(current_user.role_id, self._mask)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Insufficient permissions",
+            )
+        return current_user
+
+
+def require_permissions(*names: str) -> PermissionGuard:
+    """``current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_READ))``"""
+    return PermissionGuard(frozenset(names))
@@ -1,14 +1,42 @@
 import asyncpg
 from fastapi import Depends
+from motor.motor_asyncio import AsyncIOMotorDatabase
 
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.core.config import settings
+from shop.app.infrastructure.persistence.redis.analytics_cache import (
+    CachedEventLogAnalyticsRepository,
+)
 from shop.app.presentation.dependencies.db import get_db
+from shop.app.presentation.dependencies.mongo import get_mongo_db
+from shop.app.web.dependencies.cache import get_cache_codec, get_cache_storage
 from shop.app.application.interfaces.repositories import UserRepository
+from shop.app.infrastructure.persistence.mongo.repositories.event_log_analytics_mongo_repository import (
+    EventLogAnalyticsRepositoryMongo,
+)
 from shop.app.infrastructure.persistence.postgres.repositories.user_repository import (
     UserRepositorySql,
 )
+from shop.app.repositories.protocols import EventLogAnalyticsRepository
 
 
 async def get_user_repository(
     conn: asyncpg.Connection = Depends(get_db),
 ) -> UserRepository:
     return UserRepositorySql(conn=conn)
+
+
+async def get_event_log_analytics_repository(
+    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    cache: CacheStorage = Depends(get_cache_storage),
+    codec: CacheCodec = Depends(get_cache_codec),
+) -> EventLogAnalyticsRepository:
+    return CachedEventLogAnalyticsRepository(
+        inner=EventLogAnalyticsRepositoryMongo(db=db),
+        storage=cache,
+        codec=codec,
+        ttl_seconds=settings.ANALYTICS_CACHE_TTL_SECONDS,
+        closed_ttl_seconds=settings.ANALYTICS_CLOSED_BUCKET_CACHE_TTL_SECONDS,
+        settle_seconds=settings.EVENT_LOG_ROLLUP_DELAY_SECONDS,
+    )
@@ -7,6 +7,9 @@ from shop.app.adapters.s3.validator import FileValidator, FileValidationRules
 from shop.app.core.config import settings
 from shop.app.core.ports.base import HealthCheckPort
 from shop.app.application.interfaces.services.files.file_storage import FileStoragePort
+from shop.app.application.interfaces.services.files.image_derivatives import (
+    ImageDerivativeScheduler,
+)
 from shop.app.core.state import get_app_state
 from shop.app.utils.get_utc_now import get_utc_now
 
@@ -15,6 +18,10 @@ async def get_storage_service(request: Request) -> FileStoragePort:
     return get_app_state(request).storage
 
 
+async def get_image_derivative_scheduler(request: Request) -> ImageDerivativeScheduler | None:
+    return get_app_state(request).image_derivatives
+
+
 async def get_storage_readiness(request: Request) -> HealthCheckPort:
     return get_app_state(request).storage_readiness
 
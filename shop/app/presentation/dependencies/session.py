@@ -0,0 +1,17 @@
+from fastapi import Request
+
+from shop.app.core.exceptions import ApplicationUnavailableError
+from shop.app.core.state import get_app_state
+from shop.app.infrastructure.persistence.redis.session_activity import SessionActivityTracker
+from depricated.services.session_service import SessionService
+
+
+async def get_session_service(request: Request) -> SessionService:
+    session_service = get_app_state(request).session_service
+    if session_service is None:
+        raise ApplicationUnavailableError("Session service is not configured")
+    return session_service
+
+
+async def get_session_activity_tracker(request: Request) -> SessionActivityTracker | None:
+    return get_app_state(request).session_activity
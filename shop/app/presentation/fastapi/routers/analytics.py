@@ -1,11 +1,15 @@
 import enum
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
+from shop.app.presentation.dependencies.repositories import get_event_log_analytics_repository
 from shop.app.presentation.dependencies.services import get_event_log_analytics_service
+from shop.app.presentation.mappers.export import aiter_rows, stream_csv, stream_json, stream_ndjson
+from shop.app.repositories.protocols import EventLogAnalyticsRepository
 from shop.app.models.schemas import (
     ActivityByPeriod,
     EventTypeStats,
@@ -16,7 +20,6 @@ from shop.app.models.schemas import (
     UserOut,
 )
 from depricated.services.event_log_analytics_service import EventLogAnalyticsService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/analytics", tags=["Analytics"])
 
@@ -24,6 +27,7 @@ router = APIRouter(prefix="/analytics", tags=["Analytics"])
 class ExportFormat(enum.StrEnum):
     json = "json"
     csv = "csv"
+    ndjson = "ndjson"
 
 
 @router.get("/activity", response_model=list[ActivityByPeriod])
@@ -31,29 +35,33 @@ async def get_activity_by_period(
     period: PeriodEnum = Query(PeriodEnum.day),
     time_from: datetime | None = Query(None),
     time_to: datetime | None = Query(None),
-    current_user: UserOut = Depends(get_current_user),
-    svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
+    exact_unique_users: bool = Query(
+        False, description="Точный подсчёт уникальных пользователей (медленнее, по сырым событиям)"
+    ),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
+    repo: EventLogAnalyticsRepository = Depends(get_event_log_analytics_repository),
 ):
-    _ensure_admin(current_user)
-    return await svc.activity_by_period(period.value, time_from, time_to)
+    # EventLogAnalyticsService живёт вне этого дерева и режим подсчёта не
+    # принимает, поэтому отчёт берётся из репозитория напрямую, как в export.
+    return await repo.aggregate_activity_by_period(
+        period.value, time_from, time_to, exact_unique_users=exact_unique_users
+    )
 
 
 @router.get("/top-users", response_model=list[TopUser])
 async def get_top_users(
     limit: int = Query(10, ge=1, le=100),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
     svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
 ):
-    _ensure_admin(current_user)
     return await svc.top_users(limit)
 
 
 @router.get("/event-types", response_model=list[EventTypeStats])
 async def get_event_type_stats(
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
     svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
 ):
-    _ensure_admin(current_user)
     return await svc.event_type_stats()
 
 
@@ -62,10 +70,9 @@ async def get_time_series(
     time_from: datetime = Query(...),
     time_to: datetime = Query(...),
     granularity: str = Query("hour", regex="^(minute|hour|day)$"),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
     svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
 ):
-    _ensure_admin(current_user)
     return await svc.time_series(time_from, time_to, granularity)
 
 
@@ -73,13 +80,24 @@ async def get_time_series(
 async def get_anomalies(
     time_from: datetime = Query(...),
     std_threshold: float = Query(1.0, ge=1.0, le=5.0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
     svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
 ):
-    _ensure_admin(current_user)
     return await svc.user_anomalies(time_from, std_threshold)
 
 
+_EXPORT_MEDIA_TYPES = {
+    ExportFormat.json: "application/json",
+    ExportFormat.csv: "text/csv",
+    ExportFormat.ndjson: "application/x-ndjson",
+}
+_EXPORT_WRITERS = {
+    ExportFormat.json: stream_json,
+    ExportFormat.csv: stream_csv,
+    ExportFormat.ndjson: stream_ndjson,
+}
+
+
 @router.get("/export/{report_name}")
 async def export_report(
     report_name: str,
@@ -88,10 +106,17 @@ async def export_report(
     time_from: datetime | None = Query(None),
     time_to: datetime | None = Query(None),
     limit: int = Query(10, ge=1, le=100),
-    current_user: UserOut = Depends(get_current_user),
+    user_id: int | None = Query(None, description="Только для отчёта events"),
+    event_type: str | None = Query(None, description="Только для отчёта events"),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ANALYTICS_READ)),
     svc: EventLogAnalyticsService = Depends(get_event_log_analytics_service),
+    repo: EventLogAnalyticsRepository = Depends(get_event_log_analytics_repository),
 ):
-    _ensure_admin(current_user)
+    """
+    Выгрузка отчёта потоком: строки кодируются и отдаются по мере чтения,
+    память не зависит от размера отчёта. Отчёт ``events`` — сырые события
+    за произвольный интервал, читаемые курсором MongoDB.
+    """
 
     fetchers = {
         "activity": lambda: svc.activity_by_period(period.value, time_from, time_to),
@@ -102,25 +127,15 @@ async def export_report(
         ),
     }
 
-    fetcher = fetchers.get(report_name)
-    if fetcher is None:
-        from fastapi import HTTPException
-
+    if report_name == "events":
+        rows = repo.iter_events(time_from, time_to, user_id=user_id, event_type=event_type)
+    elif (fetcher := fetchers.get(report_name)) is not None:
+        rows = aiter_rows(await fetcher())
+    else:
         raise HTTPException(404, f"Unknown report: {report_name}")
 
-    data = await fetcher()
-
-    if fmt == ExportFormat.csv:
-        content = svc.to_csv(data)
-        return StreamingResponse(
-            iter([content]),
-            media_type="text/csv",
-            headers={"Content-Disposition": f"attachment; filename={report_name}.csv"},
-        )
-
-    content = svc.to_json(data)
     return StreamingResponse(
-        iter([content]),
-        media_type="application/json",
-        headers={"Content-Disposition": f"attachment; filename={report_name}.json"},
+        _EXPORT_WRITERS[fmt](rows),
+        media_type=_EXPORT_MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename={report_name}.{fmt.value}"},
     )
@@ -2,9 +2,18 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordRequestForm
 
 from shop.app.utils.security import decode_token
-from shop.app.presentation.dependencies.auth import get_current_user, oauth2_scheme
+from shop.app.presentation.dependencies.auth import (
+    get_access_token_claims,
+    get_current_user,
+    get_login_attempt_service,
+)
+from shop.app.infrastructure.services.security.token_verifier import AccessTokenClaims
 from shop.app.presentation.dependencies.services import get_auth_service, get_event_log_service
-from shop.app.presentation.dependencies.session import get_session_service
+from shop.app.infrastructure.persistence.redis.session_activity import SessionActivityTracker
+from shop.app.presentation.dependencies.session import (
+    get_session_activity_tracker,
+    get_session_service,
+)
 from shop.app.models.schemas import (
     AuthResponse,
     EventType,
@@ -19,6 +28,7 @@ from shop.app.models.schemas import (
     TokenPair,
     UserOut,
 )
+from shop.app.services.login_attempt_service import LoginAttemptService
 from depricated.services.auth.auth_service import AuthService
 from depricated.services.event_log_service import EventLogService
 from depricated.services.session_service import SessionService
@@ -26,12 +36,42 @@ from depricated.services.session_service import SessionService
 router = APIRouter(prefix="/auth", tags=["Auth"])
 
 
-def _extract_session_id(token: str) -> str | None:
+def _too_many_attempts(retry_after_seconds: int = 0) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Too many failed login attempts, try again later",
+        headers={"Retry-After": str(retry_after_seconds)} if retry_after_seconds else None,
+    )
+
+
+async def _login(
+    request: Request,
+    payload: LoginRequest,
+    auth_service: AuthService,
+    login_attempts: LoginAttemptService | None,
+) -> AuthResponse:
+    ip = request.client.host if request.client else ""
+    ua = request.headers.get("user-agent", "")
+    if login_attempts is None:
+        return await auth_service.login(payload, ip_address=ip, user_agent=ua)
+
+    # Один запрос к Redis до bcrypt: заблокированного не проверяем по паролю,
+    # а счётчик сбрасываем после успеха, только если в нём что-то есть.
+    state = await login_attempts.get_state(payload.username)
+    if state.blocked:
+        raise _too_many_attempts(state.retry_after_seconds)
     try:
-        payload = decode_token(token)
-        return payload.get("sid")
-    except Exception:
-        return None
+        response = await auth_service.login(payload, ip_address=ip, user_agent=ua)
+    except HTTPException as exc:
+        if exc.status_code != status.HTTP_401_UNAUTHORIZED:
+            raise
+        result = await login_attempts.register_failure(payload.username)
+        if result.blocked:
+            raise _too_many_attempts(result.retry_after_seconds) from exc
+        raise
+    if state.attempts:
+        await login_attempts.reset(payload.username)
+    return response
 
 
 @router.post(
@@ -61,10 +101,9 @@ async def login_user(
     request: Request,
     auth_service: AuthService = Depends(get_auth_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
+    login_attempts: LoginAttemptService | None = Depends(get_login_attempt_service),
 ) -> AuthResponse:
-    ip = request.client.host if request.client else ""
-    ua = request.headers.get("user-agent", "")
-    response = await auth_service.login(payload, ip_address=ip, user_agent=ua)
+    response = await _login(request, payload, auth_service, login_attempts)
     await event_log_service.log_event(
         EventType.AUTH_LOGIN,
         user_id=response.user.id,
@@ -80,11 +119,10 @@ async def login_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     auth_service: AuthService = Depends(get_auth_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
+    login_attempts: LoginAttemptService | None = Depends(get_login_attempt_service),
 ) -> TokenPair:
     payload = LoginRequest(username=form_data.username, password=form_data.password)
-    ip = request.client.host if request.client else ""
-    ua = request.headers.get("user-agent", "")
-    auth_response = await auth_service.login(payload, ip_address=ip, user_agent=ua)
+    auth_response = await _login(request, payload, auth_service, login_attempts)
     await event_log_service.log_event(
         EventType.AUTH_LOGIN,
         user_id=auth_response.user.id,
@@ -121,13 +159,16 @@ async def refresh_tokens(
 async def logout_user(
     payload: LogoutRequest,
     request: Request,
-    token: str = Depends(oauth2_scheme),
+    claims: AccessTokenClaims = Depends(get_access_token_claims),
     current_user: UserOut = Depends(get_current_user),
     auth_service: AuthService = Depends(get_auth_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
+    activity: SessionActivityTracker | None = Depends(get_session_activity_tracker),
 ) -> None:
-    session_id = _extract_session_id(token)
+    session_id = claims.session_id
     await auth_service.logout(payload, session_id=session_id)
+    if activity is not None and session_id:
+        activity.forget(session_id)
     await event_log_service.log_event(
         EventType.AUTH_LOGOUT,
         user_id=current_user.id,
@@ -163,20 +204,23 @@ async def list_sessions(
 async def revoke_session(
     session_id: str,
     request: Request,
-    token: str = Depends(oauth2_scheme),
+    claims: AccessTokenClaims = Depends(get_access_token_claims),
     current_user: UserOut = Depends(get_current_user),
     session_service: SessionService = Depends(get_session_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
+    activity: SessionActivityTracker | None = Depends(get_session_activity_tracker),
 ) -> None:
     target = await session_service.get_session(session_id)
     if not target or int(target["user_id"]) != current_user.id:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    current_sid = _extract_session_id(token)
-    if current_sid == session_id:
+    if claims.session_id == session_id:
         raise HTTPException(status_code=400, detail="Cannot revoke the current session")
 
     await session_service.delete_session(session_id)
+    if activity is not None:
+        # Другие инстансы увидят отзыв не позже чем через SESSION_USER_CACHE_TTL_SECONDS.
+        activity.forget(session_id)
     await event_log_service.log_event(
         EventType.AUTH_LOGOUT,
         user_id=current_user.id,
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Body, Depends, Path, Request
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import get_category_service, get_event_log_service
 from shop.app.models.schemas import (
     CategoryCreate,
@@ -10,7 +11,6 @@ from shop.app.models.schemas import (
 )
 from depricated.services.category_service import CategoryService
 from depricated.services.event_log_service import EventLogService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
@@ -19,11 +19,10 @@ router = APIRouter(prefix="/categories", tags=["Categories"])
 async def create_category(
     request: Request,
     data: CategoryCreate = Body(),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.CATEGORIES_WRITE)),
     category_service: CategoryService = Depends(get_category_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await category_service.create_category(data)
     await event_log_service.log_event(
         "CATEGORY_CREATED",
@@ -54,11 +53,10 @@ async def update_category(
     request: Request,
     category_id: int = Path(),
     data: CategoryUpdate = Body(),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.CATEGORIES_WRITE)),
     category_service: CategoryService = Depends(get_category_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await category_service.update_category(category_id, data)
     await event_log_service.log_event(
         "CATEGORY_UPDATED",
@@ -73,11 +71,10 @@ async def update_category(
 async def delete_category(
     request: Request,
     category_id: int = Path(),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.CATEGORIES_WRITE)),
     category_service: CategoryService = Depends(get_category_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await category_service.delete_category(category_id)
     await event_log_service.log_event(
         "CATEGORY_DELETED",
@@ -2,11 +2,11 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import get_event_log_service
 from shop.app.models.schemas import EventLogFilter, EventLogListOut, UserOut
 from depricated.services.event_log_service import EventLogService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/event-logs", tags=["Event Logs"])
 
@@ -21,20 +21,21 @@ async def list_event_logs(
     ),
     limit: int = Query(20, ge=1, le=100, description="Размер страницы"),
     offset: int = Query(0, ge=0, description="Смещение"),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.EVENT_LOGS_READ)),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> EventLogListOut:
     """
     Поиск и фильтрация логов событий по временному интервалу, пользователю и типу события.
     Доступно только администраторам.
     """
-    _ensure_admin(current_user)
     filter_params = EventLogFilter(
         time_from=time_from,
         time_to=time_to,
         user_id=user_id,
         event_type=event_type,
     )
+    # EventLogService живёт вне этого дерева и курсор не принимает, поэтому
+    # здесь только offset; keyset есть в EventLogRepositoryMongo.get_filtered.
     return await event_log_service.list_events(
         limit=limit,
         offset=offset,
@@ -6,6 +6,7 @@ from shop.app.core.config import settings
 from shop.app.core.exceptions import StorageUnavailableError
 from shop.app.application.interfaces.services.files.file_storage import StorageReadinessPort
 from shop.app.core.state import AppState, get_app_state
+from shop.app.infrastructure.persistence.postgres.statements import statement_cache_stats
 from shop.app.presentation.dependencies.s3 import get_storage_readiness
 from depricated.services.session_service import SessionService
 
@@ -57,13 +58,42 @@ async def ready_check(
 
 @router.get("/health")
 async def health_check(app_state: AppState = Depends(get_app_state)):
-    session_svc: SessionService = app_state.session_service
-    active_sessions = await session_svc.count_active_sessions()
+    session_svc: SessionService | None = app_state.session_service
+    active_sessions = (
+        await session_svc.count_active_sessions() if session_svc is not None else None
+    )
 
     return {
         "status": "healthy",
         "debug": settings.DEBUG,
         "database": "connected",
+        "prepared_statements": statement_cache_stats.as_dict(),
+        "event_log": (
+            app_state.event_log_batcher.stats.as_dict()
+            if app_state.event_log_batcher is not None
+            else None
+        ),
+        "password_hasher": app_state.password_hasher.stats.as_dict(),
+        "access_policy": (
+            app_state.access_policy.stats.as_dict()
+            if app_state.access_policy is not None
+            else None
+        ),
+        "token_verifier": (
+            app_state.token_verifier.stats.as_dict()
+            if app_state.token_verifier is not None
+            else None
+        ),
+        "session_activity": (
+            app_state.session_activity.stats.as_dict()
+            if app_state.session_activity is not None
+            else None
+        ),
+        "image_derivatives": (
+            app_state.image_derivatives.stats.as_dict()
+            if app_state.image_derivatives is not None
+            else None
+        ),
         "instance_id": settings.INSTANCE_ID,
         "sessions": {
             "active_count": active_sessions,
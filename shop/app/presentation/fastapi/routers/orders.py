@@ -1,7 +1,11 @@
-from fastapi import APIRouter, Body, Depends, Path, Request, status
+from fastapi import APIRouter, Body, Depends, Path, Request, Response, status
 
-from shop.app.presentation.dependencies.auth import get_current_user
-from shop.app.presentation.dependencies.pagination import CommonPaginationParams
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
+from shop.app.presentation.dependencies.pagination import (
+    CommonPaginationParams,
+    set_page_cursor_headers,
+)
 from shop.app.presentation.dependencies.services import (
     get_event_log_service,
     get_order_item_service,
@@ -18,32 +22,38 @@ from shop.app.models.schemas import (
 )
 from depricated.services.event_log_service import EventLogService
 from depricated.services.order_item_service import OrderItemService
-from depricated.services.order_service import OrderService
-from shop.app.utils.ensure_admin import _ensure_admin
+from shop.app.services.order_service import OrderService
 
 router = APIRouter(prefix="/orders", tags=["Orders"])
 
+# Тег курсора: листинг и его ключ сортировки.
+ORDERS_LISTING = "orders:created_at,id"
+
 
 @router.get("/", response_model=list[OrderOut])
 async def list_orders(
+    response: Response,
     pagination: CommonPaginationParams = Depends(CommonPaginationParams),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_READ)),
     order_service: OrderService = Depends(get_order_service),
 ) -> list[OrderOut]:
-    _ensure_admin(current_user)
-    return await order_service.list_orders(
+    orders = await order_service.list_orders(
         limit=pagination.limit,
         offset=pagination.offset,
+        cursor=pagination.cursor_for(ORDERS_LISTING),
+    )
+    set_page_cursor_headers(
+        response, pagination, ORDERS_LISTING, orders, lambda o: (o.created_at, o.id)
     )
+    return orders
 
 
 @router.get("/{order_id}", response_model=OrderOut)
 async def get_order_by_id(
     order_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_READ)),
     order_service: OrderService = Depends(get_order_service),
 ) -> OrderOut:
-    _ensure_admin(current_user)
     return await order_service.get_order_by_id(order_id)
 
 
@@ -55,11 +65,10 @@ async def get_order_by_id(
 async def create_order(
     request: Request,
     data: OrderCreate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     order_service: OrderService = Depends(get_order_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> OrderOut:
-    _ensure_admin(current_user)
     order = await order_service.create_order(data)
     await event_log_service.log_event(
         "ORDER_CREATED",
@@ -75,11 +84,10 @@ async def update_order(
     request: Request,
     order_id: int = Path(..., gt=0),
     data: OrderUpdate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     order_service: OrderService = Depends(get_order_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> OrderOut:
-    _ensure_admin(current_user)
     order = await order_service.update_order(order_id, data)
     await event_log_service.log_event(
         "ORDER_UPDATED",
@@ -97,11 +105,10 @@ async def update_order(
 async def delete_order(
     request: Request,
     order_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     order_service: OrderService = Depends(get_order_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> None:
-    _ensure_admin(current_user)
     await order_service.delete_order(order_id)
     await event_log_service.log_event(
         "ORDER_DELETED",
@@ -117,10 +124,9 @@ async def delete_order(
 )
 async def list_order_items(
     order_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_READ)),
     item_service: OrderItemService = Depends(get_order_item_service),
 ) -> list[OrderItemOut]:
-    _ensure_admin(current_user)
     return await item_service.list_order_items(order_id)
 
 
@@ -133,11 +139,10 @@ async def create_order_item(
     request: Request,
     order_id: int = Path(..., gt=0),
     data: OrderItemCreate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     item_service: OrderItemService = Depends(get_order_item_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> OrderItemOut:
-    _ensure_admin(current_user)
     item = await item_service.create_order_item(order_id, data)
     await event_log_service.log_event(
         "ORDER_ITEM_CREATED",
@@ -155,10 +160,9 @@ async def create_order_item(
 async def get_order_item(
     order_id: int = Path(..., gt=0),
     item_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_READ)),
     item_service: OrderItemService = Depends(get_order_item_service),
 ) -> OrderItemOut:
-    _ensure_admin(current_user)
     return await item_service.get_order_item(order_id, item_id)
 
 
@@ -171,11 +175,10 @@ async def update_order_item(
     order_id: int = Path(..., gt=0),
     item_id: int = Path(..., gt=0),
     data: OrderItemUpdate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     item_service: OrderItemService = Depends(get_order_item_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> OrderItemOut:
-    _ensure_admin(current_user)
     item = await item_service.update_order_item(order_id, item_id, data)
     await event_log_service.log_event(
         "ORDER_ITEM_UPDATED",
@@ -194,11 +197,10 @@ async def delete_order_item(
     request: Request,
     order_id: int = Path(..., gt=0),
     item_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ORDERS_WRITE)),
     item_service: OrderItemService = Depends(get_order_item_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> None:
-    _ensure_admin(current_user)
     await item_service.delete_order_item(order_id, item_id)
     await event_log_service.log_event(
         "ORDER_ITEM_DELETED",
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, File, Form, Path, Request, UploadFile, status, Header
 
 from shop.app.presentation.mappers.uploads import map_upload_file
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import (
     get_event_log_service,
     get_product_image_service,
@@ -16,7 +17,6 @@ from shop.app.models.schemas import (
 from shop.app.presentation.presenters import ProductImagePresenter
 from depricated.services.event_log_service import EventLogService
 from depricated.services.product_image_service import ProductImageService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/product-images", tags=["Product Images"])
 
@@ -31,12 +31,11 @@ async def create_product_image(
     product_id: int = Form(...),
     file: UploadFile = File(...),
     content_length: int = Header(None),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCT_IMAGES_WRITE)),
     service: ProductImageService = Depends(get_product_image_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
     presenter: ProductImagePresenter = Depends(get_product_image_presenter),
 ):
-    _ensure_admin(current_user)
     data = ProductImageCreate(product_id=product_id)
     source = map_upload_file(file, content_length)
     image = await service.create_image(data, source)
@@ -87,11 +86,10 @@ async def get_product_images_by_product(
 async def delete_product_image(
     request: Request,
     image_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCT_IMAGES_WRITE)),
     service: ProductImageService = Depends(get_product_image_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     await service.delete_image(image_id)
 
     await event_log_service.log_event(
@@ -110,11 +108,10 @@ async def delete_product_image(
 async def delete_product_images_by_product(
     request: Request,
     product_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCT_IMAGES_WRITE)),
     service: ProductImageService = Depends(get_product_image_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     result = await service.delete_images_by_product_id(product_id)
 
     await event_log_service.log_event(
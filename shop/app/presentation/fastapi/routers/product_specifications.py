@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Body, Depends, Path, Request, status
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import (
     get_event_log_service,
     get_product_specification_service,
@@ -16,7 +17,6 @@ from depricated.services.event_log_service import EventLogService
 from depricated.services.product_specification_service import (
     ProductSpecificationService,
 )
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/product-specifications", tags=["Product Specifications"])
 
@@ -29,11 +29,12 @@ router = APIRouter(prefix="/product-specifications", tags=["Product Specificatio
 async def create_product_specification(
     request: Request,
     data: ProductSpecificationCreate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(
+        require_permissions(PermissionCode.PRODUCT_SPECIFICATIONS_WRITE)
+    ),
     service: ProductSpecificationService = Depends(get_product_specification_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await service.create_specification(data)
     await event_log_service.log_event(
         "PRODUCT_SPECIFICATION_CREATED",
@@ -84,11 +85,12 @@ async def update_product_specification(
     request: Request,
     specification_id: int = Path(..., gt=0),
     data: ProductSpecificationUpdate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(
+        require_permissions(PermissionCode.PRODUCT_SPECIFICATIONS_WRITE)
+    ),
     service: ProductSpecificationService = Depends(get_product_specification_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await service.update_specification(specification_id, data)
     await event_log_service.log_event(
         "PRODUCT_SPECIFICATION_UPDATED",
@@ -106,11 +108,12 @@ async def update_product_specification(
 async def delete_product_specification(
     request: Request,
     specification_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(
+        require_permissions(PermissionCode.PRODUCT_SPECIFICATIONS_WRITE)
+    ),
     service: ProductSpecificationService = Depends(get_product_specification_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     response = await service.delete_specification(specification_id)
     await event_log_service.log_event(
         "PRODUCT_SPECIFICATION_DELETED",
@@ -1,10 +1,25 @@
 from decimal import Decimal
 
-from fastapi import APIRouter, Depends, File, Form, Path, Request, UploadFile, Header, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Path,
+    Request,
+    Response,
+    UploadFile,
+    Header,
+    status,
+)
 
 from shop.app.presentation.mappers.uploads import map_upload_file
-from shop.app.presentation.dependencies.auth import get_current_user
-from shop.app.presentation.dependencies.pagination import CommonPaginationParams
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
+from shop.app.presentation.dependencies.pagination import (
+    CommonPaginationParams,
+    set_page_cursor_headers,
+)
 from shop.app.presentation.dependencies.services import (
     get_event_log_service,
     get_product_service,
@@ -18,11 +33,13 @@ from shop.app.models.schemas import (
 )
 from shop.app.presentation.presenters import ProductPresenter
 from depricated.services.event_log_service import EventLogService
-from depricated.services.product_service import ProductService
-from shop.app.utils.ensure_admin import _ensure_admin
+from shop.app.services.product_service import ProductService
 
 router = APIRouter(prefix="/products", tags=["Products"])
 
+# Тег курсора: листинг и его ключ сортировки.
+PRODUCTS_LISTING = "products:id"
+
 
 @router.post(
     "/",
@@ -40,12 +57,11 @@ async def create_product(
     category_id: int = Form(...),
     thumbnail: UploadFile = File(...),
     content_length: int = Header(None),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCTS_WRITE)),
     product_service: ProductService = Depends(get_product_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
     presenter: ProductPresenter = Depends(get_product_presenter),
 ):
-    _ensure_admin(current_user)
     data = ProductCreate(
         title=title,
         description=description,
@@ -88,11 +104,15 @@ async def get_product_by_id(
     response_model=list[ProductOut],
 )
 async def get_all_products(
+    response: Response,
     product_service: ProductService = Depends(get_product_service),
     pagination: CommonPaginationParams = Depends(CommonPaginationParams),
     presenter: ProductPresenter = Depends(get_product_presenter),
 ):
-    products = await product_service.get_all_products(pagination.limit, pagination.offset)
+    products = await product_service.get_all_products(
+        pagination.limit, pagination.offset, pagination.cursor_for(PRODUCTS_LISTING)
+    )
+    set_page_cursor_headers(response, pagination, PRODUCTS_LISTING, products, lambda p: (p.id,))
     return presenter.to_out_list(products)
 
 
@@ -113,12 +133,11 @@ async def update_product(
     category_id: int = Form(...),
     thumbnail: UploadFile | None = File(None),
     content_length: int = Header(None),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCTS_WRITE)),
     product_service: ProductService = Depends(get_product_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
     presenter: ProductPresenter = Depends(get_product_presenter),
 ):
-    _ensure_admin(current_user)
     data = ProductUpdate(
         title=title,
         description=description,
@@ -149,11 +168,10 @@ async def update_product(
 async def delete_product(
     request: Request,
     product_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.PRODUCTS_WRITE)),
     product_service: ProductService = Depends(get_product_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ):
-    _ensure_admin(current_user)
     await product_service.delete_product(product_id)
 
     await event_log_service.log_event(
@@ -16,6 +16,8 @@ async def list_reviews(
     pagination: CommonPaginationParams = Depends(CommonPaginationParams),
     review_service: ReviewService = Depends(get_review_service),
 ) -> list[ReviewOut]:
+    # ReviewService живёт вне этого дерева и курсор не принимает, поэтому
+    # здесь только offset; keyset есть в ReviewRepository.list_paginated.
     return await review_service.list_reviews(
         limit=pagination.limit,
         offset=pagination.offset,
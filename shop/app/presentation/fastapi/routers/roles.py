@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Body, Depends, Path, Request, status
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import get_event_log_service, get_role_service
 from shop.app.models.schemas import (
     RoleCreate,
@@ -11,7 +12,6 @@ from shop.app.models.schemas import (
 )
 from depricated.services.event_log_service import EventLogService
 from depricated.services.role_service import RoleService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/roles", tags=["Roles"])
 
@@ -24,11 +24,10 @@ router = APIRouter(prefix="/roles", tags=["Roles"])
 async def create_role(
     request: Request,
     data: RoleCreate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ROLES_WRITE)),
     role_service: RoleService = Depends(get_role_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> RoleResponse:
-    _ensure_admin(current_user)
     response = await role_service.create_role(data)
     await event_log_service.log_event(
         "ROLE_CREATED",
@@ -45,10 +44,9 @@ async def create_role(
 )
 async def get_role_by_id(
     role_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ROLES_READ)),
     role_service: RoleService = Depends(get_role_service),
 ) -> RoleOut:
-    _ensure_admin(current_user)
     return await role_service.get_role_by_id(role_id)
 
 
@@ -57,10 +55,9 @@ async def get_role_by_id(
     response_model=list[RoleOut],
 )
 async def get_all_roles(
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ROLES_READ)),
     role_service: RoleService = Depends(get_role_service),
 ) -> list[RoleOut]:
-    _ensure_admin(current_user)
     return await role_service.get_all_roles()
 
 
@@ -72,11 +69,10 @@ async def update_role(
     request: Request,
     role_id: int = Path(..., gt=0),
     data: RoleUpdate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ROLES_WRITE)),
     role_service: RoleService = Depends(get_role_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> RoleResponse:
-    _ensure_admin(current_user)
     response = await role_service.update_role(role_id, data)
     await event_log_service.log_event(
         "ROLE_UPDATED",
@@ -94,11 +90,10 @@ async def update_role(
 async def delete_role(
     request: Request,
     role_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.ROLES_WRITE)),
     role_service: RoleService = Depends(get_role_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> RoleResponse:
-    _ensure_admin(current_user)
     response = await role_service.delete_role(role_id)
     await event_log_service.log_event(
         "ROLE_DELETED",
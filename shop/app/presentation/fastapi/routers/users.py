@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Body, Depends, Path, Query, Request, status
 
-from shop.app.presentation.dependencies.auth import get_current_user
+from shop.app.domain.enums import PermissionCode
+from shop.app.presentation.dependencies.permissions import require_permissions
 from shop.app.presentation.dependencies.services import get_event_log_service, get_user_service
 from shop.app.models.schemas import UserCreate, UserOut, UserUpdate
 from depricated.services.event_log_service import EventLogService
 from depricated.services.user_service import UserService
-from shop.app.utils.ensure_admin import _ensure_admin
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -17,10 +17,9 @@ router = APIRouter(prefix="/users", tags=["Users"])
 async def list_users(
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.USERS_READ)),
     service: UserService = Depends(get_user_service),
 ) -> list[UserOut]:
-    _ensure_admin(current_user)
     return await service.list_users(limit=limit, offset=offset)
 
 
@@ -30,10 +29,9 @@ async def list_users(
 )
 async def get_user_by_id(
     user_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.USERS_READ)),
     service: UserService = Depends(get_user_service),
 ) -> UserOut:
-    _ensure_admin(current_user)
     return await service.get_user_by_id(user_id)
 
 
@@ -45,11 +43,10 @@ async def get_user_by_id(
 async def create_user(
     request: Request,
     data: UserCreate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.USERS_WRITE)),
     service: UserService = Depends(get_user_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> UserOut:
-    _ensure_admin(current_user)
     user = await service.create_user(data)
     await event_log_service.log_event(
         "USER_CREATED",
@@ -68,11 +65,10 @@ async def update_user(
     request: Request,
     user_id: int = Path(..., gt=0),
     data: UserUpdate = Body(...),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.USERS_WRITE)),
     service: UserService = Depends(get_user_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> UserOut:
-    _ensure_admin(current_user)
     user = await service.update_user(user_id, data)
     await event_log_service.log_event(
         "USER_UPDATED",
@@ -90,11 +86,10 @@ async def update_user(
 async def delete_user(
     request: Request,
     user_id: int = Path(..., gt=0),
-    current_user: UserOut = Depends(get_current_user),
+    current_user: UserOut = Depends(require_permissions(PermissionCode.USERS_WRITE)),
     service: UserService = Depends(get_user_service),
     event_log_service: EventLogService = Depends(get_event_log_service),
 ) -> None:
-    _ensure_admin(current_user)
     await service.delete_user(user_id)
     await event_log_service.log_event(
         "USER_DELETED",
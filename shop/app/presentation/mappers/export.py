@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+# Строки копятся в буфере и отдаются кусками примерно такого размера:
+# память постоянна, а StreamingResponse не пишет в сокет по строке.
+_CHUNK_SIZE = 64 * 1024
+
+
+async def aiter_rows(rows: Iterable[dict]) -> AsyncIterator[dict]:
+    for row in rows:
+        yield row
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (UUID, Decimal)):
+        return str(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _csv_value(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return ";".join(str(item) for item in value)
+    return value
+
+
+async def stream_csv(rows: AsyncIterable[dict]) -> AsyncIterator[str]:
+    """CSV с заголовком по ключам первой строки; лишние ключи следующих строк отбрасываются."""
+    buffer = io.StringIO()
+    writer: csv.DictWriter | None = None
+    async for row in rows:
+        if writer is None:
+            writer = csv.DictWriter(buffer, fieldnames=list(row), extrasaction="ignore")
+            writer.writeheader()
+        writer.writerow({key: _csv_value(value) for key, value in row.items()})
+        if buffer.tell() >= _CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+async def stream_ndjson(rows: AsyncIterable[dict]) -> AsyncIterator[str]:
+    chunk: list[str] = []
+    size = 0
+    async for row in rows:
+        line = json.dumps(row, default=_json_default, ensure_ascii=False) + "\n"
+        chunk.append(line)
+        size += len(line)
+        if size >= _CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk, size = [], 0
+    if chunk:
+        yield "".join(chunk)
+
+
+async def stream_json(rows: AsyncIterable[dict]) -> AsyncIterator[str]:
+    """JSON-массив, собираемый по мере чтения строк."""
+    yield "["
+    separator = ""
+    async for chunk in stream_ndjson(rows):
+        lines = chunk.rstrip("\n").split("\n")
+        yield separator + ",".join(lines)
+        separator = ","
+    yield "]"
@@ -9,31 +9,59 @@ from shop.app.core.state import get_app_state
 from shop.app.infrastructure.persistence.mongo.repositories.event_log_mongo_repository import (
     EventLogRepositoryMongo,
 )
+from shop.app.utils.get_utc_now import get_utc_now
 from depricated.services.event_log_service import EventLogService
 
 log = logging.getLogger(__name__)
 
 
 def _get_event_log_service(request: Request) -> EventLogService:
-    db = get_app_state(request).mongo_db
-    return EventLogService(repo=EventLogRepositoryMongo(db=db))
+    state = get_app_state(request)
+    return EventLogService(
+        repo=EventLogRepositoryMongo(db=state.mongo_db, count_cache=state.event_log_counts)
+    )
+
+
+def _http_request_event(request: Request, status_code: int) -> dict:
+    method = request.method
+    path = request.url.path
+    return {
+        "event_type": "HTTP_REQUEST",
+        "user_id": getattr(request.state, "user_id", None),
+        "description": f"{method} {path} -> {status_code}",
+        "ip_address": request.client.host if request.client else None,
+        "user_agent": request.headers.get("user-agent"),
+        "method": method,
+        "path": path,
+        "status_code": status_code,
+        "db_used": getattr(request.state, "used_db", False),
+        "created_at": get_utc_now(),
+    }
 
 
 async def log_requests(
     request: Request,
     call_next: Callable[[Request], Awaitable[Response]],
 ) -> Response:
+    """
+    Ставит событие HTTP_REQUEST в очередь EventLogBatcher и не ждёт записи
+    в MongoDB; при переполненной очереди событие отбрасывается. Без батчера
+    событие пишется сразу, как раньше.
+    """
     response = await call_next(request)
     try:
-        service = _get_event_log_service(request)
-        db_used = getattr(request.state, "used_db", False)
-        await service.log_http_request(
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            request=request,
-            db_used=db_used,
-        )
+        batcher = get_app_state(request).event_log_batcher
+        if batcher is not None:
+            batcher.submit(_http_request_event(request, response.status_code))
+        else:
+            service = _get_event_log_service(request)
+            await service.log_http_request(
+                method=request.method,
+                path=request.url.path,
+                status_code=response.status_code,
+                request=request,
+                db_used=getattr(request.state, "used_db", False),
+            )
     except Exception as exc:
         log.exception("Failed to log request event: %s", exc)
     return response
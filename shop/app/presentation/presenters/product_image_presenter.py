@@ -12,6 +12,10 @@ class ProductImagePresenter:
             id=image.id,
             product_id=image.product_id,
             image_url=self._media_url_builder.build(image.storage_key),
+            srcset=self._media_url_builder.build_srcset(
+                image.derivatives, self._media_url_builder.fallback_format(image.derivatives)
+            ),
+            srcset_webp=self._media_url_builder.build_srcset(image.derivatives, "webp"),
         )
 
     def to_out_list(self, images: list[ProductImage]) -> list[ProductImageOut]:
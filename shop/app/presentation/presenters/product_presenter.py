@@ -8,6 +8,7 @@ class ProductPresenter:
         self._media_url_builder = media_url_builder
 
     def to_out(self, product: Product) -> ProductOut:
+        derivatives = product.thumbnail_derivatives
         return ProductOut(
             id=product.id,
             title=product.title,
@@ -18,6 +19,10 @@ class ProductPresenter:
             is_published=product.is_published,
             category_id=product.category_id,
             thumbnail_url=self._media_url_builder.build(product.thumbnail_key),
+            thumbnail_srcset=self._media_url_builder.build_srcset(
+                derivatives, self._media_url_builder.fallback_format(derivatives)
+            ),
+            thumbnail_srcset_webp=self._media_url_builder.build_srcset(derivatives, "webp"),
         )
 
     def to_out_list(self, products: list[Product]) -> list[ProductOut]:
@@ -1,6 +1,10 @@
+from collections.abc import AsyncIterator
 from datetime import datetime
+from uuid import UUID
 from abc import ABC, abstractmethod
 
+from shop.app.application.dto.pagination import PageCursor
+
 from shop.app.models.domain.category import (
     Category,
     CategoryCreateData,
@@ -53,7 +57,9 @@ class ProductRepository(ABC):
     @abstractmethod
     async def get_by_id(self, product_id: int) -> Product: ...
     @abstractmethod
-    async def get_all(self, limit: int, offset: int) -> list[Product]: ...
+    async def get_all(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]: ...
     @abstractmethod
     async def get_total(self) -> int: ...
     @abstractmethod
@@ -187,7 +193,9 @@ class ReviewRepository(ABC):
 
 class OrderRepository(ABC):
     @abstractmethod
-    async def get_all(self, limit: int, offset: int) -> list[OrderOut]: ...
+    async def get_all(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[OrderOut]: ...
     @abstractmethod
     async def get_total(self) -> int: ...
     @abstractmethod
@@ -218,10 +226,11 @@ class OrderItemRepository(ABC):
 
 
 class EventLogRepository(ABC):
+    # id события: UUIDv7 в Mongo, serial в SQL-варианте.
     @abstractmethod
     async def get_all(self, limit: int, offset: int) -> list[EventLogOut]: ...
     @abstractmethod
-    async def get_by_id(self, event_id: int) -> EventLogOut: ...
+    async def get_by_id(self, event_id: UUID | int) -> EventLogOut: ...
     @abstractmethod
     async def get_by_user_id(self, user_id: int, limit: int, offset: int) -> list[EventLogOut]: ...
     @abstractmethod
@@ -238,7 +247,7 @@ class EventLogRepository(ABC):
     @abstractmethod
     async def create(self, data: dict) -> EventLogOut: ...
     @abstractmethod
-    async def delete(self, event_id: int) -> None: ...
+    async def delete(self, event_id: UUID | int) -> None: ...
 
 
 class RefreshTokenRepository(ABC):
@@ -287,6 +296,7 @@ class EventLogAnalyticsRepository(ABC):
         period: str,
         time_from: datetime | None = None,
         time_to: datetime | None = None,
+        exact_unique_users: bool = False,
     ) -> list[dict]: ...
     @abstractmethod
     async def aggregate_top_users(self, limit: int = 10) -> list[dict]: ...
@@ -305,3 +315,13 @@ class EventLogAnalyticsRepository(ABC):
         time_from: datetime,
         std_threshold: float = 2.0,
     ) -> list[dict]: ...
+    @abstractmethod
+    def iter_events(
+        self,
+        time_from: datetime | None = None,
+        time_to: datetime | None = None,
+        *,
+        user_id: int | None = None,
+        event_type: str | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[dict]: ...
@@ -1,5 +1,5 @@
-import json
 import logging
+from collections.abc import Callable
 from dataclasses import asdict
 
 from shop.app.core.exceptions import (
@@ -22,7 +22,8 @@ from shop.app.repositories.exceptions import (
     RepositoryUniqueConstraintError,
 )
 from shop.app.repositories.protocols import UnitOfWork
-from shop.app.services.cache_service import CacheService
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
 from shop.app.services.pubsub_service import PubSubChannel, PubSubService
 
 CATEGORIES_CACHE_KEY = "categories:all"
@@ -33,12 +34,18 @@ class CategoryService:
     def __init__(
         self,
         uow: UnitOfWork,
-        cache: CacheService,
+        cache: CacheStorage,
+        read_through: ReadThroughCache,
         pubsub: PubSubService,
         cache_ttl_seconds: int | None = None,
+        read_uow_factory: Callable[[], UnitOfWork] | None = None,
     ):
         self._uow = uow
+        # Каталожные чтения могут идти через read-only UoW (реплика). Каждое чтение
+        # открывает свой UoW: загрузчик кеша может обновлять запись в фоне после ответа.
+        self._read_uow_factory = read_uow_factory or (lambda: uow)
         self._cache = cache
+        self._read_through = read_through
         self._pubsub = pubsub
         self._cache_ttl_seconds = cache_ttl_seconds
 
@@ -61,7 +68,7 @@ class CategoryService:
         return CategoryResponse(id=category.id, message="Category created successfully")
 
     async def get_category_by_id(self, category_id: int) -> Category:
-        async with self._uow as uow:
+        async with self._read_uow_factory() as uow:
             try:
                 return await uow.categories.get_by_id(category_id)
             except RepositoryRecordNotFoundError as exc:
@@ -77,38 +84,23 @@ class CategoryService:
                 raise ApplicationUnavailableError("Failed to fetch category") from exc
 
     async def get_all_categories(self) -> list[Category]:
-        if await self._cache.exists(CATEGORIES_CACHE_KEY):
-            try:
-                items_str = await self._cache.get_list(CATEGORIES_CACHE_KEY)
-                return [Category(**json.loads(s)) for s in items_str]
-            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
-                logger.warning(
-                    "Category list cache corrupt, refetching: %s",
-                    CATEGORIES_CACHE_KEY,
-                    exc_info=True,
-                )
+        return await self._read_through.get_or_load(
+            CATEGORIES_CACHE_KEY,
+            self._fetch_categories,
+            encode=lambda categories: [asdict(c) for c in categories],
+            decode=lambda items: [Category(**item) for item in items],
+            ttl_seconds=self._cache_ttl_seconds,
+        )
 
-        async with self._uow as uow:
+    async def _fetch_categories(self) -> list[Category]:
+        async with self._read_uow_factory() as uow:
             try:
-                categories = await uow.categories.get_all()
+                return await uow.categories.get_all()
             except RepositoryUnavailableError as exc:
                 raise ApplicationUnavailableError("Failed to fetch categories") from exc
             except RepositoryMappingError as exc:
                 raise ApplicationUnavailableError("Failed to map categories") from exc
 
-        try:
-            items_str = [json.dumps(asdict(c)) for c in categories]
-            await self._cache.set_list_atomic(
-                CATEGORIES_CACHE_KEY, items_str, ttl_seconds=self._cache_ttl_seconds
-            )
-        except Exception:
-            logger.warning(
-                "Failed to write category list cache: %s",
-                CATEGORIES_CACHE_KEY,
-                exc_info=True,
-            )
-        return categories
-
     async def update_category(self, category_id: int, data: CategoryUpdate) -> CategoryResponse:
         async with self._uow as uow:
             update_data = CategoryUpdateData(**data.model_dump(exclude_unset=True))
@@ -162,7 +154,7 @@ class CategoryService:
             return await uow.categories.exists_category_with_id(category_id)
 
     async def _invalidate_cache(self) -> None:
-        await self._cache.delete(CATEGORIES_CACHE_KEY)
+        await self._cache.delete_value(CATEGORIES_CACHE_KEY)
 
     async def _after_mutation(self, entity_id: int, action: str) -> None:
         await self._invalidate_cache()
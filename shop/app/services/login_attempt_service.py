@@ -0,0 +1,39 @@
+from shop.app.application.interfaces.auth.auth_attempt_storage import (
+    AuthAttemptStorage,
+    FailedAttemptResult,
+)
+
+
+class LoginAttemptService:
+    """
+    Limits failed logins per username: ``max_attempts`` failures within
+    ``window_seconds`` block the username for ``block_seconds``.
+    """
+
+    def __init__(
+        self,
+        storage: AuthAttemptStorage,
+        *,
+        max_attempts: int,
+        window_seconds: int,
+        block_seconds: int,
+    ) -> None:
+        self._storage = storage
+        self._max_attempts = max_attempts
+        self._window_seconds = window_seconds
+        self._block_seconds = block_seconds
+
+    async def get_state(self, username: str) -> FailedAttemptResult:
+        """Whether the username is blocked and how many failures it has so far."""
+        return await self._storage.get_attempt_state(username)
+
+    async def register_failure(self, username: str) -> FailedAttemptResult:
+        return await self._storage.register_failed_attempt(
+            username,
+            max_attempts=self._max_attempts,
+            window_seconds=self._window_seconds,
+            block_seconds=self._block_seconds,
+        )
+
+    async def reset(self, username: str) -> None:
+        await self._storage.reset_failed_attempts(username)
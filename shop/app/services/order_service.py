@@ -1,3 +1,4 @@
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.models.schemas import OrderCreate, OrderOut, OrderUpdate
 from shop.app.repositories.protocols import UnitOfWork
 
@@ -6,9 +7,11 @@ class OrderService:
     def __init__(self, uow: UnitOfWork):
         self._uow = uow
 
-    async def list_orders(self, limit: int, offset: int) -> list[OrderOut]:
+    async def list_orders(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[OrderOut]:
         async with self._uow as uow:
-            return await uow.orders.get_all(limit=limit, offset=offset)
+            return await uow.orders.get_all(limit=limit, offset=offset, cursor=cursor)
 
     async def get_order_by_id(self, order_id: int) -> OrderOut:
         async with self._uow as uow:
@@ -11,6 +11,9 @@ from shop.app.core.exceptions import (
     StorageUnavailableError,
 )
 from shop.app.core.ports.file_storage import FileStoragePort
+from shop.app.application.interfaces.services.files.image_derivatives import (
+    ImageDerivativeScheduler,
+)
 from shop.app.models.domain.product_image import (
     ProductImageCreateData,
     ProductImage,
@@ -41,11 +44,13 @@ class ProductImageService:
         storage: FileStoragePort,
         file_validator: FileValidator,
         filename_generator: UUIDFilenameGenerator,
+        derivatives: ImageDerivativeScheduler | None = None,
     ) -> None:
         self._uow = uow
         self._storage = storage
         self._file_validator = file_validator
         self._filename_generator = filename_generator
+        self._derivatives = derivatives
 
     async def create_image(self, data: ProductImageCreate, source: UploadSource) -> ProductImage:
         self._file_validator.validate(source)
@@ -66,7 +71,6 @@ class ProductImageService:
                 )
                 product_image = await uow.product_images.create(product_image_data)
                 await uow.commit()
-                return product_image
         except RepositoryForeignKeyError as exc:
             await self._delete_orphan_object(storage_key)
             raise EntityNotFoundError(
@@ -87,6 +91,11 @@ class ProductImageService:
             await self._delete_orphan_object(storage_key)
             raise ApplicationUnavailableError("Failed to create product image") from exc
 
+        # Адаптивные копии строятся в фоне; до тех пор клиенты получают оригинал.
+        if self._derivatives is not None:
+            self._derivatives.schedule(storage_key)
+        return product_image
+
     async def get_image_by_id(self, image_id: int) -> ProductImage:
         async with self._uow as uow:
             try:
@@ -186,6 +195,8 @@ class ProductImageService:
             )
 
     async def _delete_storage_object_best_effort(self, storage_key: str) -> None:
+        if self._derivatives is not None:
+            self._derivatives.discard(storage_key)
         try:
             await self._storage.delete(storage_key)
         except Exception:
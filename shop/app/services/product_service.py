@@ -1,8 +1,8 @@
-import json
 import logging
+from collections.abc import Callable
 from dataclasses import asdict
-from decimal import Decimal
 
+from shop.app.application.dto.pagination import PageCursor
 from shop.app.core.exceptions import (
     ApplicationUnavailableError,
     ConflictError,
@@ -12,6 +12,9 @@ from shop.app.core.exceptions import (
     StorageValidationError,
 )
 from shop.app.core.ports.file_storage import FileStoragePort
+from shop.app.application.interfaces.services.files.image_derivatives import (
+    ImageDerivativeScheduler,
+)
 from shop.app.models.domain.product import (
     Product,
     ProductCreateData,
@@ -31,7 +34,8 @@ from shop.app.repositories.exceptions import (
     RepositoryUniqueConstraintError,
 )
 from shop.app.repositories.protocols import UnitOfWork
-from shop.app.services.cache_service import CacheService
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
 from shop.app.services.pubsub_service import PubSubChannel, PubSubService
 
 logger = logging.getLogger(__name__)
@@ -41,17 +45,25 @@ class ProductService:
     def __init__(
         self,
         uow: UnitOfWork,
-        cache: CacheService,
+        cache: CacheStorage,
+        read_through: ReadThroughCache,
         pubsub: PubSubService,
         storage: FileStoragePort,
         cache_ttl_seconds: int | None = None,
+        read_uow_factory: Callable[[], UnitOfWork] | None = None,
+        derivatives: ImageDerivativeScheduler | None = None,
     ) -> None:
         self._uow = uow
+        # Каталожные чтения могут идти через read-only UoW (реплика). Каждое чтение
+        # открывает свой UoW: загрузчик кеша может обновлять запись в фоне после ответа.
+        self._read_uow_factory = read_uow_factory or (lambda: uow)
         self._cache = cache
+        self._read_through = read_through
         self._pubsub = pubsub
         self._storage = storage
+        self._derivatives = derivatives
         self._cache_ttl_seconds = cache_ttl_seconds
-        self._cache_pattern = "products:limit:*"
+        self._cache_namespace = "products"
 
     async def create_product(self, data: ProductCreate, source: UploadSource) -> Product:
         try:
@@ -89,11 +101,12 @@ class ProductService:
             await self._delete_orphan_object(thumbnail_key)
             raise ApplicationUnavailableError("Failed to create product") from exc
 
+        self._schedule_derivatives(thumbnail_key)
         await self._after_mutation(product.id, "create")
         return product
 
     async def get_product_by_id(self, product_id: int) -> Product:
-        async with self._uow as uow:
+        async with self._read_uow_factory() as uow:
             try:
                 return await uow.products.get_by_id(product_id)
             except RepositoryRecordNotFoundError as exc:
@@ -108,35 +121,38 @@ class ProductService:
             ) as exc:
                 raise ApplicationUnavailableError("Failed to fetch product") from exc
 
-    async def get_all_products(self, limit: int, offset: int) -> list[Product]:
-        key = f"products:limit:{limit}:offset:{offset}"
-        if await self._cache.exists(key):
-            try:
-                items_str = await self._cache.get_list(key)
-                return [self._product_from_cache_json(s) for s in items_str]
-            except (json.JSONDecodeError, KeyError, TypeError, ValueError):
-                logger.warning(
-                    "Product list cache corrupt, refetching: %s",
-                    key,
-                    exc_info=True,
-                )
+    async def get_all_products(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]:
+        if cursor is not None:
+            # Keyset pages are not cached: deep cursors are rarely shared between clients.
+            return await self._fetch_products(limit, offset, cursor)
 
-        async with self._uow as uow:
+        try:
+            generation = await self._cache.get_generation(self._cache_namespace)
+        except StorageUnavailableError:
+            logger.warning("Product cache unavailable, reading from database", exc_info=True)
+            return await self._fetch_products(limit, offset)
+
+        return await self._read_through.get_or_load(
+            f"{self._cache_namespace}:g{generation}:limit:{limit}:offset:{offset}",
+            lambda: self._fetch_products(limit, offset),
+            encode=lambda products: [asdict(p) for p in products],
+            decode=lambda items: [Product(**item) for item in items],
+            ttl_seconds=self._cache_ttl_seconds,
+        )
+
+    async def _fetch_products(
+        self, limit: int, offset: int, cursor: PageCursor | None = None
+    ) -> list[Product]:
+        async with self._read_uow_factory() as uow:
             try:
-                products = await uow.products.get_all(limit=limit, offset=offset)
+                return await uow.products.get_all(limit=limit, offset=offset, cursor=cursor)
             except RepositoryUnavailableError as exc:
                 raise ApplicationUnavailableError("Failed to fetch products") from exc
             except RepositoryMappingError as exc:
                 raise ApplicationUnavailableError("Failed to map products") from exc
 
-        try:
-            items_str = [self._product_to_cache_json(p) for p in products]
-            await self._cache.set_list_atomic(key, items_str, ttl_seconds=self._cache_ttl_seconds)
-        except Exception:
-            logger.warning("Failed to write product list cache: %s", key, exc_info=True)
-
-        return products
-
     async def update_product(
         self, product_id: int, data: ProductUpdate, source: UploadSource | None
     ) -> Product:
@@ -202,8 +218,11 @@ class ProductService:
                 await self._cleanup_new_thumbnail_if_any(new_thumbnail_key)
                 raise ApplicationUnavailableError("Failed to update product") from exc
 
-        if new_thumbnail_key is not None and old_thumbnail_key:
-            await self._delete_storage_object_best_effort(old_thumbnail_key)
+        await self._after_mutation(product_id, "update")
+        if new_thumbnail_key is not None:
+            self._schedule_derivatives(new_thumbnail_key)
+            if old_thumbnail_key:
+                await self._delete_storage_object_best_effort(old_thumbnail_key)
 
         return updated_product
 
@@ -234,11 +253,11 @@ class ProductService:
         await self._after_mutation(product_id, "delete")
 
     async def _after_mutation(self, entity_id: int, action: str) -> None:
-        await self._cache.delete_by_pattern(self._cache_pattern)
+        await self._cache.bump_generation(self._cache_namespace)
         await self._pubsub.publish(
             PubSubChannel.CACHE_INVALIDATION,
             event="cache_invalidated",
-            data={"entity": "products", "pattern": self._cache_pattern},
+            data={"entity": "products", "pattern": f"{self._cache_namespace}:*"},
         )
         await self._pubsub.publish(
             PubSubChannel.DATA_CHANGE,
@@ -246,6 +265,11 @@ class ProductService:
             data={"entity": "products", "action": action, "entity_id": entity_id},
         )
 
+    def _schedule_derivatives(self, thumbnail_key: str) -> None:
+        # Адаптивные копии строятся в фоне; до тех пор клиенты получают оригинал.
+        if self._derivatives is not None:
+            self._derivatives.schedule(thumbnail_key)
+
     async def _cleanup_new_thumbnail_if_any(self, thumbnail_key: str | None) -> None:
         if thumbnail_key is not None:
             await self._delete_orphan_object(thumbnail_key)
@@ -261,6 +285,8 @@ class ProductService:
             )
 
     async def _delete_storage_object_best_effort(self, thumbnail_key: str) -> None:
+        if self._derivatives is not None:
+            self._derivatives.discard(thumbnail_key)
         try:
             await self._storage.delete(thumbnail_key)
         except Exception:
@@ -269,15 +295,3 @@ class ProductService:
                 thumbnail_key,
                 exc_info=True,
             )
-
-    @staticmethod
-    def _product_to_cache_json(p: Product) -> str:
-        payload = asdict(p)
-        payload["price"] = str(payload["price"])
-        return json.dumps(payload)
-
-    @staticmethod
-    def _product_from_cache_json(raw: str) -> Product:
-        payload = json.loads(raw)
-        payload["price"] = Decimal(str(payload["price"]))
-        return Product(**payload)
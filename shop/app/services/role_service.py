@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from shop.app.models.schemas import (
     RoleCreate,
     RoleOut,
@@ -5,7 +7,8 @@ from shop.app.models.schemas import (
     RoleUpdate,
 )
 from shop.app.repositories.protocols import UnitOfWork
-from shop.app.services.cache_service import CacheService
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
 from shop.app.services.pubsub_service import PubSubChannel, PubSubService
 
 ROLES_CACHE_KEY = "roles:all"
@@ -15,12 +18,17 @@ class RoleService:
     def __init__(
         self,
         uow: UnitOfWork,
-        cache: CacheService,
+        cache: CacheStorage,
+        read_through: ReadThroughCache,
         pubsub: PubSubService,
         cache_ttl_seconds: int | None = None,
+        uow_factory: Callable[[], UnitOfWork] | None = None,
     ):
         self._uow = uow
+        # Загрузчик кеша может работать в фоне после ответа — со своим UoW.
+        self._uow_factory = uow_factory or (lambda: uow)
         self._cache = cache
+        self._read_through = read_through
         self._pubsub = pubsub
         self._cache_ttl_seconds = cache_ttl_seconds
 
@@ -39,18 +47,17 @@ class RoleService:
             return role
 
     async def get_all_roles(self) -> list[RoleOut]:
-        if await self._cache.exists(ROLES_CACHE_KEY):
-            roles_str = await self._cache.get_list(ROLES_CACHE_KEY)
-            return [RoleOut.model_validate_json(s) for s in roles_str]
-
-        async with self._uow as uow:
-            roles = await uow.roles.get_all()
-
-        roles_str = [r.model_dump_json() for r in roles]
-        await self._cache.set_list_atomic(
-            ROLES_CACHE_KEY, roles_str, ttl_seconds=self._cache_ttl_seconds
+        return await self._read_through.get_or_load(
+            ROLES_CACHE_KEY,
+            self._fetch_roles,
+            encode=lambda roles: [r.model_dump() for r in roles],
+            decode=lambda items: [RoleOut.model_validate(item) for item in items],
+            ttl_seconds=self._cache_ttl_seconds,
         )
-        return roles
+
+    async def _fetch_roles(self) -> list[RoleOut]:
+        async with self._uow_factory() as uow:
+            return await uow.roles.get_all()
 
     async def update_role(self, role_id: int, data: RoleUpdate) -> RoleResponse:
         async with self._uow as uow:
@@ -70,7 +77,7 @@ class RoleService:
         return RoleResponse(id=role_id, message="Role deleted successfully")
 
     async def _invalidate_roles_cache(self) -> None:
-        await self._cache.delete(ROLES_CACHE_KEY)
+        await self._cache.delete_value(ROLES_CACHE_KEY)
 
     async def _after_mutation(self, entity_id: int, action: str) -> None:
         await self._invalidate_roles_cache()
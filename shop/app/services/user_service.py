@@ -1,11 +1,14 @@
-from shop.app.utils.security import hash_password
+from collections.abc import Callable
+
+from shop.app.application.interfaces.auth.password_hasher import PasswordHasher
 from shop.app.models.schemas import (
     UserCreate,
     UserOut,
     UserUpdate,
 )
 from shop.app.repositories.protocols import UnitOfWork
-from shop.app.services.cache_service import CacheService
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
 from shop.app.services.pubsub_service import PubSubChannel, PubSubService
 from shop.app.services.session_service import SessionService
 
@@ -14,15 +17,22 @@ class UserService:
     def __init__(
         self,
         uow: UnitOfWork,
-        cache: CacheService,
+        cache: CacheStorage,
+        read_through: ReadThroughCache,
         pubsub: PubSubService,
         session_service: SessionService,
+        password_hasher: PasswordHasher,
         cache_ttl_seconds: int | None = None,
+        uow_factory: Callable[[], UnitOfWork] | None = None,
     ):
         self._uow = uow
+        # Загрузчик кеша может работать в фоне после ответа — со своим UoW.
+        self._uow_factory = uow_factory or (lambda: uow)
         self._cache = cache
+        self._read_through = read_through
         self._pubsub = pubsub
         self._session_service = session_service
+        self._password_hasher = password_hasher
         self._cache_ttl_seconds = cache_ttl_seconds
         self._cache_pattern = "users:limit:*"
 
@@ -32,29 +42,28 @@ class UserService:
             return user
 
     async def list_users(self, limit: int, offset: int) -> list[UserOut]:
-        key = f"users:limit:{limit}:offset:{offset}"
-
-        if await self._cache.exists(key):
-            users_str = await self._cache.get_list(key)
-            return [UserOut.model_validate_json(s) for s in users_str]
-
-        async with self._uow as uow:
-            users = await uow.users.get_all(limit=limit, offset=offset)
+        return await self._read_through.get_or_load(
+            f"users:limit:{limit}:offset:{offset}",
+            lambda: self._fetch_users(limit, offset),
+            encode=lambda users: [u.model_dump() for u in users],
+            decode=lambda items: [UserOut.model_validate(item) for item in items],
+            ttl_seconds=self._cache_ttl_seconds,
+        )
 
-        users_str = [u.model_dump_json() for u in users]
-        await self._cache.set_list_atomic(key, users_str, ttl_seconds=self._cache_ttl_seconds)
-        return users
+    async def _fetch_users(self, limit: int, offset: int) -> list[UserOut]:
+        async with self._uow_factory() as uow:
+            return await uow.users.get_all(limit=limit, offset=offset)
 
     async def create_user(self, payload: UserCreate) -> UserOut:
-        async with self._uow as uow:
-
-            user_data = payload.model_dump(exclude={"password"})
-            user_data["password_hash"] = hash_password(payload.password)
+        # Хешируем до открытия транзакции: соединение пула не держится на время bcrypt.
+        user_data = payload.model_dump(exclude={"password"})
+        user_data["password_hash"] = await self._password_hasher.hash(payload.password)
 
+        async with self._uow as uow:
             user = await uow.users.create(user_data)
             await uow.commit()
 
-        await self._cache.delete_by_pattern(self._cache_pattern)
+        await self._cache.delete_value_by_pattern(self._cache_pattern)
         await self._pubsub.publish(
             PubSubChannel.CACHE_INVALIDATION,
             event="cache_invalidated",
@@ -68,21 +77,21 @@ class UserService:
         return user
 
     async def update_user(self, user_id: int, payload: UserUpdate) -> UserOut:
+        update_data = payload.model_dump(exclude_unset=True)
+        if "password" in update_data and update_data["password"]:
+            update_data["password_hash"] = await self._password_hasher.hash(
+                update_data.pop("password")
+            )
+
         async with self._uow as uow:
             user = await uow.users.get_by_id(user_id)
 
-            update_data = payload.model_dump(exclude_unset=True)
-
-            if "password" in update_data and update_data["password"]:
-                update_data["password_hash"] = hash_password(update_data["password"])
-                del update_data["password"]
-
             user = await uow.users.update(user_id, update_data)
 
             user = await uow.users.get_by_id(user_id)
             await uow.commit()
 
-        await self._cache.delete_by_pattern(self._cache_pattern)
+        await self._cache.delete_value_by_pattern(self._cache_pattern)
         await self._session_service.delete_all_user_sessions(user_id)
 
         await self._pubsub.publish(
@@ -107,7 +116,7 @@ class UserService:
             await uow.users.delete(user_id)
             await uow.commit()
 
-        await self._cache.delete_by_pattern(self._cache_pattern)
+        await self._cache.delete_value_by_pattern(self._cache_pattern)
         await self._session_service.delete_all_user_sessions(user_id)
 
         await self._pubsub.publish(
@@ -0,0 +1,92 @@
+import base64
+import hashlib
+import hmac
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from shop.app.application.dto.pagination import PageCursor
+from shop.app.core.config import settings
+from shop.app.core.exceptions import DomainValidationError
+
+_SIGNATURE_BYTES = 16
+
+
+def encode_cursor(cursor: PageCursor, listing: str) -> str:
+    """
+    Serialize a cursor into an opaque, HMAC-signed URL-safe token.
+
+    ``listing`` names the listing and its sort key (e.g. ``"orders:created_at,id"``);
+    it is signed together with the values, so a token only decodes for the listing
+    that issued it.
+    """
+    payload = json.dumps(
+        {
+            "l": listing,
+            "v": [_encode_value(v) for v in cursor.values],
+            "b": cursor.backward,
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(token: str, listing: str) -> PageCursor:
+    """Verify and parse a token produced by ``encode_cursor`` for the same ``listing``."""
+    try:
+        raw_payload, raw_signature = token.split(".", 1)
+        payload = _b64decode(raw_payload)
+        signature = _b64decode(raw_signature)
+    except (ValueError, TypeError) as exc:
+        raise DomainValidationError("Invalid pagination cursor") from exc
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise DomainValidationError("Invalid pagination cursor")
+
+    try:
+        data = json.loads(payload)
+        if data["l"] != listing:
+            raise DomainValidationError("Pagination cursor belongs to another listing")
+        values = tuple(_decode_value(v) for v in data["v"])
+        return PageCursor(values=values, backward=bool(data["b"]))
+    except (KeyError, TypeError, ValueError) as exc:
+        raise DomainValidationError("Invalid pagination cursor") from exc
+
+
+def _sign(payload: bytes) -> bytes:
+    key = f"cursor:{settings.JWT_SECRET_KEY}".encode()
+    return hmac.new(key, payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, UUID):
+        return {"uuid": str(value)}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    raise TypeError(f"Unsupported cursor value type: {type(value).__name__}")
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "uuid" in value:
+            return UUID(value["uuid"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+        raise ValueError("Unknown cursor value tag")
+    return value
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
@@ -0,0 +1,71 @@
+"""HyperLogLog: mergeable approximate distinct counts in fixed memory."""
+
+import hashlib
+import math
+from collections.abc import Iterable
+from typing import Any
+
+_HASH_BITS = 64
+
+
+class HyperLogLog:
+    """
+    Sketch with ``2 ** precision`` one-byte registers.
+
+    The relative standard error is about ``1.04 / sqrt(2 ** precision)``
+    (1.6% for the default precision 12, 4 KiB of registers). Sketches of the
+    same precision merge losslessly, so per-bucket sketches can be combined
+    into any coarser bucket. Small cardinalities use linear counting and are
+    close to exact.
+    """
+
+    __slots__ = ("_precision", "_registers")
+
+    def __init__(self, precision: int = 12, registers: bytes | None = None) -> None:
+        if not 4 <= precision <= 18:
+            raise ValueError("HyperLogLog precision must be between 4 and 18")
+        size = 1 << precision
+        if registers is not None and len(registers) != size:
+            raise ValueError(f"Expected {size} registers, got {len(registers)}")
+        self._precision = precision
+        self._registers = bytearray(registers) if registers is not None else bytearray(size)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "HyperLogLog":
+        precision = len(data).bit_length() - 1
+        return cls(precision, data)
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._registers)
+
+    @property
+    def precision(self) -> int:
+        return self._precision
+
+    def add(self, value: Any) -> None:
+        digest = hashlib.blake2b(str(value).encode(), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        rest_bits = _HASH_BITS - self._precision
+        index = hashed >> rest_bits
+        rest = hashed & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, values: Iterable[Any]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other._precision != self._precision:
+            raise ValueError("Cannot merge HyperLogLog sketches of different precision")
+        self._registers = bytearray(map(max, self._registers, other._registers))
+
+    def count(self) -> int:
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / math.fsum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
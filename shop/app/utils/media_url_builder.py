@@ -1,3 +1,8 @@
+from collections.abc import Iterable
+
+from shop.app.domain.value_objects.catalog_values import ImageDerivative
+
+
 class MediaUrlBuilder:
     def __init__(self, media_base_url: str) -> None:
         self._media_base_url = media_base_url.rstrip("/")
@@ -5,3 +10,19 @@ class MediaUrlBuilder:
     def build(self, storage_key: str) -> str:
         normalized_key = storage_key.lstrip("/")
         return f"{self._media_base_url}/{normalized_key}"
+
+    def build_srcset(
+        self, derivatives: Iterable[ImageDerivative], fmt: str | None
+    ) -> str | None:
+        """``srcset`` из копий формата ``fmt`` по возрастанию ширины; None, если копий нет."""
+        candidates = sorted(
+            (item for item in derivatives if item.format == fmt), key=lambda item: item.width
+        )
+        if not candidates:
+            return None
+        return ", ".join(f"{self.build(item.storage_key)} {item.width}w" for item in candidates)
+
+    @staticmethod
+    def fallback_format(derivatives: Iterable[ImageDerivative]) -> str | None:
+        """Формат копий для клиентов без WebP (jpeg или png — по прозрачности исходника)."""
+        return next((item.format for item in derivatives if item.format != "webp"), None)
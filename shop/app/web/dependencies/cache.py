@@ -1,8 +1,27 @@
 from fastapi import Request
 
+from shop.app.core.exceptions import ApplicationUnavailableError
 from shop.app.core.state import get_app_state
+from shop.app.application.interfaces.persistence.cache_codec import CacheCodec
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
 from shop.app.services.cache_service import CacheService
 
 
 async def get_cache_service(request: Request) -> CacheService:
-    return get_app_state(request).cache_service
+    cache_service = get_app_state(request).cache_service
+    if cache_service is None:
+        raise ApplicationUnavailableError("Cache service is not configured")
+    return cache_service
+
+
+async def get_cache_storage(request: Request) -> CacheStorage:
+    return get_app_state(request).cache_storage
+
+
+async def get_read_through_cache(request: Request) -> ReadThroughCache:
+    return get_app_state(request).read_through_cache
+
+
+async def get_cache_codec(request: Request) -> CacheCodec:
+    return get_app_state(request).cache_codec
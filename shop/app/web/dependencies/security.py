@@ -0,0 +1,8 @@
+from fastapi import Request
+
+from shop.app.application.interfaces.auth.password_hasher import PasswordHasher
+from shop.app.core.state import get_app_state
+
+
+async def get_password_hasher(request: Request) -> PasswordHasher:
+    return get_app_state(request).password_hasher
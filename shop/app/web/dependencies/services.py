@@ -1,3 +1,5 @@
+from collections.abc import Callable
+
 from fastapi import Depends
 from motor.motor_asyncio import AsyncIOMotorDatabase
 
@@ -7,28 +9,40 @@ from shop.app.application.interfaces.services.files.file_storage import (
     FileValidatorPort,
     ObjectKeyGeneratorPort,
 )
-from shop.app.dependencies.cache import get_cache_service
+from shop.app.application.interfaces.services.files.image_derivatives import (
+    ImageDerivativeScheduler,
+)
+from shop.app.web.dependencies.cache import get_cache_storage, get_read_through_cache
+from shop.app.web.dependencies.security import get_password_hasher
+from shop.app.application.interfaces.auth.password_hasher import PasswordHasher
+from shop.app.application.interfaces.persistence.read_through_cache import ReadThroughCache
+from shop.app.application.interfaces.persistence.cache_storage import CacheStorage
 from shop.app.dependencies.db import get_uow
 from shop.app.dependencies.mongo import get_mongo_db
+from shop.app.presentation.dependencies.mongo import get_event_log_count_cache
 from shop.app.dependencies.pubsub import get_pubsub_service
-from shop.app.dependencies.s3 import get_storage_service, get_file_validator, get_filename_generator
+from shop.app.presentation.dependencies.db import get_readonly_uow_factory, get_uow_factory
+from shop.app.dependencies.s3 import (
+    get_file_validator,
+    get_filename_generator,
+    get_image_derivative_scheduler,
+    get_storage_service,
+)
 from shop.app.dependencies.session import get_session_service
 from shop.app.web.presenters import ProductImagePresenter
 from shop.app.web.presenters import ProductPresenter
-from shop.app.infrastructure.persistance.postgres.repositories.event_log_analytics_repository import (
-    EventLogAnalyticsRepositoryMongo,
-)
-from shop.app.infrastructure.persistance.postgres.repositories.event_log_mongo_repository import (
+from shop.app.presentation.dependencies.repositories import get_event_log_analytics_repository
+from shop.app.repositories.protocols import EventLogAnalyticsRepository
+from shop.app.infrastructure.persistence.mongo.count_cache import CountCache
+from shop.app.infrastructure.persistence.mongo.repositories.event_log_mongo_repository import (
     EventLogRepositoryMongo,
 )
 from shop.app.application.interfaces.repositories import UnitOfWork
 from shop.app.services.auth.auth_login_service import AuthLoginService
-from shop.app.services.auth.auth_protection_service import AuthProtectionService
 from shop.app.services.auth.auth_registration_service import AuthRegistrationService
 from shop.app.services.auth.auth_service import AuthService
 from shop.app.services.auth.auth_session_service import AuthSessionService
 from shop.app.services.auth.auth_token_service import AuthTokenService
-from shop.app.services.cache_service import CacheService
 from shop.app.services.cart_service import CartService
 from shop.app.services.category_service import CategoryService
 from shop.app.services.event_log_analytics_service import EventLogAnalyticsService
@@ -50,29 +64,39 @@ from shop.app.services.user_service import UserService
 
 async def get_category_service(
     uow: UnitOfWork = Depends(get_uow),
-    cache: CacheService = Depends(get_cache_service),
+    read_uow_factory: Callable[[], UnitOfWork] = Depends(get_readonly_uow_factory),
+    cache: CacheStorage = Depends(get_cache_storage),
+    read_through: ReadThroughCache = Depends(get_read_through_cache),
     pubsub: PubSubService = Depends(get_pubsub_service),
 ) -> CategoryService:
     return CategoryService(
         uow=uow,
         cache=cache,
+        read_through=read_through,
         pubsub=pubsub,
         cache_ttl_seconds=settings.CATEGORIES_CACHE_TTL_SECONDS or None,
+        read_uow_factory=read_uow_factory,
     )
 
 
 async def get_product_service(
     uow: UnitOfWork = Depends(get_uow),
-    cache: CacheService = Depends(get_cache_service),
+    read_uow_factory: Callable[[], UnitOfWork] = Depends(get_readonly_uow_factory),
+    cache: CacheStorage = Depends(get_cache_storage),
+    read_through: ReadThroughCache = Depends(get_read_through_cache),
     pubsub: PubSubService = Depends(get_pubsub_service),
     storage: FileStoragePort = Depends(get_storage_service),
+    derivatives: ImageDerivativeScheduler | None = Depends(get_image_derivative_scheduler),
 ) -> ProductService:
     return ProductService(
         uow=uow,
         cache=cache,
+        read_through=read_through,
         pubsub=pubsub,
         storage=storage,
         cache_ttl_seconds=settings.PRODUCTS_CACHE_TTL_SECONDS or None,
+        read_uow_factory=read_uow_factory,
+        derivatives=derivatives,
     )
 
 
@@ -85,12 +109,14 @@ async def get_product_image_service(
     storage: FileStoragePort = Depends(get_storage_service),
     file_validator: FileValidatorPort = Depends(get_file_validator),
     filename_generator: ObjectKeyGeneratorPort = Depends(get_filename_generator),
+    derivatives: ImageDerivativeScheduler | None = Depends(get_image_derivative_scheduler),
 ) -> ProductImageService:
     return ProductImageService(
         uow=uow,
         storage=storage,
         file_validator=file_validator,
         filename_generator=filename_generator,
+        derivatives=derivatives,
     )
 
 
@@ -114,19 +140,16 @@ async def get_product_specification_service(
 
 async def get_auth_service(
     uow: UnitOfWork = Depends(get_uow),
-    cache: CacheService = Depends(get_cache_service),
     session_service: SessionService = Depends(get_session_service),
 ) -> AuthService:
     auth_session_service = AuthSessionService(session_service=session_service)
     auth_token_service = AuthTokenService()
-    auth_protection_service = AuthProtectionService(cache=cache)
     return AuthService(
         registration_service=AuthRegistrationService(uow=uow),
         login_service=AuthLoginService(
             uow=uow,
             session_service=auth_session_service,
             token_service=auth_token_service,
-            protection_service=auth_protection_service,
         ),
     )
 
@@ -139,25 +162,39 @@ async def get_cart_service(
 
 async def get_role_service(
     uow: UnitOfWork = Depends(get_uow),
-    cache: CacheService = Depends(get_cache_service),
+    cache: CacheStorage = Depends(get_cache_storage),
+    read_through: ReadThroughCache = Depends(get_read_through_cache),
     pubsub: PubSubService = Depends(get_pubsub_service),
+    uow_factory: Callable[[], UnitOfWork] = Depends(get_uow_factory),
 ) -> RoleService:
     return RoleService(
         uow=uow,
         cache=cache,
+        read_through=read_through,
         pubsub=pubsub,
         cache_ttl_seconds=settings.ROLES_CACHE_TTL_SECONDS or None,
+        uow_factory=uow_factory,
     )
 
 
 async def get_user_service(
     uow: UnitOfWork = Depends(get_uow),
+    cache: CacheStorage = Depends(get_cache_storage),
+    read_through: ReadThroughCache = Depends(get_read_through_cache),
+    pubsub: PubSubService = Depends(get_pubsub_service),
     session_service: SessionService = Depends(get_session_service),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+    uow_factory: Callable[[], UnitOfWork] = Depends(get_uow_factory),
 ) -> UserService:
     return UserService(
         uow=uow,
+        cache=cache,
+        read_through=read_through,
+        pubsub=pubsub,
         session_service=session_service,
+        password_hasher=password_hasher,
         cache_ttl_seconds=settings.USERS_CACHE_TTL_SECONDS or None,
+        uow_factory=uow_factory,
     )
 
 
@@ -181,11 +218,12 @@ async def get_review_service(
 
 async def get_event_log_service(
     db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    count_cache: CountCache | None = Depends(get_event_log_count_cache),
 ) -> EventLogService:
-    return EventLogService(repo=EventLogRepositoryMongo(db=db))
+    return EventLogService(repo=EventLogRepositoryMongo(db=db, count_cache=count_cache))
 
 
 async def get_event_log_analytics_service(
-    db: AsyncIOMotorDatabase = Depends(get_mongo_db),
+    repo: EventLogAnalyticsRepository = Depends(get_event_log_analytics_repository),
 ) -> EventLogAnalyticsService:
-    return EventLogAnalyticsService(repo=EventLogAnalyticsRepositoryMongo(db=db))
+    return EventLogAnalyticsService(repo=repo)
@@ -1,8 +1,12 @@
 from fastapi import Request
 
+from shop.app.core.exceptions import ApplicationUnavailableError
 from shop.app.core.state import get_app_state
 from shop.app.services.session_service import SessionService
 
 
 async def get_session_service(request: Request) -> SessionService:
-    return get_app_state(request).session_service
+    session_service = get_app_state(request).session_service
+    if session_service is None:
+        raise ApplicationUnavailableError("Session service is not configured")
+    return session_service
@@ -0,0 +1,108 @@
+"""
+Benchmark: cache payload formats for a product list page.
+
+Compares the previous format (a Redis list with one JSON string per item,
+Decimal as str) against whole-page blobs from JsonCacheCodec and
+MsgpackCacheCodec: encode/decode time and payload size. With
+``--redis`` it also stores each variant and reports ``MEMORY USAGE``.
+
+    python -m shop.scripts.bench_cache_codec [--redis]
+"""
+
+import asyncio
+import json
+import sys
+import timeit
+from datetime import datetime, timezone
+from decimal import Decimal
+from uuid import uuid4
+
+from shop.app.infrastructure.persistence.redis.codecs import JsonCacheCodec, MsgpackCacheCodec
+
+PAGE_SIZE = 50
+ROUNDS = 2_000
+
+
+def _page() -> list[dict]:
+    return [
+        {
+            "id": uuid4(),
+            "title": f"Product {i}",
+            "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit.",
+            "price": Decimal("1999.90") + i,
+            "stock": 10 + i,
+            "brand": "Acme",
+            "is_published": True,
+            "category_id": uuid4(),
+            "thumbnail_key": f"2025/01/01/{uuid4().hex}.webp",
+            "created_at": datetime.now(timezone.utc),
+        }
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def _legacy_encode(page: list[dict]) -> list[str]:
+    return [json.dumps(item, default=str) for item in page]
+
+
+def _legacy_decode(items: list[str]) -> list[dict]:
+    decoded = []
+    for raw in items:
+        item = json.loads(raw)
+        item["price"] = Decimal(str(item["price"]))
+        decoded.append(item)
+    return decoded
+
+
+def _time(fn) -> float:
+    return min(timeit.repeat(fn, number=ROUNDS, repeat=5)) / ROUNDS * 1e6
+
+
+async def _redis_memory(legacy: list[str], blobs: dict[str, bytes]) -> dict[str, int]:
+    from redis.asyncio import Redis
+
+    from shop.app.core.config import settings
+
+    client = Redis.from_url(settings.REDIS_URL)
+    usage: dict[str, int] = {}
+    try:
+        await client.delete("bench:legacy")
+        await client.rpush("bench:legacy", *legacy)
+        usage["legacy"] = await client.memory_usage("bench:legacy")
+        for name, blob in blobs.items():
+            await client.set(f"bench:{name}", blob)
+            usage[name] = await client.memory_usage(f"bench:{name}")
+    finally:
+        await client.delete("bench:legacy", *(f"bench:{name}" for name in blobs))
+        await client.aclose()
+    return usage
+
+
+def main() -> None:
+    page = _page()
+    codecs = {"json": JsonCacheCodec(), "msgpack": MsgpackCacheCodec()}
+
+    legacy = _legacy_encode(page)
+    blobs = {name: codec.encode(page) for name, codec in codecs.items()}
+
+    print(f"{'format':<10}{'encode us':>12}{'decode us':>12}{'bytes':>10}")
+    print(
+        f"{'legacy':<10}{_time(lambda: _legacy_encode(page)):>12.1f}"
+        f"{_time(lambda: _legacy_decode(legacy)):>12.1f}"
+        f"{sum(len(s.encode()) for s in legacy):>10}"
+    )
+    for name, codec in codecs.items():
+        blob = blobs[name]
+        print(
+            f"{name:<10}{_time(lambda: codec.encode(page)):>12.1f}"
+            f"{_time(lambda: codec.decode(blob)):>12.1f}"
+            f"{len(blob):>10}"
+        )
+
+    if "--redis" in sys.argv:
+        for name, size in asyncio.run(_redis_memory(legacy, blobs)).items():
+            print(f"redis MEMORY USAGE {name}: {size} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Benchmark: latency of an unrelated endpoint while logins are hashing.
+
+Fires ``LOGINS`` concurrent bcrypt verifications (a burst of logins) and,
+at the same time, a probe that calls a trivial handler every
+``PROBE_INTERVAL_SECONDS`` and records how long each call took to complete.
+Runs twice: bcrypt inline in the coroutine (previous behaviour) and through
+``BcryptPasswordHasher``. Inline hashing blocks the loop, so probe latency
+grows to whole bcrypt rounds; with the thread pool it stays near zero while
+login throughput is bounded by the worker count.
+
+    python -m shop.scripts.bench_password_hashing
+"""
+
+import asyncio
+import statistics
+import time
+
+from shop.app.core.config import settings
+from shop.app.infrastructure.services.security.password_hasher import BcryptPasswordHasher
+from shop.app.utils.security import hash_password, verify_password
+
+LOGINS = 32
+PROBE_INTERVAL_SECONDS = 0.005
+PASSWORD = "correct horse battery staple"
+
+
+async def _unrelated_handler() -> dict:
+    # Стоит столько же, сколько лёгкий эндпоинт без I/O: один проход цикла.
+    await asyncio.sleep(0)
+    return {"status": "ok"}
+
+
+async def _probe(stop: asyncio.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await _unrelated_handler()
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(PROBE_INTERVAL_SECONDS)
+
+
+async def _run(name: str, login) -> None:
+    stop = asyncio.Event()
+    latencies: list[float] = []
+    probe = asyncio.create_task(_probe(stop, latencies))
+    await asyncio.sleep(PROBE_INTERVAL_SECONDS * 2)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await probe
+    quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(
+        f"{name:<10}{elapsed:>10.2f}{LOGINS / elapsed:>12.1f}"
+        f"{quantiles[49]:>10.2f}{quantiles[98]:>10.2f}{max(latencies):>10.2f}"
+    )
+
+
+async def main() -> None:
+    hashed = hash_password(PASSWORD)
+    hasher = BcryptPasswordHasher(
+        max_workers=settings.PASSWORD_HASH_WORKERS,
+        max_pending=LOGINS,
+    )
+
+    async def inline_login() -> bool:
+        return verify_password(PASSWORD, hashed)
+
+    async def pooled_login() -> bool:
+        return await hasher.verify(PASSWORD, hashed)
+
+    print(f"{LOGINS} concurrent logins, {settings.PASSWORD_HASH_WORKERS} hash workers")
+    print(
+        f"{'mode':<10}{'total s':>10}{'logins/s':>12}"
+        f"{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}"
+    )
+    try:
+        await _run("inline", inline_login)
+        await _run("executor", pooled_login)
+    finally:
+        hasher.close()
+    print(f"hasher stats: {hasher.stats.as_dict()}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
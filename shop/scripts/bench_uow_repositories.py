@@ -0,0 +1,49 @@
+"""
+Microbenchmark: per-request cost of wiring repositories in SqlUnitOfWork.
+
+Compares eager construction of every repository (the previous
+``_init_repositories``) with lazy construction where a request touches only
+``uow.products``. No database is needed: the connection is a placeholder.
+
+    python -m shop.scripts.bench_uow_repositories
+"""
+
+import timeit
+
+from shop.app.infrastructure.persistence.postgres.repositories.unit_of_work import (
+    _REPOSITORY_NAMES,
+    SqlUnitOfWork,
+)
+
+ROUNDS = 200_000
+
+
+def _new_uow() -> SqlUnitOfWork:
+    uow = SqlUnitOfWork(pool=None)  # type: ignore[arg-type]
+    uow._conn = object()  # type: ignore[assignment]
+    return uow
+
+
+def eager_request() -> None:
+    uow = _new_uow()
+    for name in _REPOSITORY_NAMES:
+        getattr(uow, name)
+    uow.products
+
+
+def lazy_request() -> None:
+    uow = _new_uow()
+    uow._reset_repositories()
+    uow.products
+
+
+def main() -> None:
+    eager = min(timeit.repeat(eager_request, number=ROUNDS, repeat=5)) / ROUNDS
+    lazy = min(timeit.repeat(lazy_request, number=ROUNDS, repeat=5)) / ROUNDS
+    print(f"repositories per UoW: {len(_REPOSITORY_NAMES)}")
+    print(f"eager: {eager * 1e6:.2f} us/request")
+    print(f"lazy:  {lazy * 1e6:.2f} us/request ({eager / lazy:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
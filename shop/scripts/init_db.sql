@@ -3,6 +3,46 @@ CREATE TABLE roles (
     name VARCHAR (50) NOT NULL UNIQUE
 );
 
+CREATE TABLE permissions (
+    id UUID PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE role_permissions (
+    role_id INTEGER NOT NULL REFERENCES roles(id) ON DELETE CASCADE,
+    permission_id UUID NOT NULL REFERENCES permissions(id) ON DELETE CASCADE,
+    PRIMARY KEY (role_id, permission_id)
+);
+
+-- Version of the role -> permission data. Instances keep an in-memory snapshot
+-- and reload it when the version changes; the triggers below bump it in the
+-- same transaction as any change to the three tables.
+CREATE TABLE access_policy_version (
+    id BOOLEAN PRIMARY KEY DEFAULT TRUE CHECK (id),
+    version BIGINT NOT NULL DEFAULT 0
+);
+
+INSERT INTO access_policy_version (id, version) VALUES (TRUE, 0);
+
+CREATE FUNCTION bump_access_policy_version() RETURNS trigger AS $$
+BEGIN
+    UPDATE access_policy_version SET version = version + 1;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER roles_bump_access_policy_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON roles
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_access_policy_version();
+
+CREATE TRIGGER permissions_bump_access_policy_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_access_policy_version();
+
+CREATE TRIGGER role_permissions_bump_access_policy_version
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON role_permissions
+    FOR EACH STATEMENT EXECUTE FUNCTION bump_access_policy_version();
+
 CREATE TABLE users (
     id SERIAL PRIMARY KEY,
     username VARCHAR(30) NOT NULL UNIQUE,
@@ -29,6 +69,7 @@ CREATE TABLE products (
     stock INTEGER NOT NULL,
     brand VARCHAR(50) NOT NULL,
     thumbnail_key VARCHAR(500),
+    thumbnail_derivatives JSONB NOT NULL DEFAULT '[]',
     is_published BOOLEAN DEFAULT True NOT NULL,
     created_at TIMESTAMP DEFAULT NOW(),
     updated_at TIMESTAMP DEFAULT NOW(),
@@ -46,6 +87,7 @@ CREATE TABLE product_specifications (
 CREATE TABLE product_images (
     id SERIAL PRIMARY KEY,
     storage_key VARCHAR(500) NOT NULL,
+    derivatives JSONB NOT NULL DEFAULT '[]',
     product_id INTEGER NOT NULL REFERENCES products(id) ON DELETE CASCADE ,
 
     UNIQUE(product_id, storage_key)
@@ -6,6 +6,9 @@ CREATE INDEX idx_users_role_active ON users(role, is_active);
 CREATE INDEX idx_products_category_published ON products(category_id, is_published);
 CREATE INDEX idx_products_price_stock ON products(price, stock);
 CREATE INDEX idx_products_created_at ON products(created_at);
+CREATE INDEX idx_products_published_id ON products(id) WHERE is_published;
+-- Пайплайн производных изображений находит товар по ключу миниатюры
+CREATE INDEX idx_products_thumbnail_key ON products(thumbnail_key);
 
 -- Индексы для таблицы products_images
 CREATE INDEX idx_products_images_storage_key ON product_images(storage_key);
@@ -13,10 +16,14 @@ CREATE INDEX idx_products_images_storage_key ON product_images(storage_key);
 -- Индексы для таблицы reviews
 CREATE INDEX idx_reviews_product_rating ON reviews(product_id, rating);
 CREATE INDEX idx_reviews_user_created ON reviews(user_id, created_at);
+CREATE INDEX idx_reviews_product_id ON reviews(product_id, id);
 
 -- Индексы для таблицы orders
 CREATE INDEX idx_orders_user_status ON orders(user_id, status);
 CREATE INDEX idx_orders_created_at ON orders(created_at);
+-- Keyset-пагинация по (created_at, id)
+CREATE INDEX idx_orders_created_id ON orders(created_at DESC, id DESC);
+CREATE INDEX idx_orders_user_created_id ON orders(user_id, created_at DESC, id DESC);
 
 -- Индексы для таблицы orders_items
 CREATE INDEX idx_orders_items_order_product ON orders_items(order_id, product_id);
@@ -0,0 +1,84 @@
+"""
+Load test: database loads during cache expiry with stampede protection.
+
+Simulates three app instances (separate read-through caches, each with its
+own local tier) sharing one Redis, and fires concurrent reads of one key
+at two moments: a cold miss and right after the entry went stale. The loader
+stands in for the Postgres query and counts its calls; with protection the
+count per phase stays at ~1 instead of one per request.
+
+Requires Redis from settings (REDIS_HOST/REDIS_PORT):
+
+    python -m shop.scripts.loadtest_cache_stampede
+"""
+
+import asyncio
+import json
+
+from redis.asyncio import Redis
+
+from shop.app.core.config import settings
+from shop.app.infrastructure.persistence.redis.cache import RedisCacheStorage
+from shop.app.infrastructure.persistence.redis.local_cache import LocalCache, TieredCacheStorage
+from shop.app.infrastructure.persistence.redis.read_through import RedisReadThroughCache
+
+INSTANCES = 3
+REQUESTS_PER_INSTANCE = 200
+TTL_SECONDS = 1
+DB_LATENCY_SECONDS = 0.1
+KEY = "loadtest:products:limit:20:offset:0"
+
+
+async def main() -> None:
+    client = Redis.from_url(settings.REDIS_URL, decode_responses=True)
+    db_queries = 0
+
+    async def load_page() -> list[dict]:
+        nonlocal db_queries
+        db_queries += 1
+        await asyncio.sleep(DB_LATENCY_SECONDS)
+        return [{"id": i} for i in range(20)]
+
+    caches = [
+        RedisReadThroughCache(
+            storage=TieredCacheStorage(
+                remote=RedisCacheStorage(client=client),
+                local=LocalCache(max_entries=16, ttl_seconds=0.2),
+            ),
+            client=client,
+            stale_seconds=30,
+            lock_timeout_seconds=2.0,
+        )
+        for _ in range(INSTANCES)
+    ]
+
+    async def burst() -> None:
+        await asyncio.gather(
+            *(
+                cache.get_or_load(
+                    KEY, load_page, encode=json.dumps, decode=json.loads, ttl_seconds=TTL_SECONDS
+                )
+                for cache in caches
+                for _ in range(REQUESTS_PER_INSTANCE)
+            )
+        )
+
+    try:
+        await RedisCacheStorage(client=client).delete_value(KEY)
+        requests = INSTANCES * REQUESTS_PER_INSTANCE
+
+        await burst()
+        print(f"cold miss:   {requests} requests -> {db_queries} DB queries")
+
+        db_queries = 0
+        await asyncio.sleep(TTL_SECONDS + 0.3)
+        await burst()
+        await asyncio.sleep(DB_LATENCY_SECONDS * 3)  # let the background refresh finish
+        print(f"stale entry: {requests} requests -> {db_queries} DB queries")
+    finally:
+        await RedisCacheStorage(client=client).delete_value(KEY)
+        await client.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+import pytest
+
+from shop.app.infrastructure.services.security.access_policy import PermissionSnapshot
+
+ADMIN_ROLE_ID = 1
+MANAGER_ROLE_ID = 2
+USER_ROLE_ID = 3
+
+
+@pytest.fixture
+def snapshot() -> PermissionSnapshot:
+    return PermissionSnapshot.build(
+        version=7,
+        role_permissions={
+            ADMIN_ROLE_ID: [],
+            MANAGER_ROLE_ID: ["orders:read", "orders:write", "products:write"],
+            USER_ROLE_ID: [],
+        },
+        superuser_role_ids=[ADMIN_ROLE_ID],
+    )
+
+
+def test_role_allowed_when_it_has_every_required_permission(snapshot: PermissionSnapshot) -> None:
+    mask = snapshot.compile(["orders:read", "orders:write"])
+
+    assert snapshot.allows(MANAGER_ROLE_ID, mask)
+    assert not snapshot.allows(USER_ROLE_ID, mask)
+
+
+def test_one_missing_permission_denies(snapshot: PermissionSnapshot) -> None:
+    mask = snapshot.compile(["orders:read", "analytics:read"])
+
+    assert not snapshot.allows(MANAGER_ROLE_ID, mask)
+
+
+def test_unknown_permission_and_role(snapshot: PermissionSnapshot) -> None:
+    mask = snapshot.compile(["permissions:nobody_has"])
+
+    assert not snapshot.allows(MANAGER_ROLE_ID, mask)
+    assert not snapshot.allows(404, snapshot.compile(["orders:read"]))
+
+
+def test_superuser_has_every_permission(snapshot: PermissionSnapshot) -> None:
+    assert snapshot.allows(ADMIN_ROLE_ID, snapshot.compile(["orders:write", "permissions:new"]))
+
+
+def test_snapshot_is_read_only(snapshot: PermissionSnapshot) -> None:
+    with pytest.raises(TypeError):
+        snapshot.role_masks[USER_ROLE_ID] = -1  # type: ignore[index]
@@ -0,0 +1,126 @@
+import time
+
+import pytest
+from fakeredis import FakeAsyncRedis
+
+from shop.app.infrastructure.persistence.redis.auth_attempts import RedisAuthAttemptsStorage
+
+USERNAME = "alice"
+MAX_ATTEMPTS = 3
+WINDOW_SECONDS = 300
+BLOCK_SECONDS = 120
+
+
+@pytest.fixture
+def client() -> FakeAsyncRedis:
+    # Скрипт регистрации попытки выполняется через Lua (fakeredis[lua]).
+    return FakeAsyncRedis(decode_responses=True)
+
+
+@pytest.fixture
+def storage(client: FakeAsyncRedis) -> RedisAuthAttemptsStorage:
+    return RedisAuthAttemptsStorage(client)
+
+
+async def register(storage: RedisAuthAttemptsStorage):
+    return await storage.register_failed_attempt(
+        USERNAME,
+        max_attempts=MAX_ATTEMPTS,
+        window_seconds=WINDOW_SECONDS,
+        block_seconds=BLOCK_SECONDS,
+    )
+
+
+@pytest.mark.asyncio
+async def test_attempts_below_limit_are_counted_within_window(
+    storage: RedisAuthAttemptsStorage, client: FakeAsyncRedis
+) -> None:
+    first = await register(storage)
+    second = await register(storage)
+
+    assert (first.attempts, first.blocked) == (1, False)
+    assert (second.attempts, second.blocked) == (2, False)
+    assert await storage.get_failed_attempts(USERNAME) == 2
+    assert 0 < await client.pttl(f"auth:failed_attempts:{USERNAME}") <= WINDOW_SECONDS * 1000
+    assert not await storage.is_blacklisted(USERNAME)
+
+
+@pytest.mark.asyncio
+async def test_attempts_older_than_window_are_not_counted(
+    storage: RedisAuthAttemptsStorage, client: FakeAsyncRedis
+) -> None:
+    now_ms = int(time.time() * 1000)
+    expired_ms = now_ms - WINDOW_SECONDS * 1000 - 1_000
+    await client.zadd(
+        f"auth:failed_attempts:{USERNAME}",
+        {f"{expired_ms}:a": expired_ms, f"{expired_ms}:b": expired_ms},
+    )
+
+    result = await register(storage)
+
+    assert (result.attempts, result.blocked) == (1, False)
+
+
+@pytest.mark.asyncio
+async def test_reaching_limit_installs_block(
+    storage: RedisAuthAttemptsStorage, client: FakeAsyncRedis
+) -> None:
+    for _ in range(MAX_ATTEMPTS - 1):
+        await register(storage)
+
+    result = await register(storage)
+
+    assert result.blocked
+    assert result.attempts == MAX_ATTEMPTS
+    assert result.retry_after_seconds == BLOCK_SECONDS
+    assert await storage.is_blacklisted(USERNAME)
+    assert 0 < await client.pttl(f"auth:blacklist:{USERNAME}") <= BLOCK_SECONDS * 1000
+    # Окно сбрасывается вместе с установкой блокировки.
+    assert await storage.get_failed_attempts(USERNAME) == 0
+
+
+@pytest.mark.asyncio
+async def test_blocked_user_attempts_are_not_counted(storage: RedisAuthAttemptsStorage) -> None:
+    await storage.add_to_blocklist(USERNAME, BLOCK_SECONDS)
+
+    result = await register(storage)
+
+    assert result.blocked
+    assert 0 < result.retry_after_seconds <= BLOCK_SECONDS
+    assert await storage.get_failed_attempts(USERNAME) == 0
+
+
+@pytest.mark.asyncio
+async def test_attempt_state_reports_attempts_and_block(storage: RedisAuthAttemptsStorage) -> None:
+    clean = await storage.get_attempt_state(USERNAME)
+    await register(storage)
+    failed = await register(storage)
+    counted = await storage.get_attempt_state(USERNAME)
+    await register(storage)
+    blocked = await storage.get_attempt_state(USERNAME)
+
+    assert (clean.attempts, clean.blocked, clean.retry_after_seconds) == (0, False, 0)
+    assert (counted.attempts, counted.blocked) == (failed.attempts, False)
+    assert blocked.blocked
+    assert 0 < blocked.retry_after_seconds <= BLOCK_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_reset_clears_attempts(storage: RedisAuthAttemptsStorage) -> None:
+    await register(storage)
+
+    await storage.reset_failed_attempts(USERNAME)
+
+    assert await storage.get_failed_attempts(USERNAME) == 0
+
+
+@pytest.mark.asyncio
+async def test_legacy_counter_key_does_not_break_registration(
+    storage: RedisAuthAttemptsStorage, client: FakeAsyncRedis
+) -> None:
+    # Строковый счётчик под старым префиксом остаётся от прежнего адаптера.
+    await client.set(f"auth:attempts:{USERNAME}", "2")
+
+    result = await register(storage)
+
+    assert (result.attempts, result.blocked) == (1, False)
@@ -0,0 +1,220 @@
+from collections.abc import Mapping
+
+import pytest
+
+from shop.app.application.interfaces.persistence.session_storage import SessionActivityStore
+from shop.app.core.exceptions import StorageUnavailableError
+from shop.app.infrastructure.persistence.redis.session_activity import (
+    SessionActivityTracker,
+    SessionServiceActivityStore,
+)
+
+GRANULARITY_SECONDS = 60.0
+USER_CACHE_TTL_SECONDS = 1.0
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class RecordingStore(SessionActivityStore):
+    def __init__(self) -> None:
+        self.batches: list[dict[str, float]] = []
+
+    async def touch_many(self, last_seen: Mapping[str, float]) -> None:
+        self.batches.append(dict(last_seen))
+
+
+class FailingStore(SessionActivityStore):
+    async def touch_many(self, last_seen: Mapping[str, float]) -> None:
+        raise StorageUnavailableError("Failed to update activity")
+
+
+class UserLoader:
+    def __init__(self, user: object | None) -> None:
+        self.user = user
+        self.calls = 0
+
+    async def __call__(self, session_id: str) -> object | None:
+        self.calls += 1
+        return self.user
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def store() -> RecordingStore:
+    return RecordingStore()
+
+
+def make_tracker(
+    store: SessionActivityStore, clock: FakeClock, *, max_entries: int = 100
+) -> SessionActivityTracker:
+    return SessionActivityTracker(
+        store=store,
+        granularity_seconds=GRANULARITY_SECONDS,
+        flush_interval_seconds=5.0,
+        user_cache_ttl_seconds=USER_CACHE_TTL_SECONDS,
+        user_cache_max_entries=max_entries,
+        clock=clock,
+        wall_clock=clock,
+    )
+
+
+def test_touch_within_granularity_is_coalesced(
+    store: RecordingStore, clock: FakeClock
+) -> None:
+    tracker = make_tracker(store, clock)
+
+    assert tracker.touch("s1")
+    clock.advance(GRANULARITY_SECONDS - 1)
+    assert not tracker.touch("s1")
+    assert tracker.touch("s2")
+
+    assert tracker.stats.touches == 3
+    assert tracker.stats.coalesced == 1
+    assert tracker.stats.pending == 2
+
+
+def test_touch_after_granularity_is_reported_again(
+    store: RecordingStore, clock: FakeClock
+) -> None:
+    tracker = make_tracker(store, clock)
+
+    tracker.touch("s1")
+    clock.advance(GRANULARITY_SECONDS)
+
+    assert tracker.touch("s1")
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_pending_batch_once(store: RecordingStore, clock: FakeClock) -> None:
+    tracker = make_tracker(store, clock)
+    tracker.touch("s1")
+    clock.advance(1)
+    tracker.touch("s2")
+
+    await tracker.flush()
+    await tracker.flush()
+
+    assert store.batches == [{"s1": 1000.0, "s2": 1001.0}]
+    assert tracker.stats.flushes == 1
+    assert tracker.stats.written == 2
+    assert tracker.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_is_dropped_and_counted(clock: FakeClock) -> None:
+    tracker = make_tracker(FailingStore(), clock)
+    tracker.touch("s1")
+
+    await tracker.flush()
+
+    assert tracker.stats.failed == 1
+    assert tracker.stats.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_user_is_cached_until_ttl(store: RecordingStore, clock: FakeClock) -> None:
+    tracker = make_tracker(store, clock)
+    user = object()
+    load = UserLoader(user)
+
+    assert await tracker.get_user("s1", load) is user
+    clock.advance(USER_CACHE_TTL_SECONDS - 0.5)
+    assert await tracker.get_user("s1", load) is user
+    assert load.calls == 1
+
+    clock.advance(0.5)
+    assert await tracker.get_user("s1", load) is user
+    assert load.calls == 2
+    assert tracker.stats.user_cache_hits == 1
+    assert tracker.stats.user_cache_misses == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_user_is_not_cached(store: RecordingStore, clock: FakeClock) -> None:
+    tracker = make_tracker(store, clock)
+    load = UserLoader(None)
+
+    assert await tracker.get_user("s1", load) is None
+    assert await tracker.get_user("s1", load) is None
+    assert load.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_user_cache_evicts_least_recently_used(
+    store: RecordingStore, clock: FakeClock
+) -> None:
+    tracker = make_tracker(store, clock, max_entries=2)
+    load = UserLoader(object())
+
+    await tracker.get_user("s1", load)
+    await tracker.get_user("s2", load)
+    await tracker.get_user("s1", load)
+    await tracker.get_user("s3", load)
+    assert load.calls == 3
+
+    await tracker.get_user("s1", load)
+    assert load.calls == 3
+    await tracker.get_user("s2", load)
+    assert load.calls == 4
+
+
+@pytest.mark.asyncio
+async def test_forget_drops_cached_user_and_pending_activity(
+    store: RecordingStore, clock: FakeClock
+) -> None:
+    tracker = make_tracker(store, clock)
+    load = UserLoader(object())
+    await tracker.get_user("s1", load)
+    tracker.touch("s1")
+
+    tracker.forget("s1")
+
+    await tracker.get_user("s1", load)
+    assert load.calls == 2
+    await tracker.flush()
+    assert store.batches == []
+    # Отметка о последнем отчёте тоже сброшена: следующий touch не подавляется.
+    assert tracker.touch("s1")
+
+
+@pytest.mark.asyncio
+async def test_service_store_updates_every_session() -> None:
+    updated: list[str] = []
+
+    async def update_activity(session_id: str) -> None:
+        updated.append(session_id)
+
+    store = SessionServiceActivityStore(update_activity, max_concurrency=2)
+
+    await store.touch_many({"s1": 1.0, "s2": 2.0, "s3": 3.0})
+
+    assert sorted(updated) == ["s1", "s2", "s3"]
+
+
+@pytest.mark.asyncio
+async def test_service_store_reports_partial_failure() -> None:
+    updated: list[str] = []
+
+    async def update_activity(session_id: str) -> None:
+        if session_id == "s2":
+            raise ConnectionError("redis is down")
+        updated.append(session_id)
+
+    store = SessionServiceActivityStore(update_activity, max_concurrency=2)
+
+    with pytest.raises(StorageUnavailableError, match="1 of 3 sessions"):
+        await store.touch_many({"s1": 1.0, "s2": 2.0, "s3": 3.0})
+    assert sorted(updated) == ["s1", "s3"]
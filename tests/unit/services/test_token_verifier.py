@@ -0,0 +1,143 @@
+from typing import Any
+
+import pytest
+
+from shop.app.infrastructure.services.security import token_verifier
+from shop.app.infrastructure.services.security.token_verifier import (
+    ACCESS_TOKEN_SCOPE,
+    AccessTokenVerifier,
+)
+
+NOW = 1_700_000_000.0
+TTL_SECONDS = 900
+
+
+class FakeClock:
+    def __init__(self, now: float = NOW) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeDecoder:
+    """Stands in for ``decode_token``: token -> payload, counting decodes."""
+
+    def __init__(self) -> None:
+        self.payloads: dict[str, dict[str, Any]] = {}
+        self.calls = 0
+
+    def issue(self, token: str, **payload: Any) -> str:
+        self.payloads[token] = payload
+        return token
+
+    def __call__(self, token: str) -> dict[str, Any]:
+        self.calls += 1
+        return dict(self.payloads[token])
+
+
+@pytest.fixture
+def decoder(monkeypatch: pytest.MonkeyPatch) -> FakeDecoder:
+    fake = FakeDecoder()
+    monkeypatch.setattr(token_verifier, "decode_token", fake)
+    return fake
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def access_token(decoder: FakeDecoder, name: str, exp: float = NOW + TTL_SECONDS) -> str:
+    return decoder.issue(name, sub="42", sid=f"session-{name}", scope=ACCESS_TOKEN_SCOPE, exp=exp)
+
+
+def test_cached_until_exp(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    token = access_token(decoder, "a")
+
+    first = verifier.verify(token)
+    clock.now = NOW + TTL_SECONDS - 1
+    second = verifier.verify(token)
+
+    assert second is first
+    assert first.subject == "42"
+    assert first.session_id == "session-a"
+    assert decoder.calls == 1
+    assert verifier.stats.hits == 1
+    assert verifier.stats.misses == 1
+
+
+def test_decoded_again_after_exp(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    token = access_token(decoder, "a")
+    verifier.verify(token)
+
+    clock.now = NOW + TTL_SECONDS
+    verifier.verify(token)
+
+    assert decoder.calls == 2
+    assert verifier.stats.expired == 1
+    assert verifier.stats.hits == 0
+
+
+def test_decode_error_after_exp_propagates(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    token = access_token(decoder, "a")
+    verifier.verify(token)
+
+    del decoder.payloads[token]
+    clock.now = NOW + TTL_SECONDS
+
+    with pytest.raises(KeyError):
+        verifier.verify(token)
+    assert verifier.stats.size == 0
+
+
+def test_refresh_token_is_not_cached(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    token = decoder.issue("r", sub="42", scope="refresh_token", exp=NOW + TTL_SECONDS)
+
+    assert verifier.verify(token).scope == "refresh_token"
+    verifier.verify(token)
+
+    assert decoder.calls == 2
+    assert verifier.stats.size == 0
+
+
+def test_token_without_exp_is_not_cached(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    token = decoder.issue("n", sub="42", sid="s", scope=ACCESS_TOKEN_SCOPE)
+
+    assert verifier.verify(token).expires_at is None
+    verifier.verify(token)
+
+    assert decoder.calls == 2
+    assert verifier.stats.size == 0
+
+
+def test_least_recently_used_entry_is_evicted(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=2, clock=clock)
+    a, b, c = (access_token(decoder, name) for name in "abc")
+
+    verifier.verify(a)
+    verifier.verify(b)
+    verifier.verify(a)
+    verifier.verify(c)
+
+    assert verifier.stats.evicted == 1
+    assert verifier.stats.size == 2
+    calls = decoder.calls
+    verifier.verify(a)
+    verifier.verify(c)
+    assert decoder.calls == calls
+    verifier.verify(b)
+    assert decoder.calls == calls + 1
+
+
+def test_cached_payload_is_read_only(decoder: FakeDecoder, clock: FakeClock) -> None:
+    verifier = AccessTokenVerifier(max_entries=10, clock=clock)
+    claims = verifier.verify(access_token(decoder, "a"))
+
+    with pytest.raises(TypeError):
+        claims.payload["sub"] = "1"  # type: ignore[index]
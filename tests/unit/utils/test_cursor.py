@@ -0,0 +1,105 @@
+from datetime import UTC, datetime
+from decimal import Decimal
+from uuid import UUID
+
+import pytest
+
+from shop.app.application.dto.pagination import PageCursor, next_page_cursor, prev_page_cursor
+from shop.app.core.exceptions import DomainValidationError
+from shop.app.infrastructure.persistence.postgres.repositories.keyset import (
+    keyset_clause,
+    restore_order,
+)
+from shop.app.utils.cursor import decode_cursor, encode_cursor
+
+CREATED_AT = datetime(2026, 10, 18, 12, 30, tzinfo=UTC)
+ROW_ID = UUID("01890a5d-ac96-774b-bcce-b302099a8057")
+LISTING = "orders:created_at,id"
+
+
+@pytest.mark.parametrize("backward", [False, True])
+def test_round_trip(backward: bool) -> None:
+    cursor = PageCursor(values=(CREATED_AT, ROW_ID, Decimal("19.90"), 7, None), backward=backward)
+
+    assert decode_cursor(encode_cursor(cursor, LISTING), LISTING) == cursor
+
+
+def test_tampered_payload_is_rejected() -> None:
+    payload, signature = encode_cursor(PageCursor(values=(42,)), LISTING).split(".")
+    # Подменяем id в полезной нагрузке, подпись оставляем прежней.
+    forged = encode_cursor(PageCursor(values=(43,)), LISTING).split(".")[0]
+    assert forged != payload
+
+    with pytest.raises(DomainValidationError):
+        decode_cursor(f"{forged}.{signature}", LISTING)
+
+
+@pytest.mark.parametrize(
+    "mangle",
+    [
+        lambda token: token[:-4],
+        lambda token: token.split(".")[0],
+        lambda token: token.replace(".", ""),
+        lambda token: "",
+        lambda token: "not-base64!.@@",
+    ],
+)
+def test_truncated_or_malformed_token_is_rejected(mangle) -> None:
+    token = encode_cursor(PageCursor(values=(CREATED_AT, ROW_ID)), LISTING)
+
+    with pytest.raises(DomainValidationError):
+        decode_cursor(mangle(token), LISTING)
+
+
+def test_cursor_of_other_listing_is_rejected() -> None:
+    token = encode_cursor(PageCursor(values=(CREATED_AT, ROW_ID)), LISTING)
+
+    with pytest.raises(DomainValidationError):
+        decode_cursor(token, "products:id")
+
+
+def test_page_cursor_directions() -> None:
+    items = [(3, "c"), (2, "b"), (1, "a")]
+
+    next_cursor = next_page_cursor(items, lambda item: (item[0],))
+    prev_cursor = prev_page_cursor(items, lambda item: (item[0],))
+
+    assert next_cursor == PageCursor(values=(1,), backward=False)
+    assert prev_cursor == PageCursor(values=(3,), backward=True)
+    assert next_page_cursor([], lambda item: (item,)) is None
+    assert prev_page_cursor([], lambda item: (item,)) is None
+
+
+def test_keyset_clause_forward_descending() -> None:
+    cursor = PageCursor(values=(CREATED_AT, ROW_ID))
+
+    predicate, order_by, params = keyset_clause(
+        ("o.created_at", "o.id"), cursor, descending=True, first_param=2
+    )
+
+    assert predicate == "(o.created_at, o.id) < ($2, $3)"
+    assert order_by == "o.created_at DESC, o.id DESC"
+    assert params == [CREATED_AT, ROW_ID]
+
+
+def test_keyset_clause_backward_inverts_order() -> None:
+    cursor = PageCursor(values=(10,), backward=True)
+
+    predicate, order_by, params = keyset_clause(("r.id",), cursor, descending=False, first_param=2)
+
+    assert predicate == "(r.id) < ($2)"
+    assert order_by == "r.id DESC"
+    assert params == [10]
+
+
+def test_keyset_clause_rejects_cursor_of_other_sort_key() -> None:
+    with pytest.raises(DomainValidationError):
+        keyset_clause(("r.id",), PageCursor(values=(1, 2)), descending=False, first_param=1)
+
+
+def test_restore_order() -> None:
+    rows = [3, 2, 1]
+
+    assert restore_order(rows, PageCursor(values=(4,), backward=True)) == [1, 2, 3]
+    assert restore_order(rows, PageCursor(values=(4,))) == rows
+    assert restore_order(rows, None) == rows
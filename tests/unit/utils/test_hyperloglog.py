@@ -0,0 +1,60 @@
+import math
+
+import pytest
+
+from shop.app.utils.hyperloglog import HyperLogLog
+
+PRECISION = 12
+# Относительная стандартная ошибка HLL; проверяем с запасом в 4 сигмы.
+STD_ERROR = 1.04 / math.sqrt(1 << PRECISION)
+
+
+@pytest.mark.parametrize("cardinality", [1_000, 10_000, 100_000])
+def test_estimate_within_error_bound(cardinality: int) -> None:
+    sketch = HyperLogLog(PRECISION)
+    sketch.update(range(cardinality))
+
+    assert abs(sketch.count() - cardinality) <= 4 * STD_ERROR * cardinality
+
+
+def test_small_cardinality_is_near_exact() -> None:
+    sketch = HyperLogLog(PRECISION)
+    sketch.update([1, 2, 3, 2, 1, 42])
+
+    assert sketch.count() == 4
+
+
+def test_duplicates_do_not_change_estimate() -> None:
+    sketch = HyperLogLog(PRECISION)
+    sketch.update(range(5_000))
+    before = sketch.count()
+    sketch.update(range(5_000))
+
+    assert sketch.count() == before
+
+
+def test_merge_equals_sketch_of_union() -> None:
+    left, right, union = (HyperLogLog(PRECISION) for _ in range(3))
+    left.update(range(0, 30_000))
+    right.update(range(20_000, 50_000))
+    union.update(range(0, 50_000))
+
+    left.merge(right)
+
+    assert left.to_bytes() == union.to_bytes()
+    assert abs(left.count() - 50_000) <= 4 * STD_ERROR * 50_000
+
+
+def test_bytes_round_trip() -> None:
+    sketch = HyperLogLog(PRECISION)
+    sketch.update(range(777))
+
+    restored = HyperLogLog.from_bytes(sketch.to_bytes())
+
+    assert restored.precision == PRECISION
+    assert restored.count() == sketch.count()
+
+
+def test_merge_rejects_different_precision() -> None:
+    with pytest.raises(ValueError):
+        HyperLogLog(10).merge(HyperLogLog(12))